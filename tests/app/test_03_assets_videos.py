@@ -1,14 +1,14 @@
 import pathlib
 import pytest
-import subprocess
 
 
 @pytest.mark.smoke
 @pytest.mark.normal
 @pytest.mark.stress
-def test_directory_contains_exact_files_from_config(app_base_path, config):
+@pytest.mark.resources(output="assets", npu_cores=(0, 1, 2)) # asset 다운로드 중에는 NPU 테스트(모델 사용)와 겹치지 않도록
+def test_directory_contains_exact_files_from_config(app_base_path, config, app_assets):
     """
-    dx_app/assets 폴더에 정확히 지정된 video 파일들만 있는지 확인, 없으면 다운로드 script 실행 후 재확인
+    dx_app/assets 폴더에 정확히 지정된 video 파일들만 있는지 확인, 없으면 asset cache 에서 복구 (cache 에도 없으면 다운로드)
     - Pass: 목록에 있는 video 파일들이 모두 존재하는 경우
     - Fail: 목록에 있는 video 파일이 없거나 목록 외의 파일이 존재하는 경우
     """
@@ -23,24 +23,11 @@ def test_directory_contains_exact_files_from_config(app_base_path, config):
     if not APP_PATH.is_dir():
         pytest.fail(f"테스트 대상 폴더 '{APP_PATH}'가 존재하지 않습니다.")
 
-    # 2. 폴더 안의 실제 파일 목록을 집합(set)으로 가져옵니다.
-    actual_files = {f.name for f in APP_PATH.glob('*') if f.is_file()}
+    # 2. 누락/변경된 파일은 app_assets fixture 가 cache 에서 복구 (cache 에도 없으면 setup.sh 실행)
+    assert not app_assets['file_video'].missing, f"asset 을 준비하지 못했습니다: {app_assets['file_video'].missing}"
 
-    # 3. 누락된 파일이 있으면 다운로드 스크립트 실행
-    missing = EXPECTED_FILES - actual_files
-    if missing:
-        print(f"누락된 파일 발견: {missing}, 다운로드 스크립트를 실행합니다...")
-        result = subprocess.run(
-            ["bash", "setup.sh", "--force"],  # 다운로드 스크립트 경로
-            cwd=BASE_PATH,
-            capture_output=True,
-            text=True
-        )
-        print("다운로드 STDOUT:", result.stdout)
-        print("다운로드 STDERR:", result.stderr)
-        result.check_returncode()
-        # 스크립트 실행 후 다시 확인
-        actual_files = {f.name for f in APP_PATH.glob('*') if f.is_file()}
+    # 3. 폴더 안의 실제 파일 목록을 집합(set)으로 가져옵니다.
+    actual_files = {f.name for f in APP_PATH.glob('*') if f.is_file()}
 
     # 4. YAML에서 로드한 기대 파일 목록과 실제 파일 목록이 정확히 일치하는지 검증합니다.
     assert actual_files == EXPECTED_FILES, (
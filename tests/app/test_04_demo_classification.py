@@ -58,6 +58,7 @@ def test_classification_from_config(app_base_path, config):
 @pytest.mark.smoke
 @pytest.mark.normal
 @pytest.mark.stress
+@pytest.mark.resources(npu_cores=(0, 1, 2))
 def test_classification_async_from_config(app_base_path, config):
     """
     classificaiton_async 을 실행하고 결과를 검증 (Input: image)
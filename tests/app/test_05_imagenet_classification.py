@@ -1,17 +1,12 @@
-import subprocess
 import pytest
-import shlex # 쉘 명령어를 안전하게 분리하기 위한 모듈
-import os
-import pathlib
-import time
-import signal
+
 
 @pytest.mark.parametrize("timeout_sec", [
     pytest.param(5, marks=pytest.mark.smoke),
     pytest.param(10, marks=pytest.mark.normal),
     pytest.param(60, marks=pytest.mark.stress),
 ])
-def test_imagenet_classification_from_config(app_base_path, timeout_sec, config):
+def test_imagenet_classification_from_config(app_base_path, timeout_sec, config, process_monitor):
     """
     imagenet_classification 을 정해진 시간만큼 실행하고 종료
     - Pass: 정해진 시간동안 에러없이 inference 수행
@@ -25,64 +20,7 @@ def test_imagenet_classification_from_config(app_base_path, timeout_sec, config)
     if not command_str:
         pytest.fail("config 파일에 'command' 키가 없습니다.")
 
-    command_parts = shlex.split(command_str)
-
-    process = None
-    try:
-        # 1. Popen으로 백그라운드에서 프로세스 시작
-        print(f"\n프로세스 실행: {' '.join(command_parts)}")
-        process = subprocess.Popen(
-                command_parts,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                cwd=app_base_path,
-                text=True  # ensures output is in string format, not bytes
-                )
-        # 2. config 파일에 지정된 시간(초)만큼 대기
-        print(f"{timeout_sec}초 동안 대기합니다...")
-        time.sleep(timeout_sec)
-
-        print("프로세스 상태 확인...")
-        assert process.poll() is None, f"프로세스가 {timeout_sec}초 이내에 비정상 종료되었습니다."
-
-        # 3. 대기 시간이 끝난 후, 프로세스에 종료 신호(SIGINT) 전송
-        print(f"시간 초과. 프로세스(PID: {process.pid})에 종료 신호를 보냅니다.")
-        process.send_signal(signal.SIGINT) # Ctrl+C와 동일한 신호
-
-        # 4. Check the app is running without errors
-        stdout, stderr = process.communicate()
-        print("STDOUT:\n", stdout)
-        print("STDERR:\n", stderr)
-
-        combined_output = stdout + stderr
-        error_indicators = [
-            "can't open camera"
-            "Error:",
-            "File not found exception",
-            "can't open/read file",
-            "dxrt-exception",
-            "could not be opened"
-        ]
-        for err in error_indicators:
-            if err in combined_output:
-                pytest.fail(f"실행 중 오류 발생: '{err}'")
-
-        # 5. 프로세스가 실제로 종료될 때까지 최대 10초 대기
-        process.wait(timeout=10)
-        print("프로세스가 정상적으로 종료되었습니다.")
-
-    except FileNotFoundError:
-        pytest.fail(f"실행 파일을 찾을 수 없습니다: '{command_parts[0]}'. 경로를 확인해주세요.")
-
-    except subprocess.TimeoutExpired:
-        # wait(10) 시간 동안 종료되지 않은 경우
-        print("프로세스가 종료 신호에 반응하지 않아 강제 종료합니다.")
-        process.kill() # 강제 종료
-        pytest.fail("프로세스가 정상적으로 종료되지 않았습니다.")
-
-    except Exception as e:
-        # 기타 예외 처리
-        if process:
-            process.kill()
-        pytest.fail(f"테스트 실행 중 예기치 않은 오류 발생: {e}")
-
+    # 지정된 시간 동안 실행하면서 오류 문자열 / 조기 종료를 실시간으로 감시합니다.
+    # - 문제가 생기면 남은 시간을 기다리지 않고 바로 실패 처리
+    # - 시간이 끝나면 종료 신호(SIGINT)를 보내고 정상 종료되는지 확인
+    process_monitor(command_str, cwd=app_base_path, duration=timeout_sec)
@@ -32,6 +32,7 @@ def get_test_ids(test_cases):
     load_config(),              # 인자에 주입될 데이터 (테스트 케이스 리스트)
     ids=get_test_ids(load_config()) # 각 테스트를 구별할 ID
 )
+@pytest.mark.resources(output="result.jpg")
 def test_yolo_aging_from_config(app_base_path, test_case, repeat_cnt):
     """
     yolo 어플리케이션을 파일에 정의된 model 을 사용해서 수행 후 결과 검증 (Input: image)
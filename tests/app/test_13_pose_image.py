@@ -7,6 +7,7 @@ import pathlib
 @pytest.mark.smoke
 @pytest.mark.normal
 @pytest.mark.stress
+@pytest.mark.resources(output="result.jpg")
 def test_pose_from_config(app_base_path, config):
     """
     pose 어플리케이션을 image input 으로 실행하고 결과를 검증
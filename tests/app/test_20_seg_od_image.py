@@ -7,6 +7,7 @@ import pathlib
 @pytest.mark.smoke
 @pytest.mark.normal
 @pytest.mark.stress
+@pytest.mark.resources(output="result.jpg")
 def test_seg_od_from_config(app_base_path, config):
     """
     segmentation & object detection 을 지정된 image input 으로  실행하고 결과를 검증
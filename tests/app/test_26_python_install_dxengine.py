@@ -7,6 +7,7 @@ from pathlib import Path
 @pytest.mark.smoke
 @pytest.mark.normal
 @pytest.mark.stress
+@pytest.mark.resources(output="venv-dx-runtime")
 def test_run_imagenet_from_config(app_base_path, config):
     """
     파일에 정의된 설치 경로에 따라 dx-engine install 잘 되는지 검증
@@ -7,6 +7,7 @@ import pathlib
 @pytest.mark.smoke
 @pytest.mark.normal
 @pytest.mark.stress
+@pytest.mark.resources(reads=["venv-dx-runtime"])
 def test_run_imagenet_from_config(app_base_path, config):
     """
     imageNet_example.py 실행하고 결과를 검증
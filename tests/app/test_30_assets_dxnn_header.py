@@ -0,0 +1,48 @@
+import pathlib
+import time
+import pytest
+from utils.dxnn import read_header, DxnnFormatError
+
+
+def _version_tuple(version):
+    """'v1.18.1' -> (1, 18, 1)"""
+    return tuple(int(v) for v in version.lstrip("v").split("."))
+
+
+# utils/dxnn.py 의 구조가 실제 dxnn 파일로 확인되기 전까지는 기본 실행 (-m normal) 에서 제외 (pytest -m benchmark 로 실행)
+@pytest.mark.benchmark
+@pytest.mark.resources(reads=["assets"])
+def test_dxnn_header_preflight(app_base_path, config, app_assets):
+    """
+    file_model 의 모든 dxnn 파일 header 를 parse_model 실행 없이 직접 읽어 빠르게 사전 검사
+    - Pass: 모든 파일이 DXNN 형식이고 format/compiler 버전이 최소 요구 버전 이상
+    - Fail: 형식 오류, compiler 버전을 찾지 못함, 최소 버전 미만
+    """
+    cfg = config('app')['file_model']
+    min_versions = config('rt')['MINIMUM_VERSIONS']
+    min_format = int(min_versions['DXNN_FORMAT'].lstrip("v"))
+    min_compiler = _version_tuple(min_versions['COMPILER'])
+    model_dir = pathlib.Path(app_base_path) / cfg['directory']
+
+    errors = []
+    start = time.perf_counter()
+    for name in cfg['expected_files']:
+        try:
+            header = read_header(model_dir / name)
+        except (DxnnFormatError, OSError) as e:
+            errors.append(f"{name}: {e}")
+            continue
+
+        print(f"{name}: format {header.format_version_str}, compiler {header.compiler_version}, "
+              f"inputs {[t.name for t in header.inputs]}, outputs {[t.name for t in header.outputs]}, "
+              f"NPU memory {header.npu_memory_bytes}")
+        if header.format_version < min_format:
+            errors.append(f"{name}: format {header.format_version_str} < {min_versions['DXNN_FORMAT']}")
+        if header.compiler_version is None:
+            errors.append(f"{name}: header 에서 compiler 버전을 찾지 못했습니다.")
+        elif _version_tuple(header.compiler_version) < min_compiler:
+            errors.append(f"{name}: compiler {header.compiler_version} < {min_versions['COMPILER']}")
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    print(f"{len(cfg['expected_files'])} 개 dxnn header 검사: {elapsed_ms:.1f} ms")
+    assert not errors, "dxnn header 검사 실패:\n" + "\n".join(errors)
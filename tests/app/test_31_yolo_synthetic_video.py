@@ -0,0 +1,53 @@
+import re
+import pathlib
+import statistics
+import pytest
+import yaml
+from utils.synthetic_video import VideoSpec
+
+# '[DXAPP] [INFO] fps : 30.1'
+RE_APP_FPS = re.compile(r"fps\s*:\s*([\d.]+)", re.I)
+
+
+def load_video_params():
+    """parametrize 를 위해 synthetic_video 의 (resolution, codec) 조합을 로드하는 함수"""
+    cfg = yaml.safe_load(pathlib.Path("configs/cfg_app.yaml").read_text(encoding="utf-8"))['synthetic_video']
+    return [
+        pytest.param(resolution, codec, id=f"{resolution}-{codec}")
+        for resolution in cfg['resolutions']
+        for codec in cfg['codecs']
+    ]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("resolution, codec", load_video_params())
+@pytest.mark.resources(npu_cores=(0, 1, 2))
+def test_yolo_synthetic_video_fps(resolution, codec, app_base_path, config, synthetic_video, process_monitor,
+                                  result_store):
+    """
+    합성 video (해상도/codec 별) 를 입력으로 yolo 를 실행하여 decode 포함 처리량(FPS) 측정
+    - Pass: 에러 없이 실행되고 FPS 출력이 있음, 결과는 results/<session>/synthetic_video_fps.csv 에 저장
+    - Fail: video 생성 실패, 실행 중 에러, FPS 출력 없음
+    """
+    cfg = config('app')['synthetic_video']
+    spec = VideoSpec.from_resolution(resolution, fps=cfg['fps'], duration_sec=cfg['duration_sec'],
+                                     codec=codec, bitrate_kbps=cfg.get('bitrate_kbps'))
+    try:
+        video = synthetic_video(spec)
+    except RuntimeError as e:
+        pytest.skip(f"{resolution}/{codec} video 를 생성할 수 없습니다: {e}")
+
+    result = process_monitor(cfg['command'].format(video=video), cwd=app_base_path, duration=cfg['run_sec'])
+    fps = [float(v) for v in RE_APP_FPS.findall(result.output)]
+    assert fps, f"FPS 출력을 찾을 수 없습니다.\n{result.output}"
+
+    row = {
+        "resolution": resolution,
+        "codec": codec,
+        "bitrate_kbps": spec.bitrate_kbps,
+        "fps_median": round(statistics.median(fps), 2),
+        "fps_max": max(fps),
+        "time_to_first_frame": result.time_to_first_frame,
+    }
+    result_store.append("synthetic_video_fps", row)
+    print(row)
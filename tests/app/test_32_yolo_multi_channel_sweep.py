@@ -0,0 +1,50 @@
+import pytest
+from utils.synthetic_video import VideoSpec
+from utils.yolo_multi import make_config, write_config, parse_multi_fps, find_knee
+
+
+@pytest.mark.benchmark
+@pytest.mark.timeout(60*60)
+@pytest.mark.resources(npu_cores=(0, 1, 2))
+def test_yolo_multi_channel_sweep(app_base_path, config, process_monitor, result_store, synthetic_video,
+                                  stream_server):
+    """
+    yolo_multi 를 channel 수 (1, 4, 8, 16, 36, 64) 별로 실행하여 전체/channel 별 FPS 와 knee 측정
+    - knee: 가장 느린 channel 의 FPS 가 source fps 아래로 떨어지기 시작하는 channel 수 (camera 배치 규모 산정 기준)
+    - Pass: 모든 channel 수에서 에러 없이 실행되고 FPS 출력이 있음, 결과는 results/<session>/yolo_multi_sweep.csv
+    - Fail: 실행 중 에러 또는 FPS 출력 없음
+    """
+    cfg = config('app')['yolo_multi_sweep']
+    videos = cfg['videos']
+    if cfg.get('synthetic_resolution'):
+        spec = VideoSpec.from_resolution(cfg['synthetic_resolution'], fps=cfg['source_fps'], duration_sec=60)
+        videos = [str(synthetic_video(spec))]
+    fixed = cfg.get('fixed_sources') or []
+    if any(source[1] == "rtsp" for source in fixed):
+        stream_server({"/video_feed": "auto"})
+
+    results = []
+    for channels in cfg['channels']:
+        multi_cfg = make_config(channels, videos=videos, model_path=cfg['model_path'], model_name=cfg['model_name'],
+                                fixed=fixed, source_fps=cfg['source_fps'])
+        write_config(multi_cfg, f"{app_base_path}/{cfg['config_path']}")
+
+        run = process_monitor(f"bin/yolo_multi -c {cfg['config_path']}", cwd=app_base_path, duration=cfg['run_sec'])
+        fps = parse_multi_fps(run.output, channels)
+        assert fps.total is not None, \
+            (f"{channels} channel: FPS 출력을 찾을 수 없습니다. utils/yolo_multi.py 의 RE_CHANNEL_FPS / RE_TOTAL_FPS 는 "
+             f"실제 출력으로 확인되지 않은 형식이므로 아래 출력에 맞춰 수정이 필요할 수 있습니다.\n{run.output}")
+
+        row = fps.to_row()
+        result_store.append("yolo_multi_sweep", row)
+        print(row)
+        results.append(fps)
+
+    sustained, knee = find_knee(results, cfg['source_fps'], cfg['knee_tolerance'])
+    print(f"source {cfg['source_fps']} fps 유지 최대 channel 수: {sustained}, knee: {knee}")
+    result_store.append("yolo_multi_knee", {
+        "model": cfg['model_name'],
+        "source_fps": cfg['source_fps'],
+        "sustained_channels": sustained,
+        "knee_channels": knee,
+    })
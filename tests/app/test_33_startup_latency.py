@@ -0,0 +1,65 @@
+import pathlib
+import pytest
+import yaml
+from utils.startup import (RESULT_PATTERN, CACHE_MODES, StartupResult, StartupTrial, model_files, drop_page_cache,
+                           warm_page_cache)
+
+
+def load_startup_commands():
+    """parametrize 를 위해 startup 을 측정할 (name, command) 목록을 cfg_app.yaml 에서 로드하는 함수"""
+    cfg_app = yaml.safe_load(pathlib.Path("configs/cfg_app.yaml").read_text(encoding="utf-8"))
+    cfg = cfg_app['startup_benchmark']
+    commands = []
+    for section in cfg['sections']:
+        value = cfg_app[section]
+        entries = value if isinstance(value, list) else [value]
+        for entry in entries:
+            name = f"{section}-{entry['name']}" if 'name' in entry else section
+            command = f"{entry['venv_python']} {entry['command']}" if 'venv_python' in entry else entry['command']
+            commands.append((name, command))
+    commands += [(c['name'], c['command']) for c in cfg.get('commands', [])]
+    return [
+        pytest.param(name, command, cache, id=f"{name}-{cache}")
+        for name, command in commands
+        for cache in CACHE_MODES
+    ]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("name, command, cache", load_startup_commands())
+@pytest.mark.resources(npu_cores=(0, 1, 2))
+def test_startup_latency(name, command, cache, app_base_path, config, process_monitor, result_store):
+    """
+    process 생성부터 첫 출력 / 첫 결과 (FPS, 결과 출력 또는 one-shot app 의 정상 종료) 까지의 시간을
+    warm / cold (model 파일을 page cache 에서 내림) page cache 상태에서 trials 번 측정 (median)
+    - pipeline 재시작 시 사용자에게 보이는 중단 시간, 결과는 results/<session>/startup_latency.csv
+    - Pass: 모든 실행에서 에러 없이 첫 결과가 나옴
+    - Fail: 실행 중 에러, 비정상 종료, timeout_sec 안에 결과가 나오지 않음
+    """
+    cfg = config('app')['startup_benchmark']
+    models = model_files(command, cwd=app_base_path)
+    assert models, f"command 에서 model 파일을 찾을 수 없습니다: {command}"
+
+    result = StartupResult(name, command, cache, sum(p.stat().st_size for p in models))
+    for _ in range(cfg['trials']):
+        if cache == "cold":
+            drop_page_cache(models)
+        else:
+            warm_page_cache(models)
+
+        run = process_monitor(command, cwd=app_base_path, duration=cfg['timeout_sec'], check=False,
+                              first_frame=RESULT_PATTERN, stop_on_first_frame=True)
+        first_result = run.time_to_first_frame
+        if first_result is None and run.early_exit and run.returncode == 0:
+            first_result = run.elapsed
+        failure = ""
+        if run.hit_token or (run.early_exit and run.returncode != 0):
+            failure = run.failure
+        elif first_result is None:
+            failure = f"{cfg['timeout_sec']}초 안에 결과가 나오지 않았습니다. rc={run.returncode}"
+        result.trials.append(StartupTrial(run.time_to_first_output, first_result, failure))
+
+    row = result.to_row()
+    result_store.append("startup_latency", row)
+    print(row)
+    assert not result.failures, "\n".join(result.failures)
@@ -0,0 +1,47 @@
+import pathlib
+import pytest
+from utils.run_model import parse_run_model_output
+from utils.parse_model import parse_model_graph
+from utils.model_zoo import ZooEntry, write_leaderboard
+
+
+@pytest.mark.timeout(60*60*2)
+@pytest.mark.benchmark
+@pytest.mark.resources(npu_cores=(0, 1, 2), reads=["assets"])
+def test_model_zoo_benchmark(app_base_path, config, run_cmd, app_assets, result_store):
+    """
+    assets/models 의 모든 .dxnn 에 대해 run_model (default / single mode) 과 parse_model 을 실행하여
+    FPS, latency, NPU time, NPU memory 를 하나의 leaderboard 로 정리
+    - 주어진 throughput 에 맞는 model 선택용, 결과는 results/<session>/model_zoo.json, .csv, .html
+    - Pass: 모든 model / mode 에서 FPS, latency, NPU time 이 출력됨
+    - Fail: model 이 없거나 run_model 실패, FPS / latency / NPU time 결과 누락
+    """
+    cfg = config('app')['model_zoo']
+    models = sorted((pathlib.Path(app_base_path) / cfg['directory']).glob("*.dxnn"))
+    assert models, f"{cfg['directory']} 에 .dxnn 파일이 없습니다."
+
+    entries, errors = [], []
+    for model in models:
+        try:
+            graph = parse_model_graph(run_cmd(f"parse_model -m {model}", echo=False))
+        except pytest.fail.Exception as e:
+            graph = None
+            errors.append(f"{model.name}: parse_model 실패\n{e}")
+
+        for mode, options in cfg['modes'].items():
+            try:
+                output = run_cmd(f"run_model -m {model} {options}", echo=False)
+            except pytest.fail.Exception as e:
+                errors.append(f"{model.name} ({mode}): run_model 실패\n{e}")
+                continue
+            run = parse_run_model_output(output, options=options, model=model.stem)
+            empty = [name for name in ("fps", "latency_ms", "npu_time_ms") if getattr(run, name) is None]
+            if empty:
+                errors.append(f"{model.name} ({mode}): {', '.join(empty)} 결과를 찾을 수 없습니다. (-v 옵션 확인)")
+            entry = ZooEntry.from_results(model.stem, mode, run, graph, model.stat().st_size)
+            print(entry.to_row())
+            entries.append(entry)
+
+    paths = write_leaderboard(entries, result_store.path)
+    print("leaderboard:", ", ".join(str(p) for p in paths))
+    assert not errors, "\n".join(errors)
@@ -4,17 +4,23 @@ import os
 import shutil
 import re
 from pathlib import Path
+from utils.dx_com import compiler_version, compile_model, history_store
+from utils.compile_cache import cached_compile
 
 
 @pytest.mark.timeout(60*30) # 30 min timeout for this test
 @pytest.mark.smoke
 @pytest.mark.normal
 @pytest.mark.stress
-def test_com_basic_command(com_base_path, config, run_cmd):
+def test_com_basic_command(com_base_path, config, result_store, compile_cache):
     """
     dx_com 의 기본 명령어로 compile 이 잘 동작하는지 확인
     - Pass: 정상적으로 dxnn 파일 생성됨
     - Fail: 동작이 되지 않음
+    - 결과: compile 별 wall/user/sys 시간, peak RSS, dxnn 크기를
+            results/<session>/dx_com_compile.csv 와 results/dx_com_history/compile-<version>.csv 에 저장
+    - ONNX/JSON/dx_com 버전이 그대로면 compile 대신 cache 의 dxnn 을 사용 (--no-compile-cache 로 끌 수 있음)
+      단, compile 시간을 검사하는 ResNet50 은 항상 실제로 compile 합니다.
     """
     # YAML 파일에서 설정 정보를 불러옵니다.
     cfg = config('com')['basic_cmd']
@@ -29,13 +35,35 @@ def test_com_basic_command(com_base_path, config, run_cmd):
             out_path.unlink()
             print(f"Deleted old file: {out_path}")
 
+    version = compiler_version(com_base_path)
+    history = history_store()
+
     for cmd, outfile in zip(cmd_list, out_list):
         # ResNet50 의 경우 compile time 이 정해진 시간안에 되는지 확인
+        timeout = None
         if Path(outfile).name == 'ResNet50-1.dxnn':
             print(f"{Path(outfile).name} compile 이 {timeout_sec} sec 안에 완료되는지 확인")
-            run_cmd(cmd, cwd=f"{com_base_path}/dx_com", timeout=timeout_sec)
-        else:
-            run_cmd(cmd, cwd=f"{com_base_path}/dx_com")
+            timeout = timeout_sec
+
+        def _compile():
+            print(f"### Command: {cmd}")
+            result, run = compile_model(cmd, cwd=f"{com_base_path}/dx_com", dxnn_path=outfile,
+                                        version=version, timeout=timeout)
+            print(result)
+            result_store.append("dx_com_compile", result)
+            history.append(f"compile-{version}", result)
+
+            if run.timed_out:
+                pytest.fail(f"Command timed out after {timeout}s: {cmd}")
+            assert run.returncode == 0, f"Command execution failed for '{cmd}'\n{run.output[-4000:]}"
+            return True
+
+        # 시간을 재는 compile (timeout 지정) 은 항상 실제로 실행하고, 결과는 test_com_parse_model 을 위해 cache 에 저장
+        if compile_cache is None:
+            _compile()
+        elif cached_compile(compile_cache, cmd, cwd=f"{com_base_path}/dx_com", version=version, compile_fn=_compile,
+                            refresh=timeout is not None):
+            print(f"compile cache hit: {cmd}")
 
         # 파일 생성 확인
         out_path = Path(f"{com_base_path}/dx_com") / outfile
@@ -48,7 +76,7 @@ def test_com_basic_command(com_base_path, config, run_cmd):
         print(f"Moved {out_path} → {dest_dir/out_path.name}")
 
 
-"""
+'''
 @pytest.mark.timeout(60*30) # 30 min timeout for this test
 @pytest.mark.smoke
 @pytest.mark.normal
@@ -117,14 +145,14 @@ def test_com_basic_shrink_command(com_base_path, config, run_cmd):
 
     if errors:
         pytest.fail("\n".join(errors))
-"""
+'''
 
 
 @pytest.mark.timeout(60*10) # 10 min timeout for this test
 @pytest.mark.smoke
 @pytest.mark.normal
 @pytest.mark.stress
-def test_com_basic_genlog_command(com_base_path, config, run_cmd):
+def test_com_basic_genlog_command(com_base_path, config, run_cmd, compile_cache):
     """
     dx_com 의 기본 명령어로 compile 이 --gen_log 로 잘 동작하고 main_log.bin 파일이 잘 생성됐는지 확인
     - Pass: 정상적으로 dxnn 파일이 생성되며, main_log.bin 이 잘 생성됨
@@ -143,7 +171,17 @@ def test_com_basic_genlog_command(com_base_path, config, run_cmd):
     if log_path.exists(): log_path.unlink()
 
     cmd_str = f"{cmd} --gen_log"
-    run_cmd(cmd_str, cwd=f"{com_base_path}/dx_com")
+
+    def _compile():
+        # run_cmd 는 실패하면 test 를 fail 시킵니다. 출력 파일이 모두 생성되어야 cache 에 저장
+        run_cmd(cmd_str, cwd=f"{com_base_path}/dx_com")
+        return out_path.exists() and log_path.exists()
+
+    if compile_cache is None:
+        _compile()
+    elif cached_compile(compile_cache, cmd_str, cwd=f"{com_base_path}/dx_com", version=compiler_version(com_base_path),
+                        compile_fn=_compile):
+        print(f"compile cache hit: {cmd_str}")
 
     # 파일 생성 확인
     assert out_path.exists(), f"Output file not found: {out_path}"
@@ -161,7 +199,7 @@ def test_com_basic_genlog_command(com_base_path, config, run_cmd):
 @pytest.mark.smoke
 @pytest.mark.normal
 @pytest.mark.stress
-def test_com_parse_model(com_base_path, config, run_cmd):
+def test_com_parse_model(com_base_path, config, run_cmd, compile_cache):
     """
     dx_com 으로 compile 한 dxnn 모델들이 parse_model 로 열어서 디바이스 정보가 잘 나오는지 확인
     - Pass: dxnn Format version / Compiler version 이 맞게 출력
@@ -173,8 +211,16 @@ def test_com_parse_model(com_base_path, config, run_cmd):
     dxnn_fmt_ver = cfg.get('dxnn_format_version')
     dxnn_com_ver = cfg.get('compiler_version')
 
-    for out in out_list:
+    cmd_list = [ cfg.get('cmd1'), cfg.get('cmd2'), cfg.get('cmd3') ]
+    version = compiler_version(com_base_path)
+
+    for cmd, out in zip(cmd_list, out_list):
         out_path = Path("output/compile") / Path(out).name
+        # test_com_basic_command 가 실행되지 않은 경우 compile cache 에서 복구
+        if not out_path.exists() and compile_cache is not None:
+            key = compile_cache.key(cmd, f"{com_base_path}/dx_com", version)
+            if key is not None and compile_cache.restore(key, out_path.parent):
+                print(f"compile cache 에서 복구: {out_path}")
         assert out_path.exists(), f"DXNN file not found: {out_path}"
 
         cmd = f"parse_model -m {out_path}"
@@ -0,0 +1,44 @@
+import pytest
+from pathlib import Path
+from utils.dx_com import compiler_version, history_store
+from utils.compile_farm import CompileFarm, history_stats, make_job
+
+
+@pytest.mark.timeout(60*60) # 60 min timeout for this test
+@pytest.mark.benchmark
+def test_com_compile_farm(com_base_path, config, result_store):
+    """
+    여러 model 을 memory 기반 admission control 로 동시에 compile 하고 serial 대비 speedup 을 측정
+    - Pass: 모든 job 이 정상적으로 dxnn 파일을 생성
+    - Fail: compile 실패 또는 dxnn 파일 누락
+    - 결과: results/<session>/compile_farm.csv (wall, serial, speedup, 최대 동시 실행 수)
+    """
+    cfg = config('com')['compile_farm']
+    version = compiler_version(com_base_path)
+    history = history_store()
+    cwd = f"{com_base_path}/dx_com"
+
+    jobs = [make_job(cmd, cfg['output_dir']) for cmd in cfg['commands']]
+    for job in jobs:
+        out_path = Path(cwd) / job.dxnn_path
+        if out_path.exists():
+            out_path.unlink()
+
+    farm = CompileFarm(
+        max_workers=cfg['max_workers'],
+        headroom=cfg['memory_headroom'],
+        default_rss_mb=cfg['default_peak_rss_mb'],
+        history=history_stats(history.read(f"compile-{version}")),
+    )
+    print(f"memory budget: {farm.budget_mb:.0f} MB")
+    report = farm.run(jobs, cwd=cwd, version=version)
+
+    for job, result, run in zip(jobs, report.results, report.runs):
+        print(f"{job.model}: projected {job.projected_rss_mb:.0f} MB, {result}")
+        result_store.append("dx_com_compile", result)
+        history.append(f"compile-{version}", result)
+        assert run.returncode == 0, f"Command execution failed for '{job.command}'\n{run.output[-4000:]}"
+        assert (Path(cwd) / job.dxnn_path).exists(), f"Output file not found: {job.dxnn_path}"
+
+    print(report.to_row())
+    result_store.append("compile_farm", report)
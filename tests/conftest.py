@@ -4,15 +4,31 @@ import yaml
 import pathlib
 import shlex
 import subprocess
+import sys
+import allure
 from pytest_html import extras
 from datetime import datetime
 from py.xml import html
+from utils.result_store import ResultStore, session_id
+from utils.resource_lock import ResourceLock, resource_names
+from utils.process_monitor import supervise
+from utils.dxtop import DxtopSampler, write_series
+from utils.telemetry import open_backend, write_readings
+from utils.asset_cache import AssetCache
+from utils.compile_cache import CompileCache
+from utils.synthetic_video import VideoCache
+from utils.rtsp_server import wait_until_ready
+from utils.proc_profiler import ProcessProfiler
+from utils.leak import LeakWatch
 
 
 def pytest_configure(config):
     """
     pytest 실행 시 --html 옵션이 있으면 동적으로 리포트 파일 이름을 설정합니다.
     """
+    # xdist worker 들이 같은 결과 폴더를 쓰도록 worker 생성 전에 session ID 를 정합니다.
+    session_id()
+
     # --html 옵션이 지정되지 않았다면 아무것도 하지 않습니다.
     if not config.option.htmlpath:
         return
@@ -49,6 +65,34 @@ def pytest_addoption(parser):
             default=None
         )
 
+    parser.addoption(
+        "--update-baseline",
+        action="store_true",
+        default=False,
+        help="성능 regression 검사 대신 측정값으로 baseline 파일을 생성/갱신합니다."
+    )
+
+    parser.addoption(
+        "--profile-interval",
+        type=float,
+        default=0.5,
+        help="test 가 실행한 하위 process 들의 /proc sampling 주기 (초), 0 이면 profiling 하지 않습니다."
+    )
+
+    parser.addoption(
+        "--soak-sec",
+        type=int,
+        default=0,
+        help="leak_check 를 사용하는 app test 들을 지정한 시간(초) 동안 실행하고 soak 기준으로 leak 을 검사합니다."
+    )
+
+    parser.addoption(
+        "--no-compile-cache",
+        action="store_true",
+        default=False,
+        help="dx_com compile 결과 cache 를 사용하지 않고 항상 새로 compile 합니다."
+    )
+
 
 @pytest.fixture(scope="session")
 def app_base_path(request):
@@ -130,8 +174,139 @@ def all_suite_path(request):
     return path
 
 
-# @pytest.hookimpl(hookwrapper=True) 데코레이터를 추가하고 함수 내용을 수정합니다.
+@pytest.fixture(scope="session")
+def app_assets(app_base_path, config):
+    """
+    cfg_app.yaml 의 file_model / file_video 파일들을 asset cache 로 준비하고 {group: SyncResult} 를 반환합니다.
+    - manifest(SHA-256) 와 같은 파일은 그대로 사용, 없으면 cache 에서 hard-link
+    - 내용이 다른 파일은 새 SDK 등으로 바뀐 것으로 보고 새 내용으로 cache / manifest 갱신
+    - manifest 에 없는 파일이 이미 있으면 그대로 cache 에 저장 (처음 실행 / cache 가 지워진 runner)
+    - 존재하지 않고 cache 에도 없는 파일이 있을 때만 setup.sh --force 로 다운로드 후 cache 에 저장
+    사용법: app_assets["file_model"].paths["YoloV7.dxnn"]
+    """
+    cfg_app = config('app')
+    cfg = cfg_app['asset_cache']
+    cache = AssetCache(cfg['root'], remote=cfg.get('remote'))
+    base_path = pathlib.Path(app_base_path)
+
+    def _sync():
+        return {
+            group: cache.sync(group, base_path / cfg_app[group]['directory'], cfg_app[group]['expected_files'])
+            for group in cfg['groups']
+        }
+
+    # xdist worker 들이 동시에 다운로드/hard-link 하지 않도록 lock
+    with ResourceLock([("asset-cache", True)]):
+        results = _sync()
+        missing = [name for result in results.values() for name in result.missing]
+        if missing:
+            print(f"없는 파일 발견: {missing}, 다운로드 스크립트를 실행합니다...")
+            result = subprocess.run(["bash", "setup.sh", "--force"], cwd=base_path, capture_output=True, text=True)
+            print("다운로드 STDOUT:", result.stdout)
+            print("다운로드 STDERR:", result.stderr)
+            if result.returncode != 0:
+                pytest.fail(f"setup.sh 실행 실패 (rc={result.returncode})")
+            for group in cfg['groups']:
+                cache.ingest(group, base_path / cfg_app[group]['directory'], cfg_app[group]['expected_files'])
+            results = _sync()
+
+    for group, result in results.items():
+        print(f"{group}: verified {len(result.verified)}, linked {len(result.linked)}, "
+              f"ingested {len(result.ingested)}, updated {len(result.updated)}, missing {len(result.missing)}")
+    return results
+
+
+@pytest.fixture(scope="session")
+def synthetic_video(config):
+    """
+    VideoSpec 의 합성 video 를 (없으면 생성하여) cache 경로로 반환하는 함수
+    사용법: path = synthetic_video(VideoSpec.from_resolution("1080p", codec="h265"))
+    """
+    cache = VideoCache(config('app')['synthetic_video']['root'])
+
+    def _get(spec):
+        # xdist worker 들이 같은 video 를 동시에 생성하지 않도록 lock
+        with ResourceLock([("synthetic-video", True)]):
+            return cache.get(spec)
+
+    return _get
+
+
+@pytest.fixture
+def stream_server():
+    """
+    utils/rtsp_server.py (MJPEG stream server) 를 실행하는 함수를 반환합니다. test 가 끝나면 종료합니다.
+    사용법: stream_server({"/video_feed": "auto", "/ch1": "synthetic:1280x720@30"}, port=5000)
+    - source: camera:<index>, file:<path>, synthetic:<w>x<h>[@fps], auto (camera 가 없으면 synthetic)
+    """
+    processes = []
+
+    def _start(streams, port=5000):
+        command = [sys.executable, "-m", "utils.rtsp_server", "--port", str(port)]
+        for path, source in streams.items():
+            command += ["--stream", f"{path}={source}"]
+        process = subprocess.Popen(command)
+        processes.append(process)
+        if not wait_until_ready("127.0.0.1", port):
+            pytest.fail(f"stream server 가 시작되지 않았습니다: {' '.join(command)}")
+        print(f"stream server (PID: {process.pid}): {list(streams)}")
+        return process
+
+    yield _start
+
+    for process in processes:
+        print(f"stream server 프로세스 (PID: {process.pid})를 종료합니다.")
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def _item_resources(item):
+    """test 에 지정된 resources marker 를 (lock 이름, exclusive 여부) list 로 변환합니다."""
+    marker = item.get_closest_marker("resources")
+    return resource_names(**(marker.kwargs if marker else {}))
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    xdist 로 병렬 실행할 때, 같은 자원(camera, port, 출력 파일, NPU core)을 독점하는 테스트들이
+    한 번에 몰려서 분배되지 않도록 자원 그룹별로 번갈아 가며 정렬합니다.
+    - 모든 worker 가 같은 순서로 정렬해야 하므로 정렬 기준은 결정적(deterministic)이어야 합니다.
+    --soak-sec 를 지정하면 leak_check 를 사용하는 test 의 timeout 을 soak 시간에 맞게 늘립니다.
+    """
+    soak_sec = config.getoption("soak_sec")
+    if soak_sec:
+        for item in items:
+            if "leak_check" in item.fixturenames:
+                item.add_marker(pytest.mark.timeout(soak_sec + 600))
+
+    if not hasattr(config, "workerinput"):
+        return
+
+    groups = {}
+    for item in items:
+        key = tuple(name for name, exclusive in _item_resources(item) if exclusive)
+        groups.setdefault(key, []).append(item)
+
+    ordered = []
+    while any(groups.values()):
+        for group in groups.values():
+            if group:
+                ordered.append(group.pop(0))
+    items[:] = ordered
+
+
 @pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """
+    test 의 setup ~ teardown 동안 resources marker 에 지정된 자원의 lock 을 잡습니다.
+    - 충돌하지 않는 테스트들은 xdist worker 에서 동시에 실행됩니다. (예: pytest -n 3 tests/app)
+    """
+    with ResourceLock(_item_resources(item)):
+        yield
+
 
 # @pytest.hookimpl(hookwrapper=True) 데코레이터를 추가하고 함수 내용을 수정합니다.
 @pytest.hookimpl(hookwrapper=True)
@@ -153,6 +328,14 @@ def pytest_runtest_makereport(item, call):
     # report 객체에 description 속성을 추가합니다.
     report.description = description
 
+    # proc_profiler 가 teardown 에서 남긴 process 별 요약을 html report 에 첨부합니다.
+    profile = getattr(item, "proc_profile", None)
+    if report.when == "teardown" and profile:
+        report.extras = getattr(report, "extras", []) + [
+            extras.text(profile["summary"], name="process profile"),
+            extras.text(profile["series"], name="process profile (csv)"),
+        ]
+
 
 def pytest_html_results_table_header(cells):
     """
@@ -249,3 +432,170 @@ def run_cmd():
             pytest.fail(f"Command timed out after {timeout}s: {' '.join(command)}\n{e}")
 
     return _run_command
+
+
+@pytest.fixture(scope="session")
+def result_store():
+    """
+    측정 결과(FPS, latency 등)를 session 별로 저장하는 ResultStore 를 반환합니다.
+    사용법: result_store.append("run_model", record)
+    """
+    return ResultStore("results")
+
+
+def _file_name(nodeid):
+    """test nodeid 를 파일 이름으로 쓸 수 있게 변환합니다."""
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in nodeid)
+
+
+@pytest.fixture
+def process_monitor(request, result_store, proc_profiler):
+    """
+    프로세스를 실행하고 stdout/stderr 를 실시간으로 감시하는 함수를 반환합니다.
+    - 오류 문자열 출력, 조기 종료 시 duration 을 기다리지 않고 바로 실패 처리합니다.
+    - time-to-first-frame 은 results/<session>/app_runs.csv 에 저장됩니다.
+    - 출력은 최근 일부만 메모리에 두고, 전체 log 는 results/<session>/logs/<test>.log.gz 에 저장됩니다.
+    - 실행한 command 의 process tree 는 proc_profiler 에 따로 기록됩니다. (leak_check 에서 사용)
+    사용법:
+        result = process_monitor("bin/yolo -m ... -v ...", cwd=app_base_path, duration=10)
+    """
+    log_name = _file_name(request.node.nodeid)
+
+    def _run(cmd_str, *, cwd=None, duration=10, check=True, **kwargs):
+        command = shlex.split(cmd_str)
+        log_path = result_store.path / "logs" / f"{log_name}.log.gz"
+        print(f"\n프로세스 실행: {' '.join(command)} ({duration}초), log: {log_path}")
+        try:
+            if proc_profiler is not None:
+                kwargs.setdefault("on_start", proc_profiler.watch)
+            result = supervise(command, cwd=cwd, duration=duration, log_path=log_path, **kwargs)
+        except FileNotFoundError:
+            pytest.fail(f"실행 파일을 찾을 수 없습니다: '{command[0]}'. 경로를 확인해주세요.")
+
+        print(f"rc={result.returncode}, elapsed={result.elapsed:.2f}s, "
+              f"first output={result.time_to_first_output}, first frame={result.time_to_first_frame}")
+        result_store.append("app_runs", {
+            "test": request.node.nodeid,
+            "command": cmd_str,
+            "duration": duration,
+            "elapsed": round(result.elapsed, 3),
+            "time_to_first_output": result.time_to_first_output,
+            "time_to_first_frame": result.time_to_first_frame,
+            "returncode": result.returncode,
+            "failure": result.failure or "",
+            "log": str(log_path),
+        })
+
+        if check and result.failure:
+            print("OUTPUT (tail):\n", result.output)
+            pytest.fail(result.failure)
+        return result
+
+    return _run
+
+
+# proc_profiler 로 하위 process 를 측정하는 (장비를 사용하는) test 디렉토리, tests/utils 의 offline test 는 제외
+PROFILED_SUITES = ("app", "com", "rt", "st")
+
+
+@pytest.fixture(autouse=True)
+def proc_profiler(request, result_store):
+    """
+    test 동안 pytest process 의 모든 하위 process (bin/yolo, run_model, dx_com, python example 등) 의
+    RSS/PSS/CPU%/thread/fd/context switch/I/O 를 background thread 에서 sampling 합니다. (--profile-interval)
+    - PROFILED_SUITES 의 test 만 측정하고, 그 외 test 에는 None 을 반환합니다.
+    - 시간별 합계: results/<session>/profiles/<test>.csv
+    - process 별 요약: results/<session>/proc_profile.csv, html/allure report 에 첨부
+    """
+    interval = request.config.getoption("profile_interval")
+    if not interval or interval <= 0 or request.node.path.parent.name not in PROFILED_SUITES:
+        yield None
+        return
+
+    profiler = ProcessProfiler(interval=interval).start()
+    yield profiler
+    profiler.stop()
+    if not profiler.active:
+        return
+
+    name = _file_name(request.node.nodeid)
+    path = profiler.write_series(result_store.path / "profiles" / f"{name}.csv")
+    for row in profiler.summary_rows():
+        result_store.append("proc_profile", {"test": request.node.nodeid, **row})
+
+    summary = profiler.summary_text()
+    request.node.proc_profile = {"summary": summary, "series": path.read_text(encoding="utf-8")}
+    allure.attach(summary, name="process profile", attachment_type=allure.attachment_type.TEXT)
+    allure.attach.file(str(path), name="process profile (csv)", attachment_type=allure.attachment_type.CSV)
+
+
+@pytest.fixture
+def leak_check(request, proc_profiler, config):
+    """
+    app 의 RSS/fd/thread 증가 추세를 검사하는 LeakWatch 를 반환합니다. (proc_profiler 의 sample 사용)
+    사용법:
+        run = process_monitor(cmd, cwd=app_base_path, duration=leak_check.duration(timeout_sec))
+        leak_check.assert_no_leak(run)
+    - --soak-sec 를 지정하면 duration() 이 soak 시간을 반환하고 soak 기준(limit)으로 검사합니다.
+    """
+    return LeakWatch(proc_profiler, config('app')['leak_check'], request.config.getoption("soak_sec"))
+
+
+@pytest.fixture
+def dxtop_sampler(request, result_store):
+    """
+    test 동안 dxtop 을 background 로 실행하며 NPU core 별 Util/Temp/Voltage/Clock 을 수집합니다.
+    - 수집한 time series 는 results/<session>/telemetry/<test>.csv 에 저장됩니다.
+    사용법:
+        t0 = time.time()
+        ... (측정할 동작 실행)
+        samples = dxtop_sampler.since(t0)
+    """
+    try:
+        sampler = DxtopSampler().start()
+    except FileNotFoundError:
+        pytest.fail("실행 파일을 찾을 수 없습니다: 'dxtop'. 경로를 확인해주세요.")
+
+    yield sampler
+
+    sampler.stop()
+    path = write_series(sampler.samples, result_store.path / "telemetry" / f"{_file_name(request.node.nodeid)}.csv")
+    print(f"\ndxtop telemetry: {len(sampler.samples)} samples, {path}")
+
+
+@pytest.fixture
+def telemetry(request, config, result_store):
+    """
+    cfg_rt.yaml 의 telemetry 설정(dxrt-cli / file)에 따라 NPU voltage/clock/temperature 를 test 동안
+    background 로 (hz 주기) 수집하는 telemetry backend 를 반환합니다.
+    - 수집한 time series 는 results/<session>/telemetry/<test>_npu.csv 에 저장됩니다.
+    사용법:
+        t0 = time.time()
+        ... (측정할 동작 실행)
+        readings = telemetry.since(t0)
+    """
+    cfg = config('rt')['telemetry']
+    try:
+        backend = open_backend(cfg, executable=config('rt')['EXECUTABLE']).start(cfg.get('hz', 100))
+    except FileNotFoundError as e:
+        pytest.fail(f"telemetry backend 를 열 수 없습니다: {e}")
+
+    yield backend
+
+    backend.stop()
+    backend.close()
+    path = write_readings(backend.readings,
+                          result_store.path / "telemetry" / f"{_file_name(request.node.nodeid)}_npu.csv")
+    print(f"\nNPU telemetry: {len(backend.readings)} readings, {path}")
+
+
+@pytest.fixture(scope="session")
+def compile_cache(request, config):
+    """
+    dx_com compile 결과 cache (cfg_com.yaml 의 compile_cache), --no-compile-cache 이면 None
+    사용법: cached_compile(compile_cache, cmd, cwd=..., version=..., compile_fn=...)
+    """
+    if request.config.getoption("no_compile_cache"):
+        return None
+    cfg = config('com')['compile_cache']
+    return CompileCache(cfg['root'], max_bytes=int(cfg['max_size_gb'] * 2**30))
@@ -1,10 +1,8 @@
 import pytest
-import subprocess
 import re
-import shlex
 import time
 import os
-import pathlib
+from utils.telemetry import DxrtCliBackend
 
 
 # --- 헬퍼 함수들 ---
@@ -19,14 +17,11 @@ def _get_dxrt_device_count():
         pytest.fail(f"An unexpected error occurred while counting /dev/dxrt* devices: {e}")
     return 0
 
-def _validate_monitor_block(block_text, expected_npu_count_per_block):
-    """모니터링 출력의 한 블록 내용을 검증하는 헬퍼 함수"""
-    npu_pattern = re.compile(r"NPU (\d+): voltage (\d+) mV, clock (\d+) MHz, temperature (\d+)'C")
-    npu_matches = npu_pattern.findall(block_text)
-
-    assert len(npu_matches) == expected_npu_count_per_block, \
-        f"NPU info count mismatch in monitor block. Expected {expected_npu_count_per_block}, got {len(npu_matches)}."
-    assert "dvfs" in block_text, "DVFS info is missing."
+def _validate_monitor_block(block, expected_npu_count_per_block):
+    """모니터링 출력의 한 블록(MonitorBlock) 내용을 검증하는 헬퍼 함수"""
+    assert len(block.readings) == expected_npu_count_per_block, \
+        f"NPU info count mismatch in monitor block. Expected {expected_npu_count_per_block}, got {len(block.readings)}."
+    assert block.dvfs, "DVFS info is missing."
 
 def _get_current_fw_version(config, run_cmd):
     """-s 명령을 실행하여 현재 펌웨어 버전을 추출합니다."""
@@ -108,40 +103,22 @@ def test_monitor_options(arg, config):
     dxrt_device_count = _get_dxrt_device_count()
     expected_npu_count_for_monitor = dxrt_device_count * 3
 
-    command = [config('rt')['EXECUTABLE'], arg, '1']
-    print(f"### Command: {command}")
-    process = subprocess.Popen(
-        command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, encoding='utf-8'
-    )
-    try:
-        blocks_verified = 0
+    print(f"### Command: {config('rt')['EXECUTABLE']} {arg} 1")
+    with DxrtCliBackend(config('rt')['EXECUTABLE'], interval=1, flag=arg) as backend:
         blocks_to_check = 3
-        current_block = ""
-        start_time = time.time()
         timeout = 10
+        deadline = time.time() + timeout
 
-        header = process.stdout.readline()
-        assert config('rt')['CURRENT_VERSIONS']['DX_RT'] in header
-
-        for line in process.stdout:
-            if time.time() - start_time > timeout:
+        for _ in range(blocks_to_check):
+            try:
+                block = backend.read_block(timeout=max(deadline - time.time(), 0))
+            except TimeoutError:
                 pytest.fail("Test timed out after 10 seconds.")
+            except EOFError as e:
+                pytest.fail(f"Did not receive the expected number of blocks. {e}")
+            _validate_monitor_block(block, expected_npu_count_for_monitor)
 
-            if "===" in line:
-                _validate_monitor_block(current_block, expected_npu_count_for_monitor)
-                blocks_verified += 1
-                current_block = ""
-                if blocks_verified >= blocks_to_check:
-                    break
-            else:
-                current_block += line
-        assert blocks_verified >= blocks_to_check, "Did not receive the expected number of blocks."
-    finally:
-        process.terminate()
-        try:
-            process.wait(timeout=2)
-        except subprocess.TimeoutExpired:
-            process.kill()
+        assert config('rt')['CURRENT_VERSIONS']['DX_RT'] in backend.header
 
 
 @pytest.mark.smoke
@@ -1,29 +1,86 @@
+import pathlib
 import pytest
+import yaml
+from utils.dxnn import read_header, crosscheck
+from utils.parse_model import parse_model_graph, diff_graph
+
+
+def load_file_models():
+    """parametrize 를 위해 file_model 의 dxnn 경로 (app_base_path 기준) 를 로드하는 함수"""
+    cfg = yaml.safe_load(pathlib.Path("configs/cfg_app.yaml").read_text(encoding="utf-8"))['file_model']
+    return [f"{cfg['directory']}/{name}" for name in cfg['expected_files']]
 
 
 @pytest.mark.smoke
 @pytest.mark.normal
 @pytest.mark.stress
-def test_parse_model(config, run_cmd, all_suite_path):
+def test_parse_model(config, run_cmd, all_suite_path, result_store):
     """
-    parse_model -m 정상 동작하는지 확인하는 테스트
-    - Pass: Test 결과가 모두 OK
-    - Fail: 원하는 결과가 나오지 않을 경우
+    parse_model -m 출력을 task graph 로 변환하여 expected_output (baseline) 과 구조적으로 비교하는 테스트
+    - Pass: model 입출력, task/edge, tensor dtype/shape/layout/transpose, byte 수가 모두 baseline 과 같음
+    - Fail: 출력 파싱 실패 또는 baseline 과 다른 항목이 있음
     """
     cfg = config('rt')['parse_model']
     model_path = f"{all_suite_path}/{cfg.get('model_path')}"
     expected_output = cfg.get('expected_output')
 
     # 설정 파일에 필요한 키가 있는지 확인합니다.
-    if not model_path or not expected_output:
+    if not cfg.get('model_path') or not expected_output:
         pytest.fail("config 파일에 'model_path' 또는 'expected_output' 키가 없습니다.")
 
     cmd_str = f"parse_model -m {model_path}"
     output_text = run_cmd(cmd_str)
-
     print(output_text)
-    # 각 핵심 라인이 전체 출력(output)에 포함되어 있는지 확인
-    for expected_line in expected_output:
-        # 각 라인의 앞뒤 공백을 제거하고 비교하여 안정성을 높입니다.
-        assert expected_line.strip() in output_text.replace(" ", ""), \
-            f"기대 결과('{expected_line}')가 출력에 없습니다.\n전체 출력:\n{output}"
+
+    graph = parse_model_graph(output_text)
+    assert graph.tasks, f"parse_model 출력에서 task 를 찾을 수 없습니다.\n전체 출력:\n{output_text}"
+    result_store.append("parse_model", {"model": pathlib.Path(model_path).stem, **graph.to_row()})
+
+    diffs = diff_graph(parse_model_graph(expected_output), graph)
+    assert not diffs, "parse_model 결과가 expected_output 과 다릅니다:\n" + "\n".join(diffs)
+
+
+@pytest.mark.normal
+@pytest.mark.stress
+@pytest.mark.parametrize("model", load_file_models())
+@pytest.mark.resources(reads=["assets"])
+def test_parse_model_memory(model, app_base_path, run_cmd, result_store, app_assets):
+    """
+    file_model 의 모든 dxnn 에 대해 NPU memory 사용량과 host 전송 byte 를 기록 (한 card 에 올릴 수 있는 model 수 추적)
+    - Pass: task graph 파싱 성공, NPU task 의 input/output byte 가 tensor dtype/shape 로 계산한 값과 같음
+    - Fail: 파싱 실패 또는 byte 수 불일치
+    """
+    output_text = run_cmd(f"parse_model -m {app_base_path}/{model}")
+    graph = parse_model_graph(output_text)
+    assert graph.tasks, f"parse_model 출력에서 task 를 찾을 수 없습니다.\n전체 출력:\n{output_text}"
+
+    row = {"model": pathlib.Path(model).stem, **graph.to_row()}
+    result_store.append("parse_model", row)
+    print(row)
+
+    errors = []
+    for task in graph.tasks:
+        for kind, total in (("inputs", task.input_bytes), ("outputs", task.output_bytes)):
+            sizes = [t.nbytes for t in getattr(task, kind)]
+            if total is not None and None not in sizes and sizes and sum(sizes) != total:
+                errors.append(f"{task.name} {kind}: tensor 합계 {sum(sizes):,} != {total:,}")
+    assert not errors, "\n".join(errors)
+
+
+# utils/dxnn.py 의 구조가 실제 dxnn 파일로 확인되기 전까지는 기본 실행 (-m normal) 에서 제외 (pytest -m benchmark 로 실행)
+@pytest.mark.benchmark
+def test_dxnn_header_crosscheck(config, run_cmd, all_suite_path):
+    """
+    utils.dxnn.read_header() 로 직접 읽은 dxnn header 가 parse_model 출력과 같은지 교차 검증
+    - Pass: format/compiler 버전, 입출력 tensor 이름, NPU memory 가 parse_model 과 일치
+    - Fail: header 에서 값을 찾지 못하거나 parse_model 결과와 다름 (dxnn 구조 가정이 틀렸거나 형식 변경)
+    """
+    model_path = f"{all_suite_path}/{config('rt')['parse_model']['model_path']}"
+    header = read_header(model_path)
+    output_text = run_cmd(f"parse_model -m {model_path}")
+
+    print(header)
+    missing = header.missing_fields()
+    assert not missing, f"dxnn header 에서 {missing} 를 찾지 못했습니다. (utils/dxnn.py 의 구조 가정 확인 필요)"
+    mismatches = crosscheck(header, output_text)
+    assert not mismatches, "dxnn header 와 parse_model 결과가 다릅니다:\n" + "\n".join(mismatches)
@@ -1,11 +1,12 @@
 import pytest
 import re
+from utils.run_model import parse_run_model_output
 
 
 @pytest.mark.smoke
 @pytest.mark.normal
 @pytest.mark.stress
-def test_runmodel_default(all_suite_path, config, run_cmd):
+def test_runmodel_default(all_suite_path, config, run_cmd, result_store):
     """run_model 의 -m, --model 옵션으로 기본 벤치마크 모드가 정상 동작하는지 테스트합니다."""
 
     for arg in ["-m", "--model"]:
@@ -25,3 +26,6 @@ def test_runmodel_default(all_suite_path, config, run_cmd):
         # 숫자 검증
         fps = float(m.group(1))
         assert fps > 0, f"FPS는 양수여야 합니다. 현재 값: {fps}"
+
+        # 측정 결과 저장
+        result_store.append("run_model", parse_run_model_output(output, options=arg))
@@ -1,11 +1,12 @@
 import pytest
 import re
+from utils.run_model import parse_run_model_output
 
 
 @pytest.mark.smoke
 @pytest.mark.normal
 @pytest.mark.stress
-def test_runmodel_single(all_suite_path, config, run_cmd):
+def test_runmodel_single(all_suite_path, config, run_cmd, result_store):
     """-s, -l 옵션의 short/long form을 사용한 single mode 동작을 검증합니다."""
 
     model_path = f"{all_suite_path}/{config('rt')['runmodel_benchmark']['default_model_path']}"
@@ -27,3 +28,6 @@ def test_runmodel_single(all_suite_path, config, run_cmd):
 
             fps = float(m.group(1))
             assert fps > 0, f"FPS는 양수여야 합니다. 현재 값: {fps}"
+
+            # 측정 결과 저장
+            result_store.append("run_model", parse_run_model_output(output, options=f"{single_opt} {loops_opt} 1"))
@@ -1,11 +1,12 @@
 import pytest
 import re
+from utils.run_model import parse_run_model_output
 
 
 @pytest.mark.smoke
 @pytest.mark.normal
 @pytest.mark.stress
-def test_runmodel_vervose(all_suite_path, config, run_cmd):
+def test_runmodel_vervose(all_suite_path, config, run_cmd, result_store):
     """-v 옵션 사용 시 시스템 정보 및 추가 성능 지표가 출력되는지 검증합니다."""
 
     for arg in ["-v", "--verbose"]:
@@ -45,3 +46,6 @@ def test_runmodel_vervose(all_suite_path, config, run_cmd):
         lat_val = float(m_lat.group(1))
         assert time_val > 0, f"NPU Processing Time must be positive. got={time_val}"
         assert lat_val > 0, f"Latency Average must be positive. got={lat_val}"
+
+        # 측정 결과 저장
+        result_store.append("run_model", parse_run_model_output(output, options=arg))
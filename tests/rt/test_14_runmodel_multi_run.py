@@ -1,7 +1,10 @@
+import pathlib
 import pytest
 import time
 import subprocess
 import shlex
+from utils.run_model import parse_run_model_output
+from utils.latency_hist import LatencyHistogram, histogram_path
 
 
 @pytest.mark.parametrize("timeout_sec", [
@@ -9,11 +12,12 @@ import shlex
     pytest.param(20, marks=pytest.mark.normal),
     pytest.param(100, marks=pytest.mark.stress),
 ])
-def test_runmodel_multi_run(all_suite_path, config, timeout_sec):
+def test_runmodel_multi_run(all_suite_path, config, timeout_sec, result_store):
     """
     run_model 을 동시에 2개 이상 실행시켜 동작 확인
     - Pass: 문제없이 실행 후 정상종료
     - Fail: 동작을 안하거나 동작 실패
+    - 각 process 의 Latency Average 를 process 별 histogram 으로 저장하고 병합 결과 (count/min/max) 를 latency_percentiles 에 기록
     """
     # 사용할 모델
     model_path = config('rt')['runmodel_benchmark']['default_model_path']
@@ -27,15 +31,28 @@ def test_runmodel_multi_run(all_suite_path, config, timeout_sec):
     processes = []
     try:
         for cnt in range(run_model_multi_cnt):
-            cmd = shlex.split(f"run_model -m {model_path} -t {timeout_sec}")
+            cmd = shlex.split(f"run_model -m {model_path} -t {timeout_sec} -v")
             print(f"### {cmd}")
             p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, cwd=all_suite_path,
                     text=True, encoding="utf-8")
             processes.append(p)
 
+        merged = LatencyHistogram()
+        model_name = pathlib.Path(model_path).stem
         for p in processes:
-            p.wait()
+            output = p.communicate()[0]
             assert p.returncode == 0, f"프로세스 {p.pid}가 비정상 종료되었습니다. 종료 코드: {p.returncode}"
+            result = parse_run_model_output(output, model=model_name)
+            if result.latency_ms is not None:
+                hist = LatencyHistogram()
+                hist.record(result.latency_ms)
+                hist.save(histogram_path(result_store.path, model_name, "multi_run", p.pid))
+                merged.merge(hist)
+
+        if merged.total:
+            row = {"model": model_name, "options": "multi_run", "source": "run_model", **merged.summary()}
+            result_store.append("latency_percentiles", row)
+            print(row)
 
     except FileNotFoundError:
         pytest.fail("실행 파일 'run_model'을 찾을 수 없습니다. 경로를 확인하세요.")
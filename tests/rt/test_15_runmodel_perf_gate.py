@@ -0,0 +1,72 @@
+import pytest
+import pathlib
+import yaml
+from utils.run_model import parse_run_model_output
+from utils.perf_gate import load_baseline, save_baseline, check_regression, baseline_path
+
+
+def load_gate_targets():
+    """
+    parametrize 를 위해 benchmark 대상 (model 경로 기준, model 경로, option) 조합을 로드하는 함수
+    - runmodel_benchmark 의 기본 모델 (all_suite_path 기준)
+    - file_model 에 정의된 모든 dxnn 모델 (app_base_path 기준)
+    """
+    cfg_rt = yaml.safe_load(pathlib.Path("configs/cfg_rt.yaml").read_text(encoding="utf-8"))
+    cfg_app = yaml.safe_load(pathlib.Path("configs/cfg_app.yaml").read_text(encoding="utf-8"))
+
+    models = [("all_suite_path", cfg_rt['runmodel_benchmark']['default_model_path'])]
+    model_dir = cfg_app['file_model']['directory']
+    models += [("app_base_path", f"{model_dir}/{name}") for name in cfg_app['file_model']['expected_files']]
+
+    return [
+        pytest.param(base, model, opt, id=f"{pathlib.Path(model).stem}-{opt}")
+        for base, model in models
+        for opt in cfg_rt['perf_gate']['options']
+    ]
+
+
+@pytest.mark.timeout(60*10) # 10 min timeout for each model/option
+@pytest.mark.parametrize("base, model, options", load_gate_targets())
+@pytest.mark.normal
+@pytest.mark.stress
+@pytest.mark.resources(npu_cores=(0, 1, 2))
+def test_runmodel_perf_gate(request, base, model, options, config, run_cmd, result_store):
+    """
+    run_model 의 FPS/latency 를 model/option 별 baseline 과 비교하여 성능 저하 여부 확인
+    - Pass: 측정값(median)이 baseline 허용 범위 안에 있음
+    - Fail: FPS 가 baseline 보다 유의미하게 낮거나 latency 가 유의미하게 높음,
+            baseline 파일이 없음 (pytest --update-baseline 으로 생성 후 commit)
+    """
+    cfg = config('rt')['perf_gate']
+    model_path = f"{request.getfixturevalue(base)}/{model}"
+    model_name = pathlib.Path(model).stem
+    update = request.config.getoption("update_baseline")
+
+    baseline = load_baseline(cfg['baseline_dir'], model_name, options)
+    if baseline is None and not update:
+        pytest.fail(f"baseline 없음: {baseline_path(cfg['baseline_dir'], model_name, options)} "
+                    "(--update-baseline 으로 생성 후 commit)")
+
+    # warm-up 실행 결과는 버리고 repeats 횟수만큼 측정
+    results = []
+    for i in range(cfg['warmup'] + cfg['repeats']):
+        output = run_cmd(f"run_model -m {model_path} {options}")
+        if i < cfg['warmup']:
+            continue
+        result = parse_run_model_output(output, options=options, model=model_name)
+        assert result.fps is not None, f"FPS 결과를 찾을 수 없습니다.\n{output}"
+        result_store.append("run_model", result)
+        results.append(result)
+
+    if update:
+        path = save_baseline(cfg['baseline_dir'], model_name, options, results,
+                             extra={"dx_rt": config('rt')['CURRENT_VERSIONS']['DX_RT']})
+        print(f"baseline 갱신: {path}")
+        return
+
+    checks = check_regression(results, baseline, cfg['tolerance'], cfg['sigma'])
+    for check in checks:
+        print(check)
+
+    regressions = [str(c) for c in checks if c.regressed]
+    assert not regressions, f"{model_name} ({options}) 성능 저하 감지:\n" + "\n".join(regressions)
@@ -0,0 +1,62 @@
+import os
+import pytest
+import shlex
+import signal
+import subprocess
+import time
+from utils.run_model import parse_run_model_output
+from utils.bound_matrix import LayoutResult, layouts, layout_name, mean_core_util, matrix_report, reference_fps
+
+
+@pytest.mark.timeout(60*60) # 1 hour timeout for all layouts
+@pytest.mark.benchmark
+@pytest.mark.resources(npu_cores=(0, 1, 2))
+def test_runmodel_bound_matrix(all_suite_path, config, dxtop_sampler, result_store):
+    """
+    run_model -n 옵션의 모든 조합(1~3 process, oversubscribed 포함)을 동시에 실행하여
+    aggregate FPS, core 별 Util, NPU_ALL 대비 scaling efficiency 를 측정하고 matrix report 를 생성
+    - Pass: 모든 layout 에서 각 run_model 이 정상 종료되고 FPS 가 출력됨
+    - Fail: run_model 실패 또는 FPS 결과 누락
+    - 결과: results/<session>/bound_matrix.csv, bound_matrix.md
+    """
+    cfg = config('rt')['bound_matrix']
+    models = [f"{all_suite_path}/{m}" for m in cfg['models']]
+    duration = cfg['duration']
+
+    results = []
+    for layout in layouts(cfg['max_processes']):
+        commands = [
+            shlex.split(f"run_model -m {models[i % len(models)]} -t {duration} -n {opt}")
+            for i, opt in enumerate(layout)
+        ]
+        t0 = time.time()
+        procs = []
+        try:
+            for cmd in commands:
+                procs.append(subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+                                              start_new_session=True))
+            outputs = [p.communicate(timeout=duration + 60)[0] for p in procs]
+        finally:
+            # timeout / 예외 시 남은 run_model 이 NPU core 를 계속 잡고 있지 않도록 모두 종료 후 회수
+            for p in procs:
+                if p.poll() is None:
+                    os.killpg(p.pid, signal.SIGKILL)
+                    p.communicate()
+        samples = dxtop_sampler.since(t0, skip_frames=1)
+
+        for cmd, p, output in zip(commands, procs, outputs):
+            assert p.returncode == 0, f"{' '.join(cmd)} 실패 (rc={p.returncode})\n{output}"
+        fps = [parse_run_model_output(output).fps for output in outputs]
+        assert None not in fps, f"{layout_name(layout)}: FPS 결과를 찾을 수 없습니다.\n" + "\n".join(outputs)
+
+        result = LayoutResult(layout, fps, mean_core_util(samples))
+        print(result.to_row())
+        results.append(result)
+
+    ref = reference_fps(results)
+    for result in results:
+        result_store.append("bound_matrix", result.to_row(ref))
+
+    report = matrix_report(results)
+    (result_store.path / "bound_matrix.md").write_text(report, encoding="utf-8")
+    print(report)
@@ -0,0 +1,89 @@
+import json
+import os
+import pathlib
+import pytest
+import yaml
+from utils.run_model import parse_run_model_output
+from utils.latency_hist import LatencyHistogram, histogram_path, fleet_files, merge_files
+
+
+def load_latency_targets():
+    """parametrize 를 위해 latency 측정 대상 (model, -n 옵션) 조합을 로드하는 함수"""
+    cfg = yaml.safe_load(pathlib.Path("configs/cfg_rt.yaml").read_text(encoding="utf-8"))['latency']
+    return [
+        pytest.param(model, bound, id=f"{pathlib.Path(model).stem}-n{bound}")
+        for model in cfg['models']
+        for bound in cfg['bound_options']
+    ]
+
+
+def report(result_store, hist, model, options, source):
+    """histogram 을 저장하고, 이번 결과와 모든 session 을 병합한 fleet 결과를 기록합니다."""
+    hist.save(histogram_path(result_store.path, model, options, f"{source}-{os.getpid()}"))
+    row = {"model": model, "options": options, "source": source, **hist.summary()}
+    result_store.append("latency_percentiles", row)
+    print(row)
+
+    fleet = merge_files(fleet_files(result_store.root, model, options))
+    if fleet is not None:
+        fleet_row = {"model": model, "options": options, **fleet.summary()}
+        result_store.append("latency_fleet", fleet_row)
+        print("fleet:", fleet_row)
+
+
+@pytest.mark.benchmark
+@pytest.mark.timeout(60*10)
+@pytest.mark.parametrize("model, bound", load_latency_targets())
+@pytest.mark.resources(npu_cores=(0, 1, 2))
+def test_runmodel_latency_percentiles(model, bound, all_suite_path, config, run_cmd, result_store):
+    """
+    run_model -v 를 짧게 여러 번 실행하여 model / -n 옵션별 실행 간 latency 분포 (count/min/max, sample 이 충분한 percentile) 측정
+    - run_model 은 실행 한 번의 평균만 출력하므로 inference 별 tail 이 아닌 실행 간 편차, 결과는 results/<session>/latency_percentiles.csv
+    - Pass: 모든 실행에서 Latency 가 출력됨
+    - Fail: run_model 실패 또는 Latency 출력 없음
+    """
+    cfg = config('rt')['latency']
+    model_name = pathlib.Path(model).stem
+    options = f"-n {bound}"
+
+    hist = LatencyHistogram()
+    for _ in range(cfg['runs']):
+        output = run_cmd(f"run_model -m {all_suite_path}/{model} -l {cfg['loops']} {options} -v", echo=False)
+        result = parse_run_model_output(output, options=options, model=model_name)
+        assert result.latency_ms is not None, f"Latency 결과를 찾을 수 없습니다.\n{output}"
+        hist.record(result.latency_ms)
+
+    summary = hist.summary()
+    assert summary["count"] == cfg['runs'] and summary["min_ms"] <= summary["max_ms"]
+    report(result_store, hist, model_name, options, "run_model")
+
+
+@pytest.mark.benchmark
+@pytest.mark.timeout(60*10)
+@pytest.mark.parametrize("model", yaml.safe_load(pathlib.Path("configs/cfg_rt.yaml").read_text(encoding="utf-8"))['latency']['models'])
+@pytest.mark.resources(npu_cores=(0, 1, 2), reads=["venv-dx-runtime"])
+def test_dx_engine_latency_percentiles(model, all_suite_path, rt_base_path, config, run_cmd, result_store):
+    """
+    dx_engine (python) 으로 inference 별 latency 를 기록하여 분포 (p50/p90/p99/p99.9/max) 측정
+    - p99.9 는 10000 개 이상 기록해야 보고됩니다. (latency_hist.min_count)
+    - Pass: probe_loops 개의 latency 가 기록되고 p50 <= p99 <= max
+    - Fail: dx_engine 실행 실패 또는 latency 출력 없음
+    """
+    cfg = config('rt')['latency']
+    venv_python = f"{rt_base_path}/{config('rt')['python_package']['venv_python']}/bin/python3"
+    if not os.path.exists(venv_python):
+        pytest.skip(f"dx_engine venv 가 없습니다: {venv_python}")
+
+    output = run_cmd(f"{venv_python} utils/latency_probe.py -m {all_suite_path}/{model} "
+                     f"-l {cfg['probe_loops']} -w {cfg['probe_warmup']}", echo=False)
+    line = next((l for l in output.splitlines() if l.startswith("LATENCY_US:")), None)
+    assert line, f"latency 출력을 찾을 수 없습니다.\n{output}"
+
+    hist = LatencyHistogram()
+    for value in json.loads(line.split(":", 1)[1]):
+        hist.record_us(value)
+    assert hist.total == cfg['probe_loops']
+
+    summary = hist.summary()
+    assert summary["p50_ms"] <= summary["p99_ms"] <= summary["max_ms"]
+    report(result_store, hist, pathlib.Path(model).stem, "dx_engine", "dx_engine")
@@ -0,0 +1,63 @@
+import pathlib
+import statistics
+import pytest
+import yaml
+from utils.run_model import parse_run_model_output
+from utils.parse_model import parse_model_graph
+from utils.io_bandwidth import IoOverhead, host_platform, pcie_link
+
+
+def _median(values):
+    values = [v for v in values if v is not None]
+    return statistics.median(values) if values else None
+
+
+@pytest.mark.timeout(60*30)
+@pytest.mark.benchmark
+@pytest.mark.parametrize("model", yaml.safe_load(pathlib.Path("configs/cfg_rt.yaml").read_text(encoding="utf-8"))['io_bandwidth']['models'])
+@pytest.mark.resources(npu_cores=(0, 1, 2))
+def test_runmodel_skip_io_bandwidth(model, all_suite_path, config, run_cmd, result_store, telemetry):
+    """
+    run_model 과 run_model --skip-io 의 FPS 차이로 inference 한 번의 host <-> NPU 전송 시간, 전송 비율,
+    유효 대역폭 (parse_model 의 input/output byte 기준) 을 host 별로 측정, 실행 동안의 NPU 최고 온도 / 최저 clock 도 기록
+    - NPU 보다 PCIe link 가 병목인 host 를 찾기 위함, 결과는 results/<session>/io_bandwidth.csv
+    - Pass: 두 실행 모두 FPS 가 출력되고 --skip-io 가 일반 실행보다 느리지 않음 (5% 이내)
+    - Fail: run_model / parse_model 실패 또는 FPS 출력 없음
+    """
+    cfg = config('rt')['io_bandwidth']
+    model_path = f"{all_suite_path}/{model}"
+    model_name = pathlib.Path(model).stem
+
+    graph = parse_model_graph(run_cmd(f"parse_model -m {model_path}", echo=False))
+    assert graph.host_transfer_bytes, "parse_model 출력에서 NPU task 의 input/output byte 를 찾을 수 없습니다."
+
+    # 온도 / clock 변화가 한쪽에만 몰리지 않도록 번갈아 실행, latency 는 -v 에서만 출력됨
+    runs = {"": [], "--skip-io": []}
+    for _ in range(cfg['repeats']):
+        for options in runs:
+            output = run_cmd(f"run_model -m {model_path} -t {cfg['duration']} -v {options}", echo=False)
+            result = parse_run_model_output(output, options=options, model=model_name)
+            assert result.fps is not None, f"FPS 결과를 찾을 수 없습니다. (run_model {options})\n{output}"
+            runs[options].append(result)
+
+    overhead = IoOverhead(
+        model=model_name,
+        transfer_bytes=graph.host_transfer_bytes,
+        fps=_median(r.fps for r in runs[""]),
+        fps_skip_io=_median(r.fps for r in runs["--skip-io"]),
+        latency_ms=_median(r.latency_ms for r in runs[""]),
+        latency_skip_io_ms=_median(r.latency_ms for r in runs["--skip-io"]),
+        link=pcie_link(run_cmd(f"{config('rt')['EXECUTABLE']} -s", echo=False)),
+    )
+    readings = telemetry.readings
+    row = {
+        **host_platform(),
+        **overhead.to_row(),
+        "temp_max_c": max((r.temp_c for r in readings), default=None),
+        "clock_min_mhz": min((r.clock_mhz for r in readings), default=None),
+    }
+    result_store.append("io_bandwidth", row)
+    print(row)
+
+    assert overhead.fps_skip_io >= overhead.fps * 0.95, \
+        f"--skip-io 실행이 더 느립니다: {overhead.fps_skip_io} < {overhead.fps} FPS"
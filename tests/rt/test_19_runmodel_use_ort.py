@@ -0,0 +1,51 @@
+import os
+import pathlib
+import shlex
+import pytest
+import yaml
+from utils.procfs import run_measured
+from utils.run_model import parse_run_model_output
+from utils.parse_model import parse_model_graph
+from utils.ort_compare import CpuRun, cpu_sets, cores_needed
+
+
+@pytest.mark.timeout(60*60)
+@pytest.mark.benchmark
+@pytest.mark.parametrize("model", yaml.safe_load(pathlib.Path("configs/cfg_rt.yaml").read_text(encoding="utf-8"))['ort_compare']['models'])
+@pytest.mark.resources(npu_cores=(0, 1, 2))
+def test_runmodel_use_ort_cpu_scaling(model, all_suite_path, config, run_cmd, result_store):
+    """
+    model 의 CPU task (예: YoloV7 의 cpu_0) 를 --use-ort 로 실행할 때와 기본 경로의 FPS / latency / host CPU 사용량을
+    taskset 으로 제한한 CPU 수별로 비교
+    - model 별로 필요한 host CPU 여유를 확인하기 위함, 결과는 results/<session>/ort_compare.csv, ort_cores_needed.csv
+    - Pass: 모든 mode / CPU 수에서 run_model 이 정상 종료되고 FPS 가 출력됨
+    - Fail: run_model 실패 또는 FPS 출력 없음
+    """
+    cfg = config('rt')['ort_compare']
+    model_path = f"{all_suite_path}/{model}"
+    model_name = pathlib.Path(model).stem
+
+    graph = parse_model_graph(run_cmd(f"parse_model -m {model_path}", echo=False))
+    cpu_tasks = [t.name for t in graph.tasks if t.device == "CPU"]
+    print(f"{model_name} CPU tasks: {cpu_tasks or '없음'}")
+
+    env = {**os.environ, "LC_ALL": "C"}  # run_cmd 와 같이 출력 형식을 고정
+    runs = []
+    for cores, cpu_list in cpu_sets(cfg['core_counts']).items():
+        for mode, options in cfg['modes'].items():
+            command = shlex.split(f"taskset -c {cpu_list} run_model -m {model_path} -t {cfg['duration']} -v {options}")
+            measured = run_measured(command, env=env, timeout=cfg['duration'] + 120)
+            assert measured.returncode == 0, f"{' '.join(command)} 실패 (rc={measured.returncode})\n{measured.output}"
+
+            result = parse_run_model_output(measured.output, options=options, model=model_name)
+            assert result.fps is not None, f"FPS 결과를 찾을 수 없습니다. ({' '.join(command)})\n{measured.output}"
+            run = CpuRun(model_name, mode, cores, result.fps, result.latency_ms, measured.wall_sec,
+                         measured.user_sec + measured.sys_sec)
+            row = {**run.to_row(), "cpu_tasks": " ".join(cpu_tasks)}
+            result_store.append("ort_compare", row)
+            print(row)
+            runs.append(run)
+
+    for (name, mode), cores in cores_needed(runs, cfg['saturation']).items():
+        result_store.append("ort_cores_needed", {"model": name, "mode": mode, "cores_needed": cores})
+        print(f"{name} ({mode}): {cores} core 이상에서 최고 FPS 의 {cfg['saturation']:.0%}")
@@ -4,6 +4,7 @@ import shlex # 쉘 명령어를 안전하게 분리하기 위한 모듈
 import pathlib
 import time
 import yaml
+from utils import error_tokens
 
 
 def load_st_options():
@@ -55,22 +56,13 @@ def test_run_demo(stream_base_path, option_value, config):
         print("프로세스 상태 확인...")
         assert process.poll() is None, f"프로세스가 비정상 종료되었습니다."
 
-        error_indicators = [
-            "can't open camera",
-            "Error:",
-            "ERROR:",
-            "File not found exception",
-            "can't open/read file",
-            "dxrt-exception",
-            "could not be opened"
-        ]
+        matcher = error_tokens.matcher("st")
         # process.stderr에서 직접 한 줄씩 반복하여 읽어오며 에러 체크
         # 프로세스가 종료되고 스트림이 닫힐 때까지 이 루프는 계속됩니다.
         for line in process.stderr:
             print(f"STDERR: {line}", end='')
-            for err in error_indicators:
-                if err in line:
-                    pytest.fail(f"실행 중 오류 발생: '{line}'")
+            if matcher.search(line):
+                pytest.fail(f"실행 중 오류 발생: '{line}'")
 
         # 프로세스가 완전히 종료될 때까지 기다린다.
         process.wait()
@@ -0,0 +1,62 @@
+import pytest
+import pathlib
+from utils.run_model import parse_run_model_output
+from utils.result_store import ResultStore
+
+DATA_DIR = pathlib.Path(__file__).parent / "data"
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+@pytest.mark.parametrize("fixture_file, mode, fps, latency, npu_time", [
+    ("run_model_default.txt", "Benchmark Mode", 254.173, None, 11.834),
+    ("run_model_single.txt", "Single Mode", 48.912, None, None),
+    ("run_model_verbose.txt", "Benchmark Mode", 253.806, 23.415, 11.790),
+])
+def test_parse_run_model_output(fixture_file, mode, fps, latency, npu_time):
+    """
+    녹화된 run_model 출력을 RunModelResult 로 파싱하는지 확인 (장비 불필요)
+    - Pass: model/mode/FPS/latency/NPU time 이 출력값과 일치
+    - Fail: 파싱 결과가 다르거나 없는 지표를 잘못 읽음
+    """
+    output = (DATA_DIR / fixture_file).read_text(encoding="utf-8")
+    result = parse_run_model_output(output, options="-m")
+
+    assert result.model == "YoloV7"
+    assert result.options == "-m"
+    assert result.mode == mode
+    assert result.fps == fps
+    assert result.latency_ms == latency
+    assert result.npu_time_ms == npu_time
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_result_store_append(tmp_path):
+    """
+    ResultStore 가 session 폴더에 table 단위로 결과를 누적 저장하는지 확인
+    - Pass: 저장한 row 들이 column 별로 다시 읽힘, 나중 row 의 새 column 은 header 에 추가되고 기존 row 는 빈 값
+    - Fail: header 중복 또는 값 누락
+    """
+    store = ResultStore(tmp_path, session="s1")
+    for fixture_file in ["run_model_default.txt", "run_model_verbose.txt"]:
+        output = (DATA_DIR / fixture_file).read_text(encoding="utf-8")
+        store.append("run_model", parse_run_model_output(output, options="-m"))
+
+    columns = store.read("run_model")
+    assert store.table_path("run_model") == tmp_path / "s1" / "run_model.csv"
+    assert columns["model"] == ["YoloV7", "YoloV7"]
+    assert columns["fps"] == ["254.173", "253.806"]
+    assert columns["latency_ms"] == ["", "23.415"]
+
+    store.append("dx_com_history", {"version": "v1", "duration_sec": 10.0})
+    store.append("dx_com_history", {"version": "v2", "duration_sec": 12.0, "concurrent_jobs": 4})
+    store.append("dx_com_history", {"version": "v3", "duration_sec": 11.0})
+    assert store.read("dx_com_history") == {
+        "version": ["v1", "v2", "v3"],
+        "duration_sec": ["10.0", "12.0", "11.0"],
+        "concurrent_jobs": ["", "4", ""],
+    }
+    assert store.table_path("dx_com_history").read_text(encoding="utf-8").count("version") == 1
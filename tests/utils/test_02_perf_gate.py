@@ -0,0 +1,51 @@
+import pytest
+from utils.run_model import RunModelResult
+from utils.perf_gate import save_baseline, load_baseline, check_regression, baseline_path
+
+
+def _results(fps_list, latency_list):
+    return [RunModelResult("YoloV7", "-v -t 3", fps=f, latency_ms=l) for f, l in zip(fps_list, latency_list)]
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_baseline_roundtrip(tmp_path):
+    """
+    baseline 파일이 model/option 조합별로 저장되고 다시 읽히는지 확인
+    - Pass: mean/stdev/samples 가 저장값과 일치
+    - Fail: 파일 경로 또는 요약값 불일치
+    """
+    path = save_baseline(tmp_path, "YoloV7", "-v -t 3", _results([250, 254, 252], [23.0, 23.4, 23.2]))
+
+    assert path == baseline_path(tmp_path, "YoloV7", "-v -t 3") == tmp_path / "YoloV7__v_t_3.yaml"
+    baseline = load_baseline(tmp_path, "YoloV7", "-v -t 3")
+    assert baseline["fps"] == {"mean": 252.0, "stdev": 2.0, "samples": 3}
+    assert baseline["latency_ms"]["mean"] == 23.2
+    assert "npu_time_ms" not in baseline
+    assert load_baseline(tmp_path, "YoloV7", "-s") is None
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+@pytest.mark.parametrize("fps_list, latency_list, regressed", [
+    ([251, 249, 250], [23.1, 23.3, 23.2], set()),                # baseline 과 동일
+    ([245, 190, 246], [23.1, 40.0, 23.2], set()),                # 한 번 튀는 값은 median 으로 무시
+    ([220, 221, 219], [23.1, 23.3, 23.2], {"fps"}),              # FPS 12% 저하
+    ([250, 250, 250], [27.0, 27.5, 27.2], {"latency_ms"}),       # latency 17% 증가
+])
+def test_check_regression(fps_list, latency_list, regressed):
+    """
+    tolerance/stdev 기반 허용 범위를 벗어난 metric 만 regression 으로 판정하는지 확인
+    - Pass: 기대한 metric 만 regressed
+    - Fail: noise 를 regression 으로 판정하거나 실제 저하를 놓침
+    """
+    baseline = {
+        "fps": {"mean": 250.0, "stdev": 1.0, "samples": 5},
+        "latency_ms": {"mean": 23.2, "stdev": 0.1, "samples": 5},
+    }
+    checks = check_regression(_results(fps_list, latency_list), baseline, tolerance=0.05, sigma=3)
+
+    assert {c.metric for c in checks} == {"fps", "latency_ms"}
+    assert {c.metric for c in checks if c.regressed} == regressed
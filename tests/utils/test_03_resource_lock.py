@@ -0,0 +1,56 @@
+import fcntl
+import os
+import pytest
+from utils.resource_lock import ResourceLock, resource_names
+
+
+def _try_lock(lock_dir, name, exclusive):
+    """lock 을 non-blocking 으로 잡아보고 성공 여부를 반환합니다."""
+    fd = os.open(lock_dir / f"{name}.lock", os.O_RDWR | os.O_CREAT)
+    try:
+        fcntl.flock(fd, (fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH) | fcntl.LOCK_NB)
+        return True
+    except BlockingIOError:
+        return False
+    finally:
+        os.close(fd)
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_resource_names():
+    """
+    resources marker tag 가 정렬된 (lock 이름, exclusive) list 로 변환되는지 확인
+    - Pass: 독점 자원은 exclusive, 지정하지 않은 NPU core 는 shared
+    - Fail: 누락되거나 정렬되지 않음
+    """
+    assert resource_names() == [("npu-0", False), ("npu-1", False), ("npu-2", False)]
+    assert resource_names(camera=True, port=5000, output="result.jpg", npu_cores=[1], reads=["venv"]) == [
+        ("camera", True),
+        ("file-result.jpg", True),
+        ("file-venv", False),
+        ("npu-0", False),
+        ("npu-1", True),
+        ("npu-2", False),
+        ("port-5000", True),
+    ]
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_resource_lock_conflicts(tmp_path):
+    """
+    exclusive 자원은 다른 사용자를 막고, shared 자원은 함께 사용할 수 있는지 확인
+    - Pass: camera/npu-0 는 막히고 npu-1 은 shared 로 함께 사용 가능, 해제 후에는 모두 사용 가능
+    - Fail: lock 충돌 판정이 다름
+    """
+    with ResourceLock(resource_names(camera=True, npu_cores=[0]), lock_dir=tmp_path):
+        assert not _try_lock(tmp_path, "camera", exclusive=False)
+        assert not _try_lock(tmp_path, "npu-0", exclusive=False)
+        assert _try_lock(tmp_path, "npu-1", exclusive=False)
+        assert not _try_lock(tmp_path, "npu-1", exclusive=True)
+
+    assert _try_lock(tmp_path, "camera", exclusive=True)
+    assert _try_lock(tmp_path, "npu-1", exclusive=True)
@@ -0,0 +1,107 @@
+import sys
+import time
+import pytest
+from utils import error_tokens
+from utils.log_capture import LogCapture
+from utils.process_monitor import MonitorResult, _Watcher, supervise
+
+# 녹화된 app 출력 대신 같은 형식으로 출력하는 python script 로 app 을 흉내냅니다.
+HEALTHY_APP = """
+import sys, time
+try:
+    print("[DXAPP] [INFO] model loaded", flush=True)
+    time.sleep(0.2)
+    while True:
+        print("[DXAPP] [INFO] fps : 30.5", flush=True)
+        time.sleep(0.1)
+except KeyboardInterrupt:
+    sys.exit(0)
+"""
+
+ERROR_APP = """
+import sys, time
+print("[DXAPP] [INFO] model loaded", flush=True)
+print("[DXAPP] [ERROR] dxrt-exception: device not found", file=sys.stderr, flush=True)
+time.sleep(60)
+"""
+
+EARLY_EXIT_APP = """
+import sys
+print("usage: yolo -m <model>", flush=True)
+sys.exit(2)
+"""
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_supervise_healthy_app():
+    """
+    정상 동작하는 app 을 지정된 시간 동안 실행 후 SIGINT 로 종료하는지 확인
+    - Pass: 실패 사유 없음, time-to-first-frame 이 기록됨
+    - Fail: 오류/조기 종료로 잘못 판정하거나 first frame 을 놓침
+    """
+    result = supervise([sys.executable, "-c", HEALTHY_APP], duration=1)
+
+    assert result.failure is None
+    assert result.returncode == 0
+    assert 0.15 < result.time_to_first_frame < 1
+    assert result.time_to_first_output <= result.time_to_first_frame
+    assert "model loaded" in result.output
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_supervise_fails_fast_on_error_token():
+    """
+    stderr 에 오류 문자열이 나오면 duration 을 기다리지 않고 바로 반환하는지 확인
+    - Pass: 수 초 안에 hit_token 과 함께 반환
+    - Fail: duration(60초)을 모두 기다리거나 오류를 놓침
+    """
+    result = supervise([sys.executable, "-c", ERROR_APP], duration=60, stop_timeout=2)
+
+    assert result.hit_token == "dxrt-exception"
+    assert "device not found" in result.hit_line
+    assert not result.early_exit
+    assert result.elapsed < 5
+    assert "dxrt-exception" in result.failure
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_supervise_detects_early_exit():
+    """
+    app 이 duration 전에 스스로 종료되면 바로 조기 종료로 판정하는지 확인
+    - Pass: early_exit 과 종료 코드가 기록됨
+    - Fail: duration 을 기다리거나 정상으로 판정
+    """
+    result = supervise([sys.executable, "-c", EARLY_EXIT_APP], duration=60)
+
+    assert result.early_exit
+    assert result.returncode == 2
+    assert result.elapsed < 5
+    assert result.time_to_first_frame is None
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+@pytest.mark.parametrize("split", [3, 40, 50, 80])
+def test_hit_line_across_chunks(split):
+    """
+    오류 문자열 / line 이 chunk 경계에 걸쳐서 들어와도 오류가 있는 line 전체를 hit_line 으로 기록하는지 확인
+    - Pass: 경계 위치와 관계없이 hit_token 과 hit_line 이 같음
+    - Fail: hit_line 이 다른 line 이거나 line 의 일부만 기록됨
+    """
+    output = "[DXAPP] [INFO] model loaded\n[DXAPP] [ERROR] dxrt-exception: device not found\nnext line\n"
+    with LogCapture(error_tokens.matcher("app")) as log:
+        result = MonitorResult(command=["app"], log=log)
+        watcher = _Watcher(result, time.monotonic(), None)
+        watcher.on_output("stdout", output[:split])
+        watcher.on_output("stderr", "unrelated stderr line\n")
+        watcher.on_output("stdout", output[split:])
+
+    assert result.hit_token == "dxrt-exception"
+    assert result.hit_line == "[DXAPP] [ERROR] dxrt-exception: device not found"
@@ -0,0 +1,47 @@
+import gzip
+import pytest
+from utils.log_capture import LogCapture
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_log_capture_bounded_tail_and_spill(tmp_path):
+    """
+    출력이 계속 늘어나도 메모리에는 최근 tail 만 남고, 전체 출력은 gzip 파일로 저장되는지 확인
+    - Pass: tail 크기가 tail_bytes 이하, spill 파일에 모든 line 존재
+    - Fail: tail 이 계속 커지거나 spill 파일 내용 누락
+    """
+    spill = tmp_path / "logs" / "app.log.gz"
+    lines = [f"[DXAPP] [INFO] frame {i:06d} fps : 30.0\n" for i in range(20000)]
+    expected = "".join(lines) + "Error: decoder stopped\n"
+
+    with LogCapture(["Error:"], spill_path=spill, tail_bytes=4096) as log:
+        hits = [log.write(line) for line in lines]
+        hits.append(log.write("Error: decoder stopped\n"))
+
+    assert [h.token for h in hits[-1]] == ["Error:"] and not any(hits[:-1])
+    assert log.total_bytes == len(expected)
+    assert len(log.tail()) <= 4096
+    assert log.tail().endswith("Error: decoder stopped\n")
+
+    with gzip.open(spill, "rt", encoding="utf-8") as f:
+        spilled = f.read()
+    assert spilled == expected
+    assert spill.stat().st_size < len(spilled) / 5
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_log_capture_without_tail():
+    """
+    tail_bytes=0 이면 tail 을 보관하지 않고 오류 문자열 검사만 하는지 확인
+    - Pass: write 가 예외 없이 hit 을 반환, tail 은 빈 문자열
+    - Fail: ring buffer 정리 중 IndexError
+    """
+    with LogCapture(["Error:"], tail_bytes=0) as log:
+        assert log.write("frame 1\n") == []
+        assert [h.token for h in log.write("Error: decoder stopped\n")] == ["Error:"]
+    assert log.tail() == ""
+    assert log.total_bytes == len("frame 1\nError: decoder stopped\n")
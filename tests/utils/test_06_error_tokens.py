@@ -0,0 +1,63 @@
+import pytest
+from utils import error_tokens
+from utils.error_tokens import TokenMatcher, WARNING, ERROR, FATAL
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_module_tokens():
+    """
+    module 별 오류 문자열이 공통 문자열과 합쳐지고 severity 로 걸러지는지 확인
+    - Pass: app/st 에 각 module 전용 문자열 포함, min_severity 이상만 포함
+    - Fail: 문자열 누락 또는 알 수 없는 module 허용
+    """
+    app = error_tokens.tokens("app")
+    assert {"can't open camera", "Error:", "dxrt-exception", "could not be opened"} <= set(app)
+    assert "ERROR:" not in app and "ERROR:" in error_tokens.tokens("st")
+    assert set(error_tokens.tokens("rt", min_severity=FATAL)) == {"terminate called after throwing"}
+    assert all(sev >= ERROR for sev in error_tokens.tokens("com").values())
+    with pytest.raises(KeyError):
+        error_tokens.tokens("unknown")
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_matcher_search():
+    """
+    compile 된 matcher 가 한 번의 scan 으로 오류 문자열을 찾는지 확인
+    - Pass: 포함된 token 을 반환하고 없으면 None
+    - Fail: token 을 놓치거나 잘못된 token 을 반환
+    """
+    matcher = error_tokens.matcher("app")
+
+    assert matcher.search("[DXAPP] [INFO] fps : 30.0") is None
+    assert matcher.search("[ERROR] dxrt-exception: device busy") == "dxrt-exception"
+    assert matcher.search("can't open camera: /dev/video0") == "can't open camera"
+    assert TokenMatcher([]).search("Error:") is None
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 4096])
+def test_stream_scanner_chunk_boundaries(chunk_size):
+    """
+    출력을 어떤 크기의 chunk 로 나눠도 chunk 경계에 걸친 token 을 정확히 한 번씩 찾는지 확인
+    - Pass: 전체 문자열을 한 번에 scan 한 결과와 token/위치가 동일
+    - Fail: 경계에 걸친 token 누락 또는 중복 보고
+    """
+    matcher = TokenMatcher({"dxrt-exception": ERROR, "Error:": ERROR, "[WARN]": WARNING})
+    stream = ("[DXAPP] [INFO] fps : 30.0\n" * 50 + "[WARN] slow frame\n"
+              + "x" * 13 + "dxrt-exception\n" + "fps : 29.1\nError: Error: done\n")
+    expected = [(tok, start) for tok, start, _ in matcher.finditer(stream)]
+
+    scanner = matcher.scanner()
+    hits = []
+    for i in range(0, len(stream), chunk_size):
+        hits += scanner.feed(stream[i:i + chunk_size])
+
+    assert [(h.token, h.offset) for h in hits] == expected
+    assert [h.token for h in hits] == ["[WARN]", "dxrt-exception", "Error:", "Error:"]
+    assert hits[0].severity == WARNING
@@ -0,0 +1,71 @@
+import csv
+import json
+import pathlib
+import pytest
+from utils.dxtop import DxtopParser, DxtopSampler, frames, write_series
+
+DATA = pathlib.Path(__file__).parent / "data"
+
+
+def parse(stream, chunk_size):
+    parser = DxtopParser()
+    samples = []
+    for i in range(0, len(stream), chunk_size):
+        samples += parser.feed(stream[i:i + chunk_size], timestamp=float(i))
+    samples += parser.flush(timestamp=float(len(stream)))
+    return parser, samples
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_dxtop_parse_recorded_stream():
+    """
+    녹화된 dxtop byte stream (ANSI escape 포함)에서 core 별 Util/Temp/Voltage/Clock 을 파싱하는지 확인
+    - Pass: chunk 크기와 관계없이 같은 결과, 3 frame x 3 core 의 값과 버전이 모두 파싱됨,
+            since 가 앞쪽 frame 을 버림
+    - Fail: chunk 경계에 걸친 escape sequence / line 때문에 값이 누락되거나 틀림
+    """
+    stream = (DATA / "dxtop_stream.bin").read_bytes()
+    parser, whole = parse(stream, len(stream))
+    _, chunked = parse(stream, 7)
+
+    strip = lambda samples: [(s.core, s.util, s.temp_c, s.voltage_mv, s.clock_mhz) for s in samples]
+    assert strip(chunked) == strip(whole)
+    assert parser.versions == {"DX_RT": "v3.0.0", "RT_DRIVER": "v1.7.1", "DX_TOP": "v1.0.1"}
+
+    result = frames(whole)
+    assert len(result) == 3
+    assert [result[1][core].util for core in (0, 1, 2)] == [38.5, 0.0, 12.25]
+    assert [result[2][core].temp_c for core in (0, 1, 2)] == [61, 48, 58]
+    assert all(s.voltage_mv == 750 and s.clock_mhz == 1000 for s in whole)
+
+    # since(t0, skip_frames=1) 는 t0 직후의 첫 frame (t0 이전 부하가 섞인 frame) 을 버림
+    sampler = DxtopSampler()
+    sampler.samples = whole
+    assert sampler.since(0.0) == whole
+    assert sampler.since(0.0, skip_frames=1) == [s for frame in result[1:] for s in frame.values()]
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_dxtop_write_series(tmp_path):
+    """
+    파싱한 sample 을 CSV / JSONL time series 로 저장하는지 확인
+    - Pass: 저장한 파일을 다시 읽었을 때 sample 수와 값이 같음
+    - Fail: 파일 누락 또는 값 불일치
+    """
+    _, samples = parse((DATA / "dxtop_stream.bin").read_bytes(), 64)
+
+    with open(write_series(samples, tmp_path / "telemetry" / "dxtop.csv"), newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == len(samples) == 9
+    assert float(rows[-1]["util"]) == samples[-1].util
+
+    with open(write_series(samples, tmp_path / "dxtop.jsonl")) as f:
+        records = [json.loads(line) for line in f]
+    assert [r["temp_c"] for r in records] == [s.temp_c for s in samples]
+
+    with pytest.raises(ValueError):
+        write_series(samples, tmp_path / "dxtop.txt")
@@ -0,0 +1,75 @@
+import pathlib
+import time
+import pytest
+from utils.telemetry import MonitorParser, FileBackend, TelemetryBackend, open_backend, write_readings
+
+DATA = pathlib.Path(__file__).parent / "data"
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+@pytest.mark.parametrize("chunk_size", [1, 5, 4096])
+def test_monitor_parser_blocks(chunk_size):
+    """
+    녹화된 'dxrt-cli -m 1' 출력을 chunk 단위로 입력해도 '===' 로 구분된 block 을 정확히 파싱하는지 확인
+    - Pass: header, 완성된 2개 block 의 NPU 별 값/device 번호/dvfs 가 일치, 미완성 block 은 반환하지 않음
+    - Fail: chunk 경계에 걸친 값 누락 또는 block 개수 불일치
+    """
+    stream = (DATA / "dxrt_cli_monitor.txt").read_bytes()
+    parser = MonitorParser()
+    blocks = []
+    for i in range(0, len(stream), chunk_size):
+        blocks += parser.feed(stream[i:i + chunk_size], timestamp=0.0)
+
+    assert parser.header == "DXRT v3.0.0"
+    assert len(blocks) == 2
+    assert [(r.device, r.npu, r.temp_c) for r in blocks[0].readings] == [(0, 0, 45), (0, 1, 46), (0, 2, 44)]
+    assert [r.device for r in blocks[1].readings] == [0, 0, 0, 1, 1, 1]
+    assert [(r.voltage_mv, r.clock_mhz) for r in blocks[1].readings][-1] == (725, 800)
+    assert all(block.dvfs for block in blocks)
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_file_backend_fake_dir(tmp_path):
+    """
+    sysfs 형태의 fake 디렉토리에서 측정값을 읽고, 값이 바뀌면 다시 읽은 값에 반영되는지 확인
+    - Pass: device/npu 별 값이 일치, 파일 갱신 후 새 값이 읽힘, 100 Hz polling (background 포함) 가능
+    - Fail: 값 불일치 또는 갱신된 값이 반영 안됨
+    """
+    for device in (0, 1):
+        for npu in (0, 1, 2):
+            d = tmp_path / str(device) / f"npu{npu}"
+            d.mkdir(parents=True)
+            (d / "voltage").write_text("750\n")
+            (d / "clock").write_text("1000\n")
+            (d / "temperature").write_text(f"{40 + device * 10 + npu}\n")
+
+    with open_backend({"backend": "file", "root": str(tmp_path)}) as backend:
+        assert isinstance(backend, FileBackend)
+        readings = backend.read()
+        assert [(r.device, r.npu, r.temp_c) for r in readings] == \
+            [(0, 0, 40), (0, 1, 41), (0, 2, 42), (1, 0, 50), (1, 1, 51), (1, 2, 52)]
+
+        (tmp_path / "1" / "npu2" / "temperature").write_text("85\n")
+        assert backend.read()[-1].temp_c == 85
+
+        polled = backend.poll(hz=100, duration=0.2)
+        assert 6 * 10 <= len(polled) <= 6 * 21
+
+        # benchmark 와 같이 background 로 수집
+        backend.start(hz=100)
+        time.sleep(0.1)
+        t0 = time.time()
+        time.sleep(0.2)
+        backend.stop()
+        assert len(backend.since(t0)) >= 6 * 10 and len(backend.readings) > len(backend.since(t0))
+        lines = write_readings(backend.readings, tmp_path / "npu.csv").read_text().splitlines()
+        assert lines[0] == "timestamp,device,npu,voltage_mv,clock_mhz,temp_c" and len(lines) == len(backend.readings) + 1
+
+    with pytest.raises(FileNotFoundError):
+        FileBackend(tmp_path / "missing")
+    with pytest.raises(TypeError):
+        TelemetryBackend()  # read() 를 구현하지 않은 backend
@@ -0,0 +1,37 @@
+import pytest
+from utils.bound_matrix import LayoutResult, layouts, is_oversubscribed, mean_core_util, matrix_report
+from utils.dxtop import DxtopSample
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_bound_matrix_layouts_and_report():
+    """
+    -n 옵션 조합 생성, oversubscribed 판정, NPU_ALL 대비 efficiency 와 matrix report 정렬 확인
+    - Pass: 1~3 process 조합 개수(7 + 28 + 84), 판정/efficiency 값, 최고 FPS layout 추천이 맞음
+    - Fail: 조합 누락/중복 또는 계산 오류
+    """
+    all_layouts = layouts(3)
+    assert len(all_layouts) == 7 + 28 + 84
+    assert len(set(all_layouts)) == len(all_layouts)
+
+    assert not is_oversubscribed((1, 2, 3))
+    assert not is_oversubscribed((4, 3))
+    assert is_oversubscribed((0, 1))
+    assert is_oversubscribed((2, 2))
+
+    samples = [DxtopSample(0.0, core, util) for core, util in [(0, 90.0), (1, 80.0), (2, 0.0), (0, 100.0)]]
+    assert mean_core_util(samples) == {0: 95.0, 1: 80.0, 2: 0.0}
+
+    results = [
+        LayoutResult((0,), [300.0], {0: 90.0, 1: 90.0, 2: 90.0}),
+        LayoutResult((1, 2, 3), [110.0, 112.0, 108.0]),
+        LayoutResult((0, 0), [160.0, 150.0]),
+    ]
+    assert results[1].to_row(300.0)["efficiency"] == 1.1
+
+    report = matrix_report(results)
+    assert report.startswith("Best layout: NPU_0 + NPU_1 + NPU_2 (330.0 FPS, efficiency vs NPU_ALL: 1.1)")
+    rows = [line for line in report.splitlines() if line.startswith("| NPU")]
+    assert [row.split(" | ")[0] for row in rows] == ["| NPU_0 + NPU_1 + NPU_2", "| NPU_ALL + NPU_ALL", "| NPU_ALL"]
@@ -0,0 +1,68 @@
+import os
+import pytest
+from utils import asset_cache
+from utils.asset_cache import AssetCache
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_asset_cache_sync_from_local_remote(tmp_path, monkeypatch):
+    """
+    local 디렉토리를 remote 로 사용하여 asset 을 hard-link 로 복구하고, 변경되지 않은 파일은 hash 를 다시 계산하지 않는지 확인
+    - Pass: 빈 cache 에서는 이미 있는 파일을 cache 에 저장 (다운로드 없음), 없는 파일만 missing,
+      다른 cache 에서 remote 로 복구(hard-link), 내용이 바뀐 파일은 새 내용으로 manifest 갱신 (되돌리지 않음),
+      지워진 파일 / 바뀐 object 는 다시 복구, 변경 없는 파일은 hash 생략
+    - Fail: 복구 실패, 의도적으로 바뀐 파일을 이전 내용으로 되돌림, 불필요한 hash 계산
+    """
+    files = {"YoloV7.dxnn": b"dxnn" * 1000, "boat.mp4": b"\x00\x01mp4" * 500}
+    seed = tmp_path / "seed"
+    seed.mkdir()
+    for name, data in files.items():
+        (seed / name).write_bytes(data)
+
+    # 빈 cache: 이미 있는 파일은 그대로 cache 에 저장 (복사본), 실제로 없는 파일만 missing
+    remote = AssetCache(tmp_path / "remote")
+    result = remote.sync("file_model", seed, [*files, "YOLOV9S.dxnn"])
+    assert sorted(result.ingested) == sorted(files) and result.missing == ["YOLOV9S.dxnn"]
+    manifest = remote.load_manifest("file_model")
+    assert manifest["boat.mp4"]["size"] == len(files["boat.mp4"])
+    assert not os.path.samefile(seed / "boat.mp4", remote.object_path(manifest["boat.mp4"]["sha256"]))
+    assert sorted(remote.sync("file_model", seed, files).verified) == sorted(files)
+
+    # remote 만 아는 새 runner: remote manifest/object 를 가져와 hard-link
+    cache = AssetCache(tmp_path / "local", remote=tmp_path / "remote")
+    app_dir = tmp_path / "app" / "assets"
+    result = cache.sync("file_model", app_dir, files)
+    assert sorted(result.linked) == sorted(files) and not result.missing
+    sha = manifest["YoloV7.dxnn"]["sha256"]
+    assert os.path.samefile(app_dir / "YoloV7.dxnn", cache.object_path(sha))
+    assert (app_dir / "boat.mp4").read_bytes() == files["boat.mp4"]
+
+    # 새 SDK / setup.sh 로 바뀐 파일은 되돌리지 않고 새 내용으로 cache / manifest 갱신
+    new_video = b"new-mp4" * 300
+    (app_dir / "boat.mp4").unlink()
+    (app_dir / "boat.mp4").write_bytes(new_video)
+    result = cache.sync("file_model", app_dir, files)
+    assert result.updated == ["boat.mp4"] and result.verified == ["YoloV7.dxnn"] and not result.linked
+    assert (app_dir / "boat.mp4").read_bytes() == new_video
+    assert cache.load_manifest("file_model")["boat.mp4"]["size"] == len(new_video)
+    assert cache.sync("file_model", app_dir, files).verified == ["YoloV7.dxnn", "boat.mp4"]
+
+    # app 파일을 제자리에서 덮어써서 hard-link 된 object 가 바뀌어도 새 내용으로 저장, 이전 object 는 다시 받아서 복구
+    with open(app_dir / "YoloV7.dxnn", "r+b") as f:
+        f.write(b"XXXX")
+    result = cache.sync("file_model", app_dir, files)
+    assert result.updated == ["YoloV7.dxnn"]
+    assert cache._fetch(sha) and cache.object_path(sha).read_bytes() == files["YoloV7.dxnn"]
+
+    # 지워진 파일만 cache 에서 복구
+    (app_dir / "boat.mp4").unlink()
+    result = cache.sync("file_model", app_dir, files)
+    assert result.linked == ["boat.mp4"] and (app_dir / "boat.mp4").read_bytes() == new_video
+
+    # 변경이 없으면 mtime+size 로 확인하고 hash 는 계산하지 않음 (새 프로세스에서도 index 사용)
+    hashed = []
+    monkeypatch.setattr(asset_cache, "sha256_file", lambda path, *a: hashed.append(path))
+    result = AssetCache(tmp_path / "local").sync("file_model", app_dir, files)
+    assert sorted(result.verified) == sorted(files) and hashed == []
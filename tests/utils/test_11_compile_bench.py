@@ -0,0 +1,59 @@
+import sys
+import pytest
+from utils.procfs import run_measured
+from utils.dx_com import compile_model, compiler_version, parse_compile_command
+
+# 자식 process 를 만들어 각각 ~64MB 를 잡고 CPU 를 사용하는 가짜 compiler
+FAKE_COMPILER = """
+import subprocess, sys, time
+child = subprocess.Popen([sys.executable, "-c",
+    "import time; b = bytearray(64 * 2**20); b[::4096] = b'x' * len(b[::4096]); time.sleep(0.6)"])
+buf = bytearray(64 * 2**20); buf[::4096] = b'x' * len(buf[::4096])
+end = time.process_time() + 0.2
+while time.process_time() < end:
+    pass
+child.wait()
+open(sys.argv[1], "wb").write(b"DXNN" * 256)
+print("compile done")
+"""
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_compile_measurement(tmp_path):
+    """
+    process tree 의 peak RSS, CPU 시간, 출력 dxnn 크기, compiler 버전을 측정/파싱하는지 확인
+    - Pass: 부모+자식 RSS 합(>= 128MB)이 peak 로 기록되고 user 시간, dxnn 크기, 버전이 맞음
+    - Fail: 자식 process 메모리 누락 또는 측정값 오류
+    """
+    script = tmp_path / "fake_dx_com.py"
+    script.write_text(FAKE_COMPILER)
+    (tmp_path / "compiler.properties").write_text("COM_VERSION=2.0.0\nOTHER=1\n")
+
+    assert parse_compile_command("dx_com -m a/b.onnx -c b.json -o out --shrink") == ("a/b.onnx", "b.json", "out", ["--shrink"])
+    assert compiler_version(tmp_path) == "2.0.0"
+
+    run = run_measured([sys.executable, str(script), str(tmp_path / "out.dxnn")], interval=0.02)
+    assert run.returncode == 0 and "compile done" in run.output
+    assert run.peak_rss >= 128 * 2**20
+    assert run.max_rss_single >= 64 * 2**20
+    assert run.user_sec >= 0.1 and run.wall_sec >= 0.6
+
+    result, _ = compile_model(f"{sys.executable} {script} out.dxnn -m model/ResNet50-1.onnx",
+                              cwd=tmp_path, dxnn_path="out.dxnn", version="2.0.0")
+    assert result.model == "ResNet50-1" and result.dxnn_bytes == 1024 and result.returncode == 0
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_run_measured_timeout():
+    """
+    timeout 이 지나면 process group 전체를 종료하는지 확인
+    - Pass: timed_out 이 True, timeout 근처에서 반환
+    - Fail: timeout 이후에도 기다림
+    """
+    run = run_measured(["sh", "-c", "sleep 30 & sleep 30"], timeout=0.5)
+    assert run.timed_out and run.returncode < 0
+    assert run.wall_sec < 5
@@ -0,0 +1,59 @@
+import sys
+import pytest
+from utils.compile_farm import CompileFarm, history_stats, make_job
+
+# -o 디렉토리에 <model>.dxnn 을 만드는 가짜 dx_com
+FAKE_COMPILER = """
+import os, sys, time
+args = sys.argv[1:]
+model = os.path.splitext(os.path.basename(args[args.index("-m") + 1]))[0]
+out_dir = args[args.index("-o") + 1]
+time.sleep(0.4)
+os.makedirs(out_dir, exist_ok=True)
+open(os.path.join(out_dir, model + ".dxnn"), "wb").write(b"DXNN")
+"""
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+@pytest.mark.parametrize("budget_mb, expected_concurrent", [(1000, 1), (2000, 3)])
+def test_compile_farm_admission(tmp_path, budget_mb, expected_concurrent):
+    """
+    model 별 예상 peak RSS 합이 memory budget 을 넘지 않는 만큼만 동시에 compile 하는지 확인
+    - Pass: budget 1000MB (job 당 600MB) 이면 1개씩, 2000MB 이면 3개 동시 실행, job 별 출력 디렉토리 분리,
+            job 별 실제 동시 실행 수 기록, serial 이력 없이 병렬 실행하면 speedup 은 None
+    - Fail: budget 초과 실행, 출력 파일 충돌, 병렬 실행 시간으로 serial 시간을 추정
+    """
+    script = tmp_path / "fake_dx_com.py"
+    script.write_text(FAKE_COMPILER)
+    history = history_stats({
+        "model": ["A-1", "B-1", "C-1", "A-1"],
+        "returncode": ["0", "0", "0", "0"],
+        "peak_rss_mb": ["500", "600", "600", "600"],
+        "wall_sec": ["1.0", "1.0", "1.0", "9.0"],
+        "concurrent_jobs": ["1", "1", "1", "3"],
+    })
+    assert history["A-1"] == {"peak_rss_mb": 600.0, "wall_sec": 1.0}  # 병렬 실행 시간은 serial 추정에서 제외
+
+    jobs = [make_job(f"{sys.executable} {script} -m sample/{m}.onnx -c sample/{m}.json -o output/same", "output/farm")
+            for m in ("A-1", "B-1", "C-1")]
+    assert [job.dxnn_path for job in jobs] == [f"output/farm/{m}/{m}.dxnn" for m in ("A-1", "B-1", "C-1")]
+
+    farm = CompileFarm(max_workers=3, budget_mb=budget_mb, history=history)
+    report = farm.run(jobs, cwd=tmp_path)
+
+    assert report.max_concurrent == expected_concurrent
+    assert [r.concurrent_jobs for r in report.results] == [expected_concurrent] * 3
+    assert all(r.returncode == 0 and r.dxnn_bytes == 4 for r in report.results)
+    assert report.serial_sec == pytest.approx(3.0)
+    if expected_concurrent == 3:
+        assert report.wall_sec < 1.2
+
+    # serial 이력이 없는 model 이 병렬로 실행되면 serial 시간 (speedup) 을 알 수 없음
+    farm = CompileFarm(max_workers=3, budget_mb=budget_mb, default_rss_mb=600, history={})
+    report = farm.run(jobs, cwd=tmp_path)
+    if expected_concurrent == 3:
+        assert report.serial_sec is None and report.speedup is None and report.to_row()["speedup"] is None
+    else:
+        assert report.serial_sec == pytest.approx(sum(run.wall_sec for run in report.runs))
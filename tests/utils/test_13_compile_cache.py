@@ -0,0 +1,71 @@
+import os
+import pytest
+from utils.compile_cache import CompileCache, cached_compile
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_compile_cache_hit_key_and_lru(tmp_path):
+    """
+    ONNX/JSON/flag/버전이 같으면 compile 없이 cache 에서 복구하고, 크기 제한을 넘으면 오래된 entry 부터 삭제하는지 확인
+    - Pass: 두 번째 compile 은 cache hit (refresh 이면 compile 후 저장), 입력/flag/버전 (버전을 모르면 dx_com 실행 파일) 변경 시 key 변경, LRU 순서대로 eviction
+    - Fail: 불필요한 compile, 잘못된 cache hit, 최근 사용 entry 삭제
+    """
+    work = tmp_path / "dx_com"
+    (work / "sample").mkdir(parents=True)
+    (work / "sample" / "A-1.onnx").write_bytes(b"onnx-a")
+    (work / "sample" / "A-1.json").write_text("{}")
+    cmd = "dx_com/dx_com -m sample/A-1.onnx -c sample/A-1.json -o output/A"
+    cache = CompileCache(tmp_path / "cache", max_bytes=2500)
+
+    compiled = []
+
+    def fake_compile(name="A-1", size=1000):
+        out = work / "output" / "A"
+        out.mkdir(parents=True, exist_ok=True)
+        (out / f"{name}.dxnn").write_bytes(b"x" * size)
+        compiled.append(name)
+        return True
+
+    assert cached_compile(cache, cmd, cwd=work, version="2.0.0", compile_fn=fake_compile) is False
+    (work / "output" / "A" / "A-1.dxnn").unlink()
+    assert cached_compile(cache, cmd, cwd=work, version="2.0.0", compile_fn=fake_compile) is True
+    assert compiled == ["A-1"]
+    assert (work / "output" / "A" / "A-1.dxnn").stat().st_size == 1000
+    # refresh: cache 가 있어도 compile (시간 측정) 하고 결과를 다시 저장
+    assert cached_compile(cache, cmd, cwd=work, version="2.0.0", compile_fn=fake_compile, refresh=True) is False
+    assert compiled == ["A-1", "A-1"]
+    assert cache.restore(cache.key(cmd, work, "2.0.0"), tmp_path / "refreshed") == ["A-1.dxnn"]
+
+    key = cache.key(cmd, work, "2.0.0")
+    assert cache.key(cmd + " --gen_log", work, "2.0.0") != key
+    assert cache.key(cmd, work, "2.1.0") != key
+    assert cache.key(cmd + " --verbose", work, "2.0.0") == key  # 결과에 영향 없는 flag 는 무시
+    (work / "sample" / "A-1.json").write_text('{"calibration_num": 100}')
+    assert cache.key(cmd, work, "2.0.0") != key
+
+    # LRU: key 를 다시 사용하면 최근 사용으로 갱신되어 다른 entry 가 먼저 삭제됨
+    old = cache.entry_path(key)
+    os.utime(old, (1, 1))
+    cached_compile(cache, cmd + " --shrink", cwd=work, version="2.0.0", compile_fn=fake_compile)
+    os.utime(cache.entry_path(cache.key(cmd + " --shrink", work, "2.0.0")), (2, 2))
+    assert cache.restore(key, tmp_path / "restored") == ["A-1.dxnn"]
+    cached_compile(cache, cmd + " --gen_log", cwd=work, version="2.0.0", compile_fn=fake_compile)
+
+    remaining = {entry.name for entry, _, _ in cache.entries()}
+    assert key in remaining and len(remaining) == 2
+    assert cache.key(cmd + " --shrink", work, "2.0.0") not in remaining
+
+    # dx_com 버전을 알 수 없으면 dx_com 실행 파일의 hash 를 key 로 사용, 실행 파일도 없으면 cache 를 사용하지 않음
+    assert cache.key(cmd, work, None) is None
+    compiled.clear()
+    assert cached_compile(cache, cmd, cwd=work, version=None, compile_fn=fake_compile) is False
+    assert cached_compile(cache, cmd, cwd=work, version=None, compile_fn=fake_compile) is False
+    assert compiled == ["A-1", "A-1"]
+    (work / "dx_com").mkdir()
+    (work / "dx_com" / "dx_com").write_bytes(b"dx_com 2.0.0")
+    unknown = cache.key(cmd, work, None)
+    assert unknown is not None and unknown != key
+    (work / "dx_com" / "dx_com").write_bytes(b"dx_com 2.1.0 (upgrade)")
+    assert cache.key(cmd, work, None) != unknown
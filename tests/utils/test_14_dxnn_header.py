@@ -0,0 +1,72 @@
+import json
+import pathlib
+import struct
+import time
+import pytest
+from utils.dxnn import HEADER_SIZE, SIGNATURE, DxnnFormatError, crosscheck, read_header
+
+DATA = pathlib.Path(__file__).parent / "data"
+
+
+def write_dxnn(path, sections, version=7, weight_size=256 * 2**20):
+    """
+    테스트용 dxnn 파일 생성: JSON metadata section 들 뒤에 weight section (sparse, 0 으로 채움)
+    """
+    blobs = {name: json.dumps(value).encode() for name, value in sections.items()}
+    table, offset = {}, 0
+    for name, blob in blobs.items():
+        table[name] = {"offset": offset, "size": len(blob)}
+        offset += len(blob)
+    table["weight"] = {"offset": offset, "size": weight_size}
+
+    header = SIGNATURE + struct.pack("<I", version) + json.dumps({"data": table}).encode()
+    with open(path, "wb") as f:
+        f.write(header.ljust(HEADER_SIZE, b"\0"))
+        for blob in blobs.values():
+            f.write(blob)
+        f.truncate(HEADER_SIZE + offset + weight_size)
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_dxnn_header_read_and_crosscheck(tmp_path):
+    """
+    dxnn header 와 metadata 만 mmap 으로 읽고 (weight 미사용), parse_model 출력과 교차 검증하는지 확인
+    - Pass: 256MB 파일도 빠르게 읽고, 버전/tensor/NPU memory 가 parse_model 출력과 일치, 다르거나 찾지 못하면 mismatch 보고
+    - Fail: 값 누락, 느린 읽기, 잘못된 형식 미검출
+    """
+    model = tmp_path / "YoloV7.dxnn"
+    write_dxnn(model, {
+        "compile_config": {"compiler_version": "2.0.0", "opt_level": 1},
+        "graph_info": {"inputs": [{"name": "images", "dtype": "UINT8", "shape": [1, 640, 640, 3]}],
+                       "outputs": ["output"]},
+        "rmap_info": {"npu_memory_usage": 241984000},
+    })
+
+    start = time.perf_counter()
+    header = read_header(model)
+    assert time.perf_counter() - start < 0.5
+
+    assert header.format_version_str == "v7"
+    assert header.compiler_version == "v2.0.0"
+    assert header.inputs[0].shape == [1, 640, 640, 3] and header.outputs[0].name == "output"
+    assert header.npu_memory_bytes == 241984000
+    assert header.sections["weight"][1] == 256 * 2**20
+
+    parse_model_output = (DATA / "parse_model_yolov7.txt").read_text()
+    assert crosscheck(header, parse_model_output) == []
+    assert crosscheck(header, parse_model_output.replace("v2.0.0", "v1.60.1")) == \
+        ["compiler version: header=v2.0.0, parse_model=v1.60.1"]
+
+    # 아무것도 decode 하지 못한 header 는 통과하지 않음
+    empty = tmp_path / "empty.dxnn"
+    write_dxnn(empty, {}, weight_size=16)
+    header = read_header(empty)
+    assert header.missing_fields() == ["compiler_version", "inputs", "outputs", "npu_memory_bytes"]
+    assert len(crosscheck(header, parse_model_output)) == 4
+
+    broken = tmp_path / "broken.dxnn"
+    broken.write_bytes(b"ONNX" + bytes(100))
+    with pytest.raises(DxnnFormatError):
+        read_header(broken)
@@ -0,0 +1,39 @@
+import pathlib
+import pytest
+from utils.parse_model import parse_model_graph, diff_graph
+
+DATA = pathlib.Path(__file__).parent / "data"
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_parse_model_graph():
+    """
+    parse_model 출력을 task graph 로 변환하고 baseline 과 구조적으로 비교하는지 확인
+    - Pass: task/edge/tensor/byte 수가 올바르게 파싱되고, 변경된 항목만 diff 로 보고됨
+    - Fail: 파싱 값이 다르거나 diff 누락
+    """
+    output = (DATA / "parse_model_yolov7.txt").read_text()
+    graph = parse_model_graph(output)
+
+    assert (graph.format_version, graph.compiler_version) == ("v7", "v2.0.0")
+    assert (graph.inputs, graph.outputs) == (["images"], ["output"])
+    assert [(t.name, t.device) for t in graph.tasks] == [("npu_0", "NPU"), ("cpu_0", "CPU")]
+    assert graph.edges == [("npu_0", "cpu_0")]
+
+    npu = graph.task("npu_0")
+    assert (npu.npu_memory_bytes, npu.input_bytes, npu.output_bytes) == (241984000, 1228800, 8568000)
+    assert npu.inputs[0].shape == [1, 640, 640, 3] and npu.inputs[0].layout == "PRE_IM2COL"
+    assert npu.outputs[2].transpose == "CHANNEL_LAST_TO_FIRST"
+    assert sum(t.nbytes for t in npu.outputs) == npu.output_bytes
+    assert graph.npu_memory_bytes == 241984000
+    assert graph.host_transfer_bytes == 1228800 + 8568000
+
+    # 공백 차이는 무시하고, 바뀐 값만 보고
+    assert diff_graph(parse_model_graph(output.replace("  ", " ")), graph) == []
+    changed = parse_model_graph(output.replace("241,984,000", "250,000,000").replace("[1, 25200, 85 ]", "[1, 25200, 6 ]"))
+    assert diff_graph(graph, changed) == [
+        "npu_0.npu_memory_bytes: expected=241984000, actual=250000000",
+        "cpu_0.outputs.output.shape: expected=[1, 25200, 85], actual=[1, 25200, 6]",
+    ]
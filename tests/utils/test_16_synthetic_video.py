@@ -0,0 +1,39 @@
+import cv2
+import numpy as np
+import pytest
+from utils.synthetic_video import VideoCache, VideoSpec, render_frame
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_synthetic_video_cache(tmp_path):
+    """
+    합성 video 가 같은 parameter 에 대해 같은 frame 을 만들고, 한 번만 생성되어 cache 되는지 확인
+    - Pass: frame 이 결정적, 요청한 해상도/frame 수로 생성, 두 번째 요청은 cache 파일 재사용, parameter 나 encoder 가 다르면 다른 파일
+    - Fail: frame 이 매번 다르거나, 재생성되거나, parameter 가 다른데 같은 파일 사용
+    """
+    spec = VideoSpec(160, 96, fps=10, duration_sec=1, codec="mpeg4", seed=3)
+    assert np.array_equal(render_frame(spec, 5), render_frame(spec, 5))
+    assert not np.array_equal(render_frame(spec, 5), render_frame(spec, 6))
+
+    cache = VideoCache(tmp_path, ffmpeg="")  # ffmpeg 유무와 관계없이 OpenCV 로 생성
+    path = cache.get(spec)
+    assert cache.meta(spec)["encoder"] == "opencv"
+
+    cap = cv2.VideoCapture(str(path))
+    try:
+        size = (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+        frames = 0
+        while cap.read()[0]:
+            frames += 1
+    finally:
+        cap.release()
+    assert size == (160, 96) and frames == spec.frames
+
+    mtime = path.stat().st_mtime_ns
+    assert cache.get(spec) == path and path.stat().st_mtime_ns == mtime
+    other = VideoSpec(160, 96, fps=10, duration_sec=1, codec="mpeg4", seed=4)
+    assert cache.path(other) != path
+    assert VideoCache(tmp_path, ffmpeg="/usr/bin/ffmpeg").path(spec) != path  # encoder 가 다르면 다른 파일
+    assert VideoSpec.from_resolution("1080p").width == 1920
@@ -0,0 +1,97 @@
+import asyncio
+import json
+import pytest
+from utils.rtsp_server import Stream, StreamServer, SyntheticSource, BOUNDARY, uses_camera, uses_local_camera
+
+
+async def _read_frames(port, path, count):
+    """path 에 연결하여 JPEG frame count 개를 읽습니다."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.0\r\n\r\n".encode())
+    status = await reader.readline()
+    while (await reader.readline()) != b"\r\n":
+        pass
+    frames = []
+    while len(frames) < count:
+        assert (await reader.readline()).strip() == b"--" + BOUNDARY
+        headers = {}
+        while (line := await reader.readline()) != b"\r\n":
+            key, _, value = line.decode().partition(":")
+            headers[key.strip().lower()] = value.strip()
+        frames.append(await reader.readexactly(int(headers["content-length"])))
+        await reader.readline()
+    writer.close()
+    return status, frames
+
+
+async def _get(port, path):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.0\r\n\r\n".encode())
+    data = await reader.read()
+    writer.close()
+    return data
+
+
+async def _scenario():
+    streams = [Stream("/video_feed", SyntheticSource(160, 96, fps=50)),
+               Stream("/ch1", SyntheticSource(160, 96, fps=50, seed=1))]
+    server = StreamServer(streams, host="127.0.0.1", port=0)
+    await server.start()
+    try:
+        results = await asyncio.gather(*[_read_frames(server.port, "/video_feed", 10) for _ in range(4)],
+                                       _read_frames(server.port, "/ch1", 10))
+        stats = json.loads((await _get(server.port, "/stats")).split(b"\r\n\r\n", 1)[1])
+        not_found = await _get(server.port, "/nothing")
+    finally:
+        await server.close()
+    return results, stats, not_found
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_stream_server_broadcast():
+    """
+    stream server 가 frame 을 한 번만 encoding 하여 여러 client 에게 같은 bytes 를 보내는지 확인 (camera 없이 합성 source)
+    - Pass: 4 client 가 모두 JPEG frame 을 받고, encoding 수가 전송 수보다 훨씬 적음, stream 별로 다른 frame, 없는 path 는 404
+    - Fail: client 별로 encoding 하거나 frame 을 나눠 가짐, stream 간 섞임
+    """
+    results, stats, not_found = asyncio.run(asyncio.wait_for(_scenario(), 30))
+
+    for status, frames in results:
+        assert status.startswith(b"HTTP/1.0 200") and len(frames) == 10
+        assert all(f[:2] == b"\xff\xd8" for f in frames)  # JPEG SOI
+
+    # 모든 client 가 같은 순서의 frame 을 받음 (나눠 갖지 않음): 공통 frame 이 있어야 함
+    feed = [set(frames) for _, frames in results[:4]]
+    assert set.intersection(*feed)
+    assert not feed[0] & set(results[4][1])
+
+    assert stats["/video_feed"]["sent"] >= 40
+    assert stats["/video_feed"]["encoded"] < stats["/video_feed"]["sent"]
+    assert not_found.startswith(b"HTTP/1.0 404")
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_stream_source_uses_camera(monkeypatch, tmp_path):
+    """
+    source 가 실제 camera 를 사용하는지 (camera lock 필요 여부) 를 판단하는지 확인
+    - Pass: camera:<n> 은 항상 camera, auto 는 /dev/video0 가 있을 때만 camera, file/synthetic 은 camera 아님,
+            cfg_app.yaml section 은 local stream server 를 켜고 camera 를 송출할 때만 camera
+    - Fail: camera 가 없는데 auto 를 camera 로 판단하거나 그 반대
+    """
+    assert uses_camera("camera:1")
+    assert not uses_camera("synthetic:1280x720@30") and not uses_camera("file:boat.mp4")
+    for exists in (True, False):
+        monkeypatch.setattr("utils.rtsp_server.os.path.exists", lambda path: exists)
+        assert uses_camera("auto") == exists
+
+    config_path = tmp_path / "cfg_app.yaml"
+    config_path.write_text(
+        "camera: {enable_local_rtsp_server: 'true', local_stream_source: 'camera:0'}\n"
+        "synthetic: {enable_local_rtsp_server: 'true', local_stream_source: 'synthetic:1280x720@30'}\n"
+        "remote: {enable_local_rtsp_server: 'false', local_stream_source: 'camera:0'}\n", encoding="utf-8")
+    assert uses_local_camera("camera", config_path)
+    assert not uses_local_camera("synthetic", config_path) and not uses_local_camera("remote", config_path)
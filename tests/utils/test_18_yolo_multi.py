@@ -0,0 +1,34 @@
+import json
+import pathlib
+import pytest
+from utils.yolo_multi import make_config, parse_multi_fps, find_knee, MultiFps
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_yolo_multi_config_and_sweep():
+    """
+    yolo_multi config 생성, show_fps 출력 파싱, knee 계산 확인
+    - Pass: 고정 source + video 반복으로 channel 수만큼 생성되고 demo config 와 같은 형식, FPS/knee 가 올바르게 계산됨
+    - Fail: channel 수/형식이 다르거나 FPS/knee 계산 오류
+    """
+    demo = json.loads(pathlib.Path("utils/yolo_multi_1rtsp_35_demo.json").read_text())
+    cfg = make_config(64, videos=["a.mov", "b.mp4"], model_path=demo["model_path"], model_name=demo["model_name"],
+                      fixed=[["http://0.0.0.0:5000/video_feed", "rtsp"]])
+    assert cfg.keys() == demo.keys() and cfg["display_config"] == demo["display_config"]
+    assert len(cfg["video_sources"]) == 64
+    assert cfg["video_sources"][:3] == [["http://0.0.0.0:5000/video_feed", "rtsp"],
+                                        ["a.mov", "offline", 20], ["b.mp4", "offline", 20]]
+
+    # 실제 yolo_multi 출력이 아닌 RE_CHANNEL_FPS / RE_TOTAL_FPS 가 가정한 형식
+    output = "\n".join(
+        [f"[CH {ch}] fps : {v}" for v in (5.0, 20.1, 19.9) for ch in range(4)] + ["Total FPS : 70.0", "Total FPS : 80.0"])
+    fps = parse_multi_fps(output, channels=4)
+    assert fps.per_channel == {0: 20.0, 1: 20.0, 2: 20.0, 3: 20.0}   # warm-up (5.0) 제외 median
+    assert fps.total == 80.0
+
+    results = [MultiFps(1, {0: 20.0}), MultiFps(4, {i: 19.5 for i in range(4)}),
+               MultiFps(8, {i: 20.0 if i else 15.0 for i in range(8)}), MultiFps(16, total=160.0)]
+    assert find_knee(results, source_fps=20) == (4, 8)
+    assert find_knee(results[:2], source_fps=20) == (4, None)
@@ -0,0 +1,85 @@
+import subprocess
+import sys
+import threading
+import time
+import pytest
+from utils.proc_profiler import ProcessProfiler, read_proc
+
+# CPU 를 쓰고, thread 와 파일을 여는 하위 process
+CHILD = """
+import threading, time
+files = [open('/proc/self/status') for _ in range(8)]
+threading.Thread(target=time.sleep, args=(5,), daemon=True).start()
+end = time.time() + 1.0
+while time.time() < end:
+    pass
+"""
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_proc_profiler_children(tmp_path):
+    """
+    profiler 가 실행 방법과 관계없이 하위 process 를 찾아 RSS/CPU/thread/fd 를 측정하는지 확인
+    - Pass: 하위 process 가 summary 에 있고 CPU 사용률 ~100%, thread/fd/RSS 가 기록되며 time series csv 생성,
+            watch 한 process tree 만의 합계를 따로 기록, 처음 본 process 의 CPU% 는 0,
+            sampling 중 watch() 에 안전
+    - Fail: 하위 process 를 못 찾거나 값이 비어있음
+    """
+    assert read_proc(999999999) is None
+
+    with ProcessProfiler(interval=0.1) as profiler:
+        proc = subprocess.run([sys.executable, "-c", CHILD])
+    assert proc.returncode == 0
+
+    child = profiler.processes[next(pid for pid in profiler.processes)]
+    assert child.name.startswith("python")
+    assert child.peak_rss > 0 and child.peak_threads >= 2 and child.peak_fds >= 8
+    assert child.cpu_sec >= 0.5 and child.peak_cpu_percent > 50
+    assert profiler.samples[-1].processes == 0 or profiler.samples[-1].processes == 1
+    assert "python" in profiler.summary_text()
+
+    # 이미 CPU 를 쓰고 있던 process 는 처음 본 sample 에서 CPU% 를 계산하지 않음
+    busy = subprocess.Popen([sys.executable, "-c", CHILD])
+    time.sleep(0.5)
+    profiler = ProcessProfiler(interval=10)
+    assert profiler.sample().cpu_percent == 0
+    time.sleep(0.3)
+    assert profiler.sample().cpu_percent > 50
+    busy.wait()
+
+    # watch 한 process 의 tree 만 따로 기록 (다른 하위 process 제외)
+    with ProcessProfiler(interval=0.1) as profiler:
+        other = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(1.5)"])
+        watched = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(1.5)"])
+        profiler.watch(watched.pid)
+        other.wait()
+        watched.wait()
+    assert max(s.processes for s in profiler.samples) == 2
+    assert max(s.processes for s in profiler.tree_samples(watched.pid)) == 1
+    assert profiler.tree_samples(other.pid) == []
+
+    # sampling 중에 다른 thread 에서 watch() 해도 sampler 가 멈추지 않음
+    concurrent = ProcessProfiler(interval=10)
+    stop = threading.Event()
+    errors = []
+
+    def sample_loop():
+        try:
+            while not stop.is_set():
+                concurrent.sample()
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=sample_loop)
+    thread.start()
+    for pid in range(1_000_000, 1_002_000):
+        concurrent.watch(pid)
+    stop.set()
+    thread.join()
+    assert errors == [] and len(concurrent.trees) == 2000
+
+    path = profiler.write_series(tmp_path / "profile.csv")
+    lines = path.read_text().splitlines()
+    assert lines[0].startswith("timestamp,processes,rss,pss,cpu_percent") and len(lines) > 5
@@ -0,0 +1,64 @@
+import pytest
+from utils.leak import analyze, fit_trend, LeakWatch
+from utils.proc_profiler import ProfileSample
+from utils.process_monitor import MonitorResult
+
+
+def make_samples(duration, rss_mb, fds=20, interval=1.0):
+    """rss_mb(t) 함수로 ProfileSample list 를 만듭니다. (t: 초)"""
+    return [
+        ProfileSample(timestamp=1000 + t, processes=1, rss=int(rss_mb(t) * 2**20), pss=0, cpu_percent=50.0,
+                      threads=8, fds=fds, ctxt_switches=0, read_bytes=0, write_bytes=0)
+        for t in (i * interval for i in range(int(duration / interval)))
+    ]
+
+
+class FakeProfiler:
+    """pid 별 tree sample 만 가진 ProcessProfiler 대역"""
+
+    def __init__(self, trees):
+        self.trees = trees
+
+    def tree_samples(self, pid):
+        return self.trees.get(pid, [])
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_leak_analysis():
+    """
+    warm-up 이후 RSS 추세로 leak 을 판정하는지 확인
+    - Pass: warm-up 중 증가와 잡음은 무시, 꾸준한 증가 (3 MB/min) 만 leak, 구간이 짧으면 분석하지 않음,
+            실행한 command 의 process tree 만 분석
+    - Fail: 정상 app 을 leak 으로 판정, leak 을 놓침, 다른 process 의 증가로 판정
+    """
+    slope, r2 = fit_trend([0, 1, 2, 3], [1, 3, 5, 7])
+    assert slope == pytest.approx(2) and r2 == pytest.approx(1)
+
+    limits = {"rss_mb": 2.0, "fds": 1.0}
+    # 처음 20초 동안 model load 로 300MB 까지 증가한 뒤 ±5MB 로 흔들림 -> 정상
+    healthy = make_samples(120, lambda t: min(t, 20) * 15 + (5 if int(t) % 2 else -5))
+    assert not any(r.leaked for r in analyze(healthy, limits))
+
+    # warm-up 이후 3 MB/min 으로 꾸준히 증가 -> leak
+    leaking = make_samples(300, lambda t: 300 + t * 3 / 60 + (0.5 if int(t) % 2 else -0.5))
+    results = {r.metric: r for r in analyze(leaking, limits)}
+    assert results["rss_mb"].leaked and results["rss_mb"].slope_per_min == pytest.approx(3, rel=0.05)
+    assert not results["fds"].leaked
+    assert "LEAK" in str(results["rss_mb"])
+
+    # smoke (짧은 실행) 는 분석하지 않음
+    assert analyze(make_samples(30, lambda t: t * 10), limits) == []
+
+    cfg = {"warmup_sec": 20, "min_window_sec": 30, "min_r2": 0.5,
+           "limits_per_min": limits, "soak_limits_per_min": {"rss_mb": 0.05}}
+    run = MonitorResult(command=["app"], pid=100)
+    assert LeakWatch(None, cfg).check(run) == []
+    assert LeakWatch(None, cfg, soak_sec=3600).duration(60) == 3600
+
+    # app (pid 100) 의 process tree 만 분석, 다른 fixture process 의 증가는 무시
+    profiler = FakeProfiler({100: healthy, 200: leaking})
+    LeakWatch(profiler, cfg).assert_no_leak(run)
+    with pytest.raises(AssertionError, match="leak 감지"):
+        LeakWatch(profiler, cfg).assert_no_leak(MonitorResult(command=["helper"], pid=200))
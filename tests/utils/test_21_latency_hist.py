@@ -0,0 +1,51 @@
+import random
+import pytest
+from utils.latency_hist import LatencyHistogram, merge_files, histogram_path, fleet_files
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_latency_histogram(tmp_path):
+    """
+    latency histogram 의 percentile 정확도, 병합, 저장/불러오기 확인
+    - Pass: percentile 오차 1% 이내, sample 이 부족한 percentile 은 None, process 별 histogram 병합 결과가 전체 기록과 같고, 모든 session 의 파일을 찾아 병합
+    - Fail: percentile 이 틀리거나 병합/저장 후 분포가 달라짐
+    """
+    rng = random.Random(0)
+    # 대부분 ~10ms, 1% 는 40~80ms 의 tail
+    values = [rng.gauss(10, 1) if rng.random() > 0.01 else rng.uniform(40, 80) for _ in range(20000)]
+    values = [max(v, 0.1) for v in values]
+
+    whole = LatencyHistogram()
+    parts = [LatencyHistogram() for _ in range(4)]
+    for i, v in enumerate(values):
+        whole.record(v)
+        parts[i % 4].record(v)
+
+    ordered = sorted(values)
+    for p in (50, 90, 99, 99.9):
+        exact = ordered[max(0, int(len(ordered) * p / 100 + 0.999999) - 1)]
+        assert whole.percentile(p) == pytest.approx(exact, rel=0.01)
+    assert whole.summary()["max_ms"] == pytest.approx(max(values), abs=0.001)
+    assert whole.summary()["count"] == len(values)
+
+    # process 별 histogram 을 저장하고 모든 session 에서 찾아 병합
+    for session, hist in zip(["s1", "s1", "s2", "s3"], parts):
+        hist.save(histogram_path(tmp_path / session, "YoloV7", "-n 1", f"w{id(hist)}"))
+    files = fleet_files(tmp_path, "YoloV7", "-n 1")
+    assert len(files) == 4
+    assert merge_files(files).summary() == whole.summary()
+    assert merge_files([]) is None
+
+    # sample 이 적으면 tail percentile 은 보고하지 않음 (3 개의 process 평균으로 p99.9 == max 가 되지 않도록)
+    few = LatencyHistogram()
+    for v in (10.0, 12.0, 30.0):
+        few.record(v)
+    summary = few.summary()
+    assert (summary["count"], summary["min_ms"], summary["max_ms"]) == (3, 10.0, 30.0)
+    assert summary["p50_ms"] is None and summary["p99_9_ms"] is None
+    assert whole.summary()["p99_9_ms"] is not None
+
+    with pytest.raises(ValueError):
+        LatencyHistogram().merge(LatencyHistogram(significant_digits=3))
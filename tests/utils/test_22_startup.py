@@ -0,0 +1,50 @@
+import json
+import sys
+import pytest
+from utils.process_monitor import supervise
+from utils.startup import (RESULT_PATTERN, StartupResult, StartupTrial, model_files, drop_page_cache,
+                           warm_page_cache)
+
+# 모델 load 후 결과를 출력하고 계속 실행되는 app
+SLOW_START_APP = """
+import time
+print("[DXAPP] [INFO] loading model", flush=True)
+time.sleep(0.3)
+print("[DXAPP] [INFO] fps : 29.8", flush=True)
+time.sleep(60)
+"""
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_startup_measurement(tmp_path):
+    """
+    startup 측정에 필요한 model 파일 찾기, page cache 조작, 첫 결과 직후 종료, median 계산 확인
+    - Pass: 인자 / json config 의 .dxnn 을 모두 찾고, 첫 결과 출력 직후 (60초를 기다리지 않고) 반환
+    - Fail: model 파일을 놓치거나 첫 결과 이후에도 계속 실행됨
+    """
+    (tmp_path / "assets").mkdir()
+    for name in ("a.dxnn", "b.dxnn"):
+        (tmp_path / "assets" / name).write_bytes(b"\0" * 4096)
+    config = {"model": {"path": "assets/b.dxnn"}, "apps": [{"model_path": "assets/a.dxnn"}, "assets/none.dxnn"]}
+    (tmp_path / "app.json").write_text(json.dumps(config))
+
+    models = model_files("bin/yolo -m assets/a.dxnn -c app.json -v x.mp4", cwd=tmp_path)
+    assert [p.name for p in models] == ["a.dxnn", "b.dxnn"]
+    drop_page_cache(models)
+    warm_page_cache(models)
+
+    run = supervise([sys.executable, "-c", SLOW_START_APP], duration=60, first_frame=RESULT_PATTERN,
+                    stop_on_first_frame=True, stop_timeout=5)
+    assert 0.25 < run.time_to_first_frame < 5
+    assert run.time_to_first_output < run.time_to_first_frame
+    assert run.elapsed < 10 and run.failure is None
+    assert RESULT_PATTERN.search("[sample/ILSVRC2012/1.jpeg] Top1 Result : class 321 (admiral)")
+
+    result = StartupResult("yolo", "bin/yolo ...", "cold", 2 * 4096,
+                           [StartupTrial(0.1, 1.2), StartupTrial(0.2, 0.9), StartupTrial(0.1, None, "timeout")])
+    row = result.to_row()
+    assert row["first_result_sec"] == pytest.approx(1.05)
+    assert row["first_output_sec"] == pytest.approx(0.1)
+    assert row["failures"] == 1
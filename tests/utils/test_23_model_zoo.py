@@ -0,0 +1,45 @@
+import csv
+import json
+import pathlib
+import pytest
+from utils.model_zoo import ZooEntry, leaderboard, write_leaderboard
+from utils.parse_model import parse_model_graph
+from utils.run_model import RunModelResult
+
+DATA = pathlib.Path(__file__).parent / "data"
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_model_zoo_leaderboard(tmp_path):
+    """
+    run_model / parse_model 결과로 mode 별 FPS 순위 leaderboard 를 JSON/CSV/HTML 로 저장하는지 확인
+    - Pass: mode 별 FPS 내림차순 순위, NPU memory 와 FPS/MB 계산, 세 형식의 내용이 같음
+    - Fail: 순위/값이 틀리거나 파일이 누락됨
+    """
+    graph = parse_model_graph((DATA / "parse_model_yolov7.txt").read_text(encoding="utf-8"))
+    runs = {
+        ("YOLOV5S_3", "default"): RunModelResult("YOLOV5S_3", "-l 300", fps=410.0, latency_ms=7.1, npu_time_ms=2.3),
+        ("YOLOv7_512", "default"): RunModelResult("YOLOv7_512", "-l 300", fps=180.0, latency_ms=15.2, npu_time_ms=5.4),
+        ("YOLOV5S_3", "single"): RunModelResult("YOLOV5S_3", "--single", fps=120.0, latency_ms=8.0),
+        ("YOLOv7_512", "single"): RunModelResult("YOLOv7_512", "--single"),
+    }
+    entries = [ZooEntry.from_results(model, mode, run, graph, 2**20 * 30) for (model, mode), run in runs.items()]
+
+    rows = leaderboard(entries)
+    assert [(r["mode"], r["rank"], r["model"]) for r in rows] == [
+        ("default", 1, "YOLOV5S_3"), ("default", 2, "YOLOv7_512"),
+        ("single", 1, "YOLOV5S_3"), ("single", 2, "YOLOv7_512"),
+    ]
+    assert rows[0]["npu_memory_mb"] == round(graph.npu_memory_bytes / 2**20, 2)
+    assert rows[0]["fps_per_npu_mb"] == round(410.0 / rows[0]["npu_memory_mb"], 2)
+    assert rows[0]["file_mb"] == 30
+    assert rows[3]["fps"] is None and rows[3]["fps_per_npu_mb"] is None
+
+    json_path, csv_path, html_path = write_leaderboard(entries, tmp_path)
+    assert json.loads(json_path.read_text()) == rows
+    with open(csv_path, newline="") as f:
+        assert [r["model"] for r in csv.DictReader(f)] == [r["model"] for r in rows]
+    page = html_path.read_text()
+    assert page.count("<tr>") == len(rows) + 1 and "YOLOv7_512" in page
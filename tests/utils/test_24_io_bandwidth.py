@@ -0,0 +1,43 @@
+import pathlib
+import pytest
+from utils.io_bandwidth import IoOverhead, pcie_link, link_bandwidth_mbps, host_platform
+from utils.parse_model import parse_model_graph
+
+DATA = pathlib.Path(__file__).parent / "data"
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_io_overhead_model():
+    """
+    일반 / --skip-io FPS 와 parse_model 의 전송 byte 로 전송 시간, 비율, 유효 대역폭을 계산하는지 확인
+    - Pass: YoloV7 (1,228,800 in + 8,568,000 out) 기준 계산값 일치, 전송이 숨겨진 경우 대역폭 None
+    - Fail: 계산 오류 또는 dxrt-cli -s / dxtop 출력에서 PCIe link 를 읽지 못함
+    """
+    graph = parse_model_graph((DATA / "parse_model_yolov7.txt").read_text(encoding="utf-8"))
+    assert graph.host_transfer_bytes == 1_228_800 + 8_568_000
+
+    link = pcie_link((DATA / "dxrt_cli_status.txt").read_text(encoding="utf-8"))
+    assert link == (3, 4)
+    assert pcie_link((DATA / "dxtop_stream.bin").read_text(encoding="utf-8", errors="replace")) == link
+    assert pcie_link("PCIe Driver version : v1.4.1") is None
+    assert link_bandwidth_mbps(link) == pytest.approx(3938.4)
+
+    # 50 FPS (20ms) -> --skip-io 62.5 FPS (16ms): inference 한 번에 4ms 전송
+    overhead = IoOverhead("YoloV7", graph.host_transfer_bytes, fps=50, fps_skip_io=62.5,
+                          latency_ms=40.0, latency_skip_io_ms=35.5, link=link)
+    assert overhead.io_ms == pytest.approx(4.0)
+    assert overhead.io_share == pytest.approx(0.2)
+    assert overhead.bandwidth_mbps == pytest.approx(2449.2)
+    row = overhead.to_row()
+    assert row["pcie_link"] == "Gen3 x4"
+    assert row["latency_io_ms"] == pytest.approx(4.5)
+    assert row["link_utilization"] == pytest.approx(2449.2 / 3938.4, abs=1e-3)
+
+    # 전송이 compute 에 모두 숨겨지면 전송 시간 0, 대역폭은 계산하지 않음
+    hidden = IoOverhead("YoloV7", graph.host_transfer_bytes, fps=250, fps_skip_io=248)
+    assert hidden.io_ms == 0 and hidden.io_share == 0
+    assert hidden.bandwidth_mbps is None and hidden.to_row()["link_utilization"] is None
+
+    assert set(host_platform()) == {"host", "arch", "cpu"}
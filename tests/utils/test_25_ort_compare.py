@@ -0,0 +1,31 @@
+import pytest
+from utils.ort_compare import CpuRun, cpu_sets, cores_needed
+
+
+@pytest.mark.smoke
+@pytest.mark.normal
+@pytest.mark.stress
+def test_ort_cpu_scaling():
+    """
+    taskset CPU 목록 생성, inference 당 CPU 시간 계산, host CPU 가 병목이 되지 않는 최소 core 수 계산 확인
+    - Pass: 사용할 수 없는 core 수는 제외, ORT 는 CPU 를 더 쓰고 더 많은 core 가 필요하다고 판정
+    - Fail: CPU 목록이나 계산값이 틀림
+    """
+    assert cpu_sets([1, 2, 8, 0], available={4, 5, 6, 7}) == {1: "4", 2: "4,5", 4: "4,5,6,7"}
+    assert cpu_sets([1])  # 현재 process 의 affinity 사용
+
+    runs = [
+        CpuRun("YoloV7", "npu", 1, fps=240, latency_ms=30, wall_sec=10, cpu_sec=6),
+        CpuRun("YoloV7", "npu", 2, fps=250, latency_ms=28, wall_sec=10, cpu_sec=7),
+        CpuRun("YoloV7", "npu", 4, fps=252, latency_ms=28, wall_sec=10, cpu_sec=7),
+        CpuRun("YoloV7", "ort", 1, fps=60, latency_ms=90, wall_sec=10, cpu_sec=10),
+        CpuRun("YoloV7", "ort", 2, fps=115, latency_ms=50, wall_sec=10, cpu_sec=19.5),
+        CpuRun("YoloV7", "ort", 4, fps=200, latency_ms=35, wall_sec=10, cpu_sec=36),
+    ]
+    row = runs[4].to_row()
+    assert row["cpu_cores_used"] == pytest.approx(1.95)
+    assert row["cpu_util"] == pytest.approx(0.975)
+    assert row["cpu_ms_per_inference"] == pytest.approx(19.5 * 1000 / 1150, abs=1e-3)
+
+    assert cores_needed(runs) == {("YoloV7", "npu"): 1, ("YoloV7", "ort"): 4}
+    assert cores_needed([CpuRun("m", "ort", 1, None, None, 10, 1)]) == {("m", "ort"): None}
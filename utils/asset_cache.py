@@ -0,0 +1,213 @@
+import errno
+import hashlib
+import json
+import os
+import pathlib
+import shutil
+from dataclasses import dataclass, field
+
+import yaml
+
+
+def sha256_file(path, bufsize=1024 * 1024):
+    """파일의 SHA-256 (hex) 를 계산합니다."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(bufsize), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def link_or_copy(src, dst):
+    """src 를 dst 로 hard-link 합니다. (다른 filesystem 이면 copy)"""
+    dst = pathlib.Path(dst)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dst.with_name(f".{dst.name}.tmp")
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(src, tmp)
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+            raise
+        shutil.copy2(src, tmp)
+    os.replace(tmp, dst)
+
+
+class HashIndex:
+    """
+    파일 경로별 (mtime, size, SHA-256) 를 json 으로 저장해두고,
+    mtime 과 size 가 그대로인 파일은 hash 를 다시 계산하지 않습니다.
+    """
+
+    def __init__(self, path):
+        self.path = pathlib.Path(path)
+        self._index = None
+
+    @property
+    def index(self):
+        if self._index is None:
+            try:
+                self._index = json.loads(self.path.read_text(encoding="utf-8"))
+            except (FileNotFoundError, ValueError):
+                self._index = {}
+        return self._index
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.index, indent=1, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def file_hash(self, path):
+        """파일의 SHA-256, mtime 과 size 가 index 와 같으면 저장된 값을 사용합니다."""
+        path = pathlib.Path(path).resolve()
+        st = path.stat()
+        key = str(path)
+        entry = self.index.get(key)
+        if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            return entry["sha256"]
+        sha = sha256_file(path)
+        self.index[key] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": sha}
+        return sha
+
+
+@dataclass
+class SyncResult:
+    """AssetCache.sync() 결과"""
+    verified: list = field(default_factory=list)  # 이미 올바른 내용으로 존재
+    linked: list = field(default_factory=list)    # cache 에서 hard-link 로 복구
+    ingested: list = field(default_factory=list)  # manifest 에 없지만 존재하는 파일을 cache 에 저장
+    updated: list = field(default_factory=list)   # 내용이 manifest 와 달라 새 내용으로 cache / manifest 갱신
+    missing: list = field(default_factory=list)   # 존재하지 않고 cache / remote 에도 없음 (다운로드 필요)
+    paths: dict = field(default_factory=dict)     # {파일 이름: 절대 경로}
+
+
+class AssetCache:
+    """
+    SHA-256 기반 content-addressed asset (model, video) cache
+    - object : <root>/objects/<sha[:2]>/<sha>
+    - manifest : <root>/manifests/<group>.yaml ({파일 이름: {sha256, size}})
+    - stat index : <root>/index.json (HashIndex)
+    - remote : 같은 구조의 다른 cache 디렉토리 (예: NFS 로 공유되는 디렉토리), 없으면 None
+    """
+
+    def __init__(self, root, remote=None):
+        self.root = pathlib.Path(root).expanduser()
+        self.remote = AssetCache(remote) if remote else None
+        self.hashes = HashIndex(self.root / "index.json")
+
+    # --- object / manifest ---
+    def object_path(self, sha):
+        return self.root / "objects" / sha[:2] / sha
+
+    def manifest_path(self, group):
+        return self.root / "manifests" / f"{group}.yaml"
+
+    def load_manifest(self, group):
+        path = self.manifest_path(group)
+        if not path.exists():
+            return None
+        return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+
+    def save_manifest(self, group, manifest):
+        path = self.manifest_path(group)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(yaml.safe_dump(manifest, sort_keys=True), encoding="utf-8")
+
+    def file_hash(self, path):
+        return self.hashes.file_hash(path)
+
+    # --- 가져오기 ---
+    def _fetch(self, sha):
+        """
+        object 가 local cache 에 없으면 remote 에서 복사해 옵니다. 성공하면 True
+        - app 파일과 hard-link 된 object 는 app 쪽에서 내용이 바뀌었을 수 있으므로 hash 를 다시 확인합니다.
+          (mtime/size 가 그대로면 HashIndex 의 값을 사용)
+        """
+        obj = self.object_path(sha)
+        if obj.exists():
+            if self.file_hash(obj) == sha:
+                return True
+            obj.unlink()
+        if self.remote is None or not self.remote.object_path(sha).exists():
+            return False
+        obj.parent.mkdir(parents=True, exist_ok=True)
+        tmp = obj.with_name(f".{sha}.tmp")
+        shutil.copyfile(self.remote.object_path(sha), tmp)
+        if sha256_file(tmp) != sha:
+            tmp.unlink()
+            raise ValueError(f"remote object 가 손상되었습니다: {self.remote.object_path(sha)}")
+        os.replace(tmp, obj)
+        return True
+
+    def _manifest(self, group):
+        """local manifest, 없으면 remote manifest 를 가져와 사용합니다."""
+        manifest = self.load_manifest(group)
+        if manifest is None and self.remote is not None:
+            manifest = self.remote.load_manifest(group)
+            if manifest is not None:
+                self.save_manifest(group, manifest)
+        return manifest or {}
+
+    def sync(self, group, directory, expected_files):
+        """
+        directory 의 expected_files 를 manifest 와 비교하여 복구합니다.
+        - 내용이 manifest 와 같으면 그대로 사용 (변경된 파일만 hash 계산)
+        - 내용이 다르면 새 SDK / setup.sh 로 의도적으로 바뀐 것으로 보고 새 내용을 cache 에 저장하고 manifest 를 갱신
+          (이전 내용으로 되돌리지 않음, 손상된 파일은 지우고 다시 실행하면 cache 에서 복구됨)
+        - 없으면 cache (또는 remote) 의 object 를 hard-link
+        - manifest 에 없는 파일은 존재하면 그대로 cache 에 저장 (처음 실행 / cache 가 지워진 runner)
+        - 존재하지 않고 cache 에서도 복구할 수 없으면 missing 으로 반환
+        """
+        directory = pathlib.Path(directory)
+        manifest = self._manifest(group)
+        result = SyncResult()
+
+        for name in expected_files:
+            target = directory / name
+            result.paths[name] = target
+            entry = manifest.get(name)
+            if entry is None:
+                (result.ingested if target.is_file() else result.missing).append(name)
+                continue
+            if target.is_file():
+                if target.stat().st_size == entry["size"] and self.file_hash(target) == entry["sha256"]:
+                    result.verified.append(name)
+                else:
+                    result.updated.append(name)
+                continue
+            if not self._fetch(entry["sha256"]):
+                result.missing.append(name)
+                continue
+            link_or_copy(self.object_path(entry["sha256"]), target)
+            self.file_hash(target)
+            result.linked.append(name)
+
+        if result.ingested or result.updated:
+            self.ingest(group, directory, result.ingested + result.updated)
+        self.hashes.save()
+        return result
+
+    def ingest(self, group, directory, files):
+        """
+        directory 의 files 를 cache object 로 저장하고 manifest 를 갱신합니다.
+        - 다운로드(setup.sh) 직후처럼 실제 파일이 올바르다고 가정할 수 있을 때 사용합니다.
+        - object 는 복사본으로 저장합니다. (app 파일이 나중에 덮어써져도 object 는 바뀌지 않도록)
+        """
+        directory = pathlib.Path(directory)
+        manifest = self._manifest(group)
+        for name in files:
+            path = directory / name
+            if not path.is_file():
+                continue
+            sha = self.file_hash(path)
+            obj = self.object_path(sha)
+            if not obj.exists():
+                obj.parent.mkdir(parents=True, exist_ok=True)
+                tmp = obj.with_name(f".{sha}.tmp")
+                shutil.copyfile(path, tmp)
+                os.replace(tmp, obj)
+            manifest[name] = {"sha256": sha, "size": path.stat().st_size}
+        self.save_manifest(group, manifest)
+        self.hashes.save()
+        return manifest
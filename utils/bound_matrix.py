@@ -0,0 +1,119 @@
+import itertools
+import statistics
+from dataclasses import dataclass, field
+
+
+# run_model -n (NPU bounding) 옵션별로 사용되는 NPU core
+# 0: NPU_ALL
+# 1: NPU_0
+# 2: NPU_1
+# 3: NPU_2
+# 4: NPU_0/1
+# 5: NPU_1/2
+# 6: NPU_0/2
+BOUND_CORES = {
+    0: frozenset({0, 1, 2}),
+    1: frozenset({0}),
+    2: frozenset({1}),
+    3: frozenset({2}),
+    4: frozenset({0, 1}),
+    5: frozenset({1, 2}),
+    6: frozenset({0, 2}),
+}
+BOUND_NAMES = {0: "ALL", 1: "0", 2: "1", 3: "2", 4: "0/1", 5: "1/2", 6: "0/2"}
+
+
+def layouts(max_processes=3, options=tuple(BOUND_CORES)):
+    """
+    동시에 실행할 run_model 들의 -n 옵션 조합(layout)을 모두 반환합니다.
+    - 1 ~ max_processes 개 process, 순서만 다른 조합은 제외
+    - 같은 core 를 여러 process 가 나눠 쓰는 (oversubscribed) 조합도 포함합니다.
+    """
+    return [
+        combo
+        for n in range(1, max_processes + 1)
+        for combo in itertools.combinations_with_replacement(options, n)
+    ]
+
+
+def is_oversubscribed(layout):
+    """두 개 이상의 process 가 같은 NPU core 를 사용하면 True"""
+    used = [core for opt in layout for core in BOUND_CORES[opt]]
+    return len(used) != len(set(used))
+
+
+def layout_name(layout):
+    """예: (1, 5) -> 'NPU_0 + NPU_1/2'"""
+    return " + ".join(f"NPU_{BOUND_NAMES[opt]}" for opt in layout)
+
+
+@dataclass
+class LayoutResult:
+    """한 layout 의 측정 결과"""
+    layout: tuple
+    fps: list                                    # process 별 FPS
+    core_util: dict = field(default_factory=dict)  # {core: 평균 Util(%)}
+
+    @property
+    def aggregate_fps(self):
+        return sum(f or 0.0 for f in self.fps)
+
+    @property
+    def oversubscribed(self):
+        return is_oversubscribed(self.layout)
+
+    def efficiency(self, reference_fps):
+        """NPU_ALL 단일 process FPS 대비 aggregate FPS 비율"""
+        return self.aggregate_fps / reference_fps if reference_fps else None
+
+    def to_row(self, reference_fps=None):
+        efficiency = self.efficiency(reference_fps)
+        return {
+            "layout": layout_name(self.layout),
+            "options": " ".join(f"-n {opt}" for opt in self.layout),
+            "processes": len(self.layout),
+            "oversubscribed": self.oversubscribed,
+            "fps": " ".join(f"{f:.2f}" if f is not None else "-" for f in self.fps),
+            "aggregate_fps": round(self.aggregate_fps, 2),
+            "efficiency": round(efficiency, 3) if efficiency is not None else None,
+            **{f"util_core_{core}": round(util, 1) for core, util in sorted(self.core_util.items())},
+        }
+
+
+def mean_core_util(samples, cores=(0, 1, 2)):
+    """dxtop sample 들에서 core 별 평균 Util 을 계산합니다. (Util 이 0 인 구간 포함)"""
+    util = {}
+    for core in cores:
+        values = [s.util for s in samples if s.core == core and s.util is not None]
+        util[core] = statistics.fmean(values) if values else 0.0
+    return util
+
+
+def reference_fps(results):
+    """scaling efficiency 기준: NPU_ALL(-n 0) 단일 process 의 FPS"""
+    for result in results:
+        if result.layout == (0,):
+            return result.aggregate_fps
+    return None
+
+
+def matrix_report(results):
+    """
+    layout 별 결과를 aggregate FPS 순으로 정렬한 markdown 표를 반환합니다.
+    - 가장 높은 aggregate FPS 를 낸 layout 을 첫 줄에 추천합니다.
+    """
+    ref = reference_fps(results)
+    rows = [r.to_row(ref) for r in sorted(results, key=lambda r: r.aggregate_fps, reverse=True)]
+    if not rows:
+        return "측정 결과 없음\n"
+
+    columns = list(rows[0])
+    lines = [
+        f"Best layout: {rows[0]['layout']} ({rows[0]['aggregate_fps']} FPS, "
+        f"efficiency vs NPU_ALL: {rows[0]['efficiency']})",
+        "",
+        "| " + " | ".join(columns) + " |",
+        "|" + "---|" * len(columns),
+    ]
+    lines += ["| " + " | ".join(str(row.get(c, "")) for c in columns) + " |" for row in rows]
+    return "\n".join(lines) + "\n"
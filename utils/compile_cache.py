@@ -0,0 +1,144 @@
+import hashlib
+import json
+import os
+import pathlib
+import shlex
+import shutil
+import time
+
+from utils.asset_cache import HashIndex
+from utils.dx_com import parse_compile_command
+
+# compile 결과에 영향을 주는 dx_com flag (cache key 에 포함)
+KEY_FLAGS = ("--gen_log", "--shrink")
+
+
+class CompileCache:
+    """
+    dx_com compile 결과(.dxnn, main_log.bin 등)를 저장하는 content-addressed cache
+    - key : SHA-256(ONNX 내용, calibration JSON 내용, KEY_FLAGS, dx_com 버전)
+            dx_com 버전을 알 수 없으면 dx_com 실행 파일의 SHA-256 을 대신 사용 (upgrade 후 이전 결과를 쓰지 않도록)
+    - 저장 : <root>/entries/<key>/ (출력 파일들 + meta.json)
+    - 전체 크기가 max_bytes 를 넘으면 가장 오래 사용하지 않은 entry 부터 삭제 (LRU)
+    - dx_com 이 기존 출력 파일을 덮어써도 cache 가 바뀌지 않도록 hard-link 가 아닌 copy 를 사용합니다.
+    """
+
+    def __init__(self, root, max_bytes=20 * 2**30):
+        self.root = pathlib.Path(root).expanduser()
+        self.max_bytes = max_bytes
+        self.hashes = HashIndex(self.root / "index.json")
+
+    def key(self, cmd_str, cwd, version):
+        """
+        compile 명령(cwd 기준 상대 경로)과 compiler 버전으로 cache key 를 만듭니다.
+        - version 이 None 이고 dx_com 실행 파일도 찾을 수 없으면 None (cache 를 사용하지 않음)
+        """
+        onnx, calib, _, flags = parse_compile_command(cmd_str)
+        cwd = pathlib.Path(cwd)
+        if version is None:
+            binary = compiler_binary(cmd_str, cwd)
+            if binary is None:
+                return None
+            version = f"sha256:{self.hashes.file_hash(binary)}"
+        parts = {
+            "onnx": self.hashes.file_hash(cwd / onnx),
+            "json": self.hashes.file_hash(cwd / calib) if calib else None,
+            "flags": sorted(f for f in flags if f in KEY_FLAGS),
+            "version": version,
+        }
+        self.hashes.save()
+        return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+    def entry_path(self, key):
+        return self.root / "entries" / key
+
+    def restore(self, key, out_dir):
+        """
+        cache 에 key 가 있으면 출력 파일들을 out_dir 로 복사하고 파일 이름 list 를 반환합니다.
+        없으면 None
+        """
+        entry = self.entry_path(key)
+        meta_path = entry / "meta.json"
+        if not meta_path.exists():
+            return None
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        pathlib.Path(out_dir).mkdir(parents=True, exist_ok=True)
+        for name in meta["files"]:
+            shutil.copy2(entry / name, pathlib.Path(out_dir) / name)
+        os.utime(entry)  # LRU: 마지막 사용 시간 갱신
+        return meta["files"]
+
+    def store(self, key, out_dir, meta=None):
+        """out_dir 의 파일들을 key 로 저장한 뒤 LRU eviction 을 실행합니다."""
+        entry = self.entry_path(key)
+        files = sorted(p.name for p in pathlib.Path(out_dir).iterdir() if p.is_file())
+
+        tmp = entry.with_name(f".{key}.{os.getpid()}.tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+        for name in files:
+            shutil.copy2(pathlib.Path(out_dir) / name, tmp / name)
+        (tmp / "meta.json").write_text(
+            json.dumps({**(meta or {}), "files": files, "created": time.time()}, indent=1), encoding="utf-8")
+
+        shutil.rmtree(entry, ignore_errors=True)
+        os.replace(tmp, entry)
+        self.evict()
+        return files
+
+    def entries(self):
+        """(entry 경로, 크기, 마지막 사용 시간) list"""
+        root = self.root / "entries"
+        if not root.exists():
+            return []
+        result = []
+        for entry in root.iterdir():
+            if entry.name.startswith("."):
+                continue
+            size = sum(p.stat().st_size for p in entry.iterdir() if p.is_file())
+            result.append((entry, size, entry.stat().st_mtime))
+        return result
+
+    def evict(self):
+        """전체 크기가 max_bytes 이하가 될 때까지 오래된 entry 를 삭제하고, 삭제한 entry 이름 list 를 반환합니다."""
+        entries = sorted(self.entries(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        evicted = []
+        for entry, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            evicted.append(entry.name)
+        return evicted
+
+
+def compiler_binary(cmd_str, cwd):
+    """compile 명령의 dx_com 실행 파일 경로 (cwd 기준 또는 PATH), 없으면 None"""
+    program = shlex.split(cmd_str)[0]
+    path = pathlib.Path(cwd) / program
+    if path.is_file():
+        return path
+    found = shutil.which(program)
+    return pathlib.Path(found) if found else None
+
+
+def cached_compile(cache, cmd_str, *, cwd, version, compile_fn, refresh=False):
+    """
+    cache 에 compile 결과가 있으면 -o 디렉토리로 복구하고, 없으면 compile_fn() 을 실행한 뒤 저장합니다.
+    - compile_fn 은 성공 여부(bool)를 반환해야 합니다. 실패한 결과는 저장하지 않습니다.
+    - cache key 를 만들 수 없으면 (dx_com 버전을 알 수 없음) cache 없이 compile 합니다.
+    - refresh 이면 cache 에 있어도 compile 하고 (compile 시간 측정 등) 결과를 다시 저장합니다.
+    - 반환: cache hit 이면 True
+    """
+    _, _, out_dir, _ = parse_compile_command(cmd_str)
+    out_dir = pathlib.Path(cwd) / out_dir
+    key = cache.key(cmd_str, cwd, version)
+    if key is None:
+        compile_fn()
+        return False
+    if not refresh and cache.restore(key, out_dir) is not None:
+        return True
+    if compile_fn():
+        cache.store(key, out_dir, meta={"command": cmd_str, "version": version})
+    return False
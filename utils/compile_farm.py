@@ -0,0 +1,172 @@
+import pathlib
+import shlex
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional
+
+from utils.dx_com import compile_model, parse_compile_command
+
+
+def available_memory_mb():
+    """/proc/meminfo 의 MemAvailable (MB)"""
+    with open("/proc/meminfo", encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("MemAvailable:"):
+                return int(line.split()[1]) / 1024
+    raise RuntimeError("/proc/meminfo 에 MemAvailable 이 없습니다.")
+
+
+def history_stats(history_rows):
+    """
+    compile 이력 (ResultStore.read() 결과)에서 model 별 {peak_rss_mb, wall_sec} 를 계산합니다.
+    - peak RSS 는 최대값 (보수적으로), wall time 은 serial 로 실행된 compile 의 median 을 사용합니다.
+    """
+    stats = {}
+    models = history_rows.get("model", [])
+    concurrent = history_rows.get("concurrent_jobs", [""] * len(models))
+    for i, model in enumerate(models):
+        if history_rows["returncode"][i] != "0":
+            continue
+        entry = stats.setdefault(model, {"peak_rss_mb": [], "wall_sec": []})
+        entry["peak_rss_mb"].append(float(history_rows["peak_rss_mb"][i]))
+        if concurrent[i] in ("", "1"):
+            entry["wall_sec"].append(float(history_rows["wall_sec"][i]))
+
+    result = {}
+    for model, v in stats.items():
+        result[model] = {"peak_rss_mb": max(v["peak_rss_mb"])}
+        if v["wall_sec"]:
+            result[model]["wall_sec"] = statistics.median(v["wall_sec"])
+    return result
+
+
+@dataclass
+class CompileJob:
+    """compile farm 에서 실행할 dx_com 명령 하나"""
+    command: str
+    dxnn_path: str            # cwd 기준 출력 dxnn 경로
+    model: str
+    projected_rss_mb: float = 0.0
+    concurrent_jobs: int = 0  # 이 job 이 실행되는 동안 같이 실행된 job 수의 최대값 (자기 포함)
+
+
+def make_job(cmd_str, output_root):
+    """
+    dx_com 명령의 -o 를 job 별 디렉토리 (<output_root>/<model>) 로 바꿔서 CompileJob 을 만듭니다.
+    - 동시에 실행되는 job 들이 같은 출력 디렉토리를 쓰지 않도록 합니다.
+    """
+    onnx, _, _, _ = parse_compile_command(cmd_str)
+    model = pathlib.Path(onnx).stem
+    out_dir = f"{output_root}/{model}"
+
+    args = shlex.split(cmd_str)
+    if "-o" in args:
+        args[args.index("-o") + 1] = out_dir
+    else:
+        args += ["-o", out_dir]
+    return CompileJob(shlex.join(args), f"{out_dir}/{model}.dxnn", model)
+
+
+@dataclass
+class FarmReport:
+    """compile farm 실행 결과"""
+    results: list = field(default_factory=list)   # CompileResult (job 순서)
+    runs: list = field(default_factory=list)      # MeasuredRun (job 순서)
+    wall_sec: float = 0.0
+    serial_sec: Optional[float] = 0.0   # 순서대로 실행했을 때의 예상 시간, 알 수 없으면 None
+    max_concurrent: int = 0
+    budget_mb: float = 0.0
+
+    @property
+    def speedup(self):
+        return self.serial_sec / self.wall_sec if self.serial_sec is not None and self.wall_sec else None
+
+    def to_row(self):
+        return {
+            "jobs": len(self.results),
+            "wall_sec": round(self.wall_sec, 3),
+            "serial_sec": round(self.serial_sec, 3) if self.serial_sec is not None else None,
+            "speedup": round(self.speedup, 2) if self.speedup else None,
+            "max_concurrent": self.max_concurrent,
+            "budget_mb": round(self.budget_mb),
+        }
+
+
+class CompileFarm:
+    """
+    여러 dx_com compile 을 동시에 실행합니다. (compile 자체는 별도 process, thread 는 감시만 함)
+    - 새 job 은 실행 중인 job 들의 예상 peak RSS 합 + 새 job 의 예상 peak RSS 가 memory budget 안에 들어갈 때만 시작
+    - 예상 peak RSS 는 model 별 compile 이력의 최대값, 이력이 없으면 default_rss_mb
+    - 실행 중인 job 이 없으면 budget 을 넘더라도 한 개는 실행합니다. (멈추지 않도록)
+    - serial speedup 은 모든 model 에 serial 실행 이력 (wall_sec) 이 있을 때만 계산합니다.
+    """
+
+    def __init__(self, max_workers=4, budget_mb=None, headroom=0.8, default_rss_mb=8192, history=None):
+        self.max_workers = max_workers
+        self.budget_mb = budget_mb if budget_mb is not None else available_memory_mb() * headroom
+        self.default_rss_mb = default_rss_mb
+        self.history = history or {}
+        self._cond = threading.Condition()
+        self._reserved_mb = 0.0
+        self._running = []
+        self._max_concurrent = 0
+
+    def projected_rss_mb(self, model):
+        return self.history.get(model, {}).get("peak_rss_mb", self.default_rss_mb)
+
+    def _admit(self, job):
+        with self._cond:
+            self._cond.wait_for(lambda: not self._running
+                                or self._reserved_mb + job.projected_rss_mb <= self.budget_mb)
+            self._reserved_mb += job.projected_rss_mb
+            self._running.append(job)
+            for running in self._running:
+                running.concurrent_jobs = max(running.concurrent_jobs, len(self._running))
+            self._max_concurrent = max(self._max_concurrent, len(self._running))
+
+    def _release(self, job):
+        with self._cond:
+            self._reserved_mb -= job.projected_rss_mb
+            self._running.remove(job)
+            self._cond.notify_all()
+
+    def _run(self, job, cwd, version, timeout):
+        self._admit(job)
+        try:
+            return compile_model(job.command, cwd=cwd, dxnn_path=job.dxnn_path, version=version, timeout=timeout)
+        finally:
+            self._release(job)
+
+    def run(self, jobs, *, cwd, version=None, timeout=None):
+        """
+        jobs 를 실행하고 FarmReport 를 반환합니다.
+        - 메모리를 많이 쓰는 job 부터 시작하여 마지막에 큰 job 하나만 남는 상황을 줄입니다.
+        """
+        for job in jobs:
+            job.projected_rss_mb = self.projected_rss_mb(job.model)
+            job.concurrent_jobs = 0
+        order = sorted(jobs, key=lambda j: j.projected_rss_mb, reverse=True)
+
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {id(job): pool.submit(self._run, job, cwd, version, timeout) for job in order}
+            outcomes = [futures[id(job)].result() for job in jobs]
+        wall = time.monotonic() - start
+
+        report = FarmReport(wall_sec=wall, max_concurrent=self._max_concurrent, budget_mb=self.budget_mb)
+        for job, (result, run) in zip(jobs, outcomes):
+            result.concurrent_jobs = job.concurrent_jobs
+            report.results.append(result)
+            report.runs.append(run)
+            # 병렬 실행 시간은 다른 job 과 경쟁한 시간이므로 serial 추정에 쓰지 않습니다.
+            serial = self.history.get(job.model, {}).get("wall_sec")
+            if serial is None and job.concurrent_jobs == 1:
+                serial = run.wall_sec
+            if serial is None or report.serial_sec is None:
+                report.serial_sec = None
+            else:
+                report.serial_sec += serial
+        return report
@@ -0,0 +1,88 @@
+import os
+import pathlib
+import shlex
+from dataclasses import dataclass, asdict
+from datetime import datetime
+
+from utils.procfs import run_measured
+from utils.result_store import ResultStore
+
+
+# compiler 버전별 compile 측정 이력 (session 과 관계없이 누적): results/dx_com_history/compile-<version>.csv
+HISTORY_SESSION = "dx_com_history"
+
+
+def compiler_version(com_base_path):
+    """dx-compiler 의 compiler.properties 에서 COM_VERSION 값을 읽습니다. 없으면 None"""
+    path = pathlib.Path(com_base_path) / "compiler.properties"
+    if not path.exists():
+        return None
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if line.strip().startswith("COM_VERSION="):
+            return line.split("=", 1)[1].strip()
+    return None
+
+
+def parse_compile_command(cmd_str):
+    """'dx_com -m a.onnx -c a.json -o out --shrink' -> (onnx, json, output dir, 추가 flag list)"""
+    args = shlex.split(cmd_str)[1:]
+    values, flags = {}, []
+    i = 0
+    while i < len(args):
+        if args[i] in ("-m", "-c", "-o") and i + 1 < len(args):
+            values[args[i]] = args[i + 1]
+            i += 2
+        else:
+            flags.append(args[i])
+            i += 1
+    return values.get("-m"), values.get("-c"), values.get("-o"), flags
+
+
+@dataclass
+class CompileResult:
+    """dx_com compile 한 번의 측정 결과"""
+    model: str
+    compiler_version: str
+    flags: str
+    wall_sec: float
+    user_sec: float
+    sys_sec: float
+    peak_rss_mb: float
+    dxnn_bytes: int
+    returncode: int
+    timed_out: bool = False
+    timestamp: str = ""
+    concurrent_jobs: int = 1  # 같이 실행된 compile 수 (1: serial)
+
+    def to_row(self):
+        return asdict(self)
+
+
+def compile_model(cmd_str, *, cwd, dxnn_path, version=None, timeout=None, env=None):
+    """
+    dx_com compile 을 실행하며 wall/user/sys 시간, process tree 의 peak RSS, 출력 .dxnn 크기를 측정합니다.
+    - 반환: (CompileResult, MeasuredRun)
+    """
+    onnx, _, _, flags = parse_compile_command(cmd_str)
+    env = {**os.environ, "LC_ALL": "C", **(env or {})}
+    run = run_measured(shlex.split(cmd_str), cwd=cwd, env=env, timeout=timeout)
+    dxnn = pathlib.Path(cwd) / dxnn_path
+    result = CompileResult(
+        model=pathlib.Path(onnx).stem if onnx else "",
+        compiler_version=version or "",
+        flags=" ".join(flags),
+        wall_sec=round(run.wall_sec, 3),
+        user_sec=round(run.user_sec, 3),
+        sys_sec=round(run.sys_sec, 3),
+        peak_rss_mb=round(run.peak_rss / 2**20, 1),
+        dxnn_bytes=dxnn.stat().st_size if run.returncode == 0 and dxnn.exists() else 0,
+        returncode=run.returncode,
+        timed_out=run.timed_out,
+        timestamp=datetime.now().isoformat(timespec="seconds"),
+    )
+    return result, run
+
+
+def history_store(root="results"):
+    """compiler 버전별 compile 이력을 저장하는 ResultStore (table: compile-<version>)"""
+    return ResultStore(root, session=HISTORY_SESSION)
@@ -0,0 +1,161 @@
+import json
+import mmap
+import pathlib
+import struct
+from dataclasses import dataclass, field
+from typing import Optional
+
+from utils.parse_model import parse_model_graph
+
+
+# .dxnn 파일 구조 (가정)
+# - 공식 문서도, 이 repo 에 실제 model 파일도 없으므로 아래 구조 (특히 HEADER_SIZE 와 JSON header) 는 확인되지 않은 가정입니다.
+# - 실제 장비에서 test_dxnn_header_crosscheck (tests/rt) 로 parse_model 출력과 비교하여 확인해야 합니다.
+#   확인 전까지 이 구조에 의존하는 장비 test 는 benchmark (opt-in) 로만 실행합니다.
+#   [0:4]    signature "DXNN"
+#   [4:8]    format version (uint32, little endian)
+#   [8:...]  JSON header (NUL 종료), {"data": {<section>: {"offset": .., "size": ..}, ...}, ...}
+#   [HEADER_SIZE + offset : + size]  section 데이터 (weight / rmap 등은 읽지 않음)
+SIGNATURE = b"DXNN"
+HEADER_SIZE = 8192
+# 작은 JSON metadata section 들만 decode 합니다.
+META_SECTIONS = ("compile_config", "graph_info", "rmap_info")
+
+
+class DxnnFormatError(ValueError):
+    """.dxnn 파일 형식이 예상과 다를 때 발생"""
+
+
+@dataclass
+class TensorInfo:
+    name: str
+    dtype: Optional[str] = None
+    shape: Optional[list] = None
+
+
+@dataclass
+class DxnnHeader:
+    """.dxnn 파일의 header / metadata"""
+    path: str
+    format_version: int
+    sections: dict                      # {section 이름: (절대 offset, size)}
+    compiler_version: Optional[str] = None
+    inputs: list = field(default_factory=list)    # TensorInfo
+    outputs: list = field(default_factory=list)
+    npu_memory_bytes: Optional[int] = None
+    metadata: dict = field(default_factory=dict)  # decode 한 META_SECTIONS
+
+    @property
+    def format_version_str(self):
+        """parse_model 출력과 같은 형식 (예: 'v7')"""
+        return f"v{self.format_version}"
+
+    def missing_fields(self):
+        """header 에서 decode 하지 못한 항목 이름 list (구조 가정이 틀리면 여기에 나타남)"""
+        values = {
+            "compiler_version": self.compiler_version,
+            "inputs": self.inputs,
+            "outputs": self.outputs,
+            "npu_memory_bytes": self.npu_memory_bytes,
+        }
+        return [name for name, value in values.items() if value in (None, [])]
+
+
+def _find(obj, keys):
+    """중첩된 dict/list 에서 keys 중 하나의 이름을 가진 첫 번째 값을 찾습니다."""
+    if isinstance(obj, dict):
+        for key in keys:
+            if key in obj:
+                return obj[key]
+        children = obj.values()
+    elif isinstance(obj, list):
+        children = obj
+    else:
+        return None
+    for child in children:
+        found = _find(child, keys)
+        if found is not None:
+            return found
+    return None
+
+
+def _tensors(items):
+    """['images', ...] 또는 [{'name': .., 'dtype': .., 'shape': ..}, ...] 를 TensorInfo list 로 변환"""
+    tensors = []
+    for item in items or []:
+        if isinstance(item, str):
+            tensors.append(TensorInfo(item))
+        elif isinstance(item, dict) and "name" in item:
+            tensors.append(TensorInfo(item["name"], item.get("dtype") or item.get("data_type"), item.get("shape")))
+    return tensors
+
+
+def _json_at(buf, start, end):
+    """buf[start:end] 의 JSON 을 decode 합니다. (NUL padding 제거)"""
+    raw = bytes(buf[start:end]).split(b"\0", 1)[0]
+    try:
+        return json.loads(raw)
+    except ValueError as e:
+        raise DxnnFormatError(f"JSON 을 decode 할 수 없습니다 ({start}:{end}): {e}")
+
+
+def read_header(path):
+    """
+    .dxnn 파일을 mmap 하여 header 와 작은 metadata section 만 decode 합니다.
+    - weight 등 큰 section 은 읽지 않으므로 파일 크기와 관계없이 빠르게 끝납니다.
+    """
+    path = pathlib.Path(path)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        if len(buf) < 8 or buf[:4] != SIGNATURE:
+            raise DxnnFormatError(f"DXNN signature 가 없습니다: {path}")
+        (version,) = struct.unpack_from("<I", buf, 4)
+        header = _json_at(buf, 8, min(HEADER_SIZE, len(buf)))
+
+        sections = {}
+        for name, info in (header.get("data") or {}).items():
+            offset, size = HEADER_SIZE + int(info["offset"]), int(info["size"])
+            if offset + size > len(buf):
+                raise DxnnFormatError(f"section '{name}' 이 파일 크기를 넘습니다: {path}")
+            sections[name] = (offset, size)
+
+        metadata = {
+            name: _json_at(buf, sections[name][0], sections[name][0] + sections[name][1])
+            for name in META_SECTIONS if name in sections and sections[name][1] > 0
+        }
+
+    source = {"header": header, **metadata}
+    compiler = _find(source, ("compiler_version", "compilerVersion", "COM_VERSION"))
+    npu_memory = _find(source, ("npu_memory_usage", "npu_memory", "model_memory_size"))
+    return DxnnHeader(
+        path=str(path),
+        format_version=version,
+        sections=sections,
+        compiler_version=f"v{str(compiler).lstrip('v')}" if compiler else None,
+        inputs=_tensors(_find(source, ("inputs", "input_tensors"))),
+        outputs=_tensors(_find(source, ("outputs", "output_tensors"))),
+        npu_memory_bytes=int(npu_memory) if npu_memory is not None else None,
+        metadata=metadata,
+    )
+
+
+def crosscheck(header, parse_model_output):
+    """
+    read_header() 결과를 parse_model 출력과 비교하여 다른 항목의 list 를 반환합니다. (같으면 빈 list)
+    - header 에서 찾지 못한 값(None/빈 list)도 mismatch 로 보고합니다. (아무것도 decode 하지 못한 reader 가 통과하지 않도록)
+    - parse_model 출력에 없는 값은 비교하지 않습니다.
+    """
+    graph = parse_model_graph(parse_model_output)
+    mismatches = []
+
+    def _check(name, ours, theirs):
+        if ours in (None, []):
+            mismatches.append(f"{name}: header 에서 찾지 못함, parse_model={theirs}")
+        elif theirs not in (None, []) and ours != theirs:
+            mismatches.append(f"{name}: header={ours}, parse_model={theirs}")
+
+    _check("format version", header.format_version_str, graph.format_version)
+    _check("compiler version", header.compiler_version, graph.compiler_version)
+    _check("inputs", [t.name for t in header.inputs], graph.inputs)
+    _check("outputs", [t.name for t in header.outputs], graph.outputs)
+    _check("NPU memory", header.npu_memory_bytes, graph.npu_memory_bytes or None)
+    return mismatches
@@ -0,0 +1,218 @@
+import csv
+import json
+import os
+import pathlib
+import re
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, asdict, fields
+from typing import Optional
+
+
+# dxtop TUI 출력에서 제거할 ANSI escape sequence (색상, 커서 이동 등)
+RE_ANSI = re.compile(rb"\x1B\[[0-9;?]*[ -/]*[@-~]|\x1B[()][0-9A-Za-z]|\x1B[=>78]")
+# 화면 갱신 시 사용되는 특수 공백 문자들
+SPACES = str.maketrans({"\r": " ", "\u00A0": " ", "\u202F": " ", "\u2009": " "})
+
+RE_VERSIONS = {
+    "DX_RT": re.compile(r"DX-RT:\s*(v\d+\.\d+\.\d+)", re.I),
+    "RT_DRIVER": re.compile(r"NPU Device driver:\s*(v\d+\.\d+\.\d+)", re.I),
+    "DX_TOP": re.compile(r"DX-TOP:\s*(v\d+\.\d+\.\d+)", re.I),
+}
+# 'Core #:0' 부터 다음 'Core #:' 전까지를 한 core 의 정보로 봅니다.
+RE_CORE = re.compile(r"Core\s*#?\s*:?\s*(\d+)(.*?)(?=Core\s*#?\s*:?\s*\d|$)", re.I)
+RE_UTIL = re.compile(r"Util:\D*?([\d.]+)\s*%", re.I)
+RE_TEMP = re.compile(r"Temp:\D*(\d+)", re.I)
+RE_VOLTAGE = re.compile(r"Voltage:\D*(\d+)", re.I)
+RE_CLOCK = re.compile(r"Clock:\D*(\d+)", re.I)
+
+
+@dataclass
+class DxtopSample:
+    """dxtop 화면에서 읽은 NPU core 하나의 측정값"""
+    timestamp: float
+    core: int
+    util: Optional[float] = None
+    temp_c: Optional[int] = None
+    voltage_mv: Optional[int] = None
+    clock_mhz: Optional[int] = None
+
+
+def _search(pattern, text, cast):
+    m = pattern.search(text)
+    return cast(m.group(1)) if m else None
+
+
+class DxtopParser:
+    """
+    dxtop 의 byte stream 을 incremental 하게 파싱하여 DxtopSample 을 만듭니다.
+    - chunk 경계에 걸친 line / escape sequence 는 다음 chunk 와 합쳐서 처리합니다.
+    - DX-RT / NPU driver / DX-TOP 버전은 versions 에 저장됩니다.
+    """
+
+    def __init__(self):
+        self.versions = {}
+        self._pending = b""
+
+    def feed(self, data, timestamp=None):
+        """byte chunk 를 입력받아 완성된 line 에서 찾은 DxtopSample list 를 반환합니다."""
+        timestamp = time.time() if timestamp is None else timestamp
+        lines = (self._pending + data).split(b"\n")
+        self._pending = lines.pop()
+
+        samples = []
+        for raw in lines:
+            samples += self._parse_line(raw, timestamp)
+        return samples
+
+    def flush(self, timestamp=None):
+        """마지막 line 까지 처리합니다. (stream 종료 시)"""
+        raw, self._pending = self._pending, b""
+        return self._parse_line(raw, time.time() if timestamp is None else timestamp)
+
+    def _parse_line(self, raw, timestamp):
+        line = RE_ANSI.sub(b" ", raw).decode(errors="replace").translate(SPACES)
+
+        for key, pattern in RE_VERSIONS.items():
+            if key not in self.versions:
+                m = pattern.search(line)
+                if m:
+                    self.versions[key] = m.group(1)
+
+        samples = []
+        for m in RE_CORE.finditer(line):
+            body = m.group(2)
+            sample = DxtopSample(
+                timestamp=timestamp,
+                core=int(m.group(1)),
+                util=_search(RE_UTIL, body, float),
+                temp_c=_search(RE_TEMP, body, int),
+                voltage_mv=_search(RE_VOLTAGE, body, int),
+                clock_mhz=_search(RE_CLOCK, body, int),
+            )
+            if any(v is not None for v in (sample.util, sample.temp_c, sample.voltage_mv, sample.clock_mhz)):
+                samples.append(sample)
+        return samples
+
+
+def frames(samples):
+    """
+    core 별 sample 들을 화면 갱신(frame) 단위로 묶어 {core: DxtopSample} list 로 반환합니다.
+    - 이미 나온 core 번호가 다시 나오면 새로운 frame 으로 봅니다.
+    """
+    result = []
+    current = {}
+    for sample in samples:
+        if sample.core in current:
+            result.append(current)
+            current = {}
+        current[sample.core] = sample
+    if current:
+        result.append(current)
+    return result
+
+
+def write_series(samples, path):
+    """
+    sample 들을 time series 파일로 저장합니다. 확장자로 형식을 결정합니다.
+    - .csv / .jsonl : 추가 package 없이 저장
+    - .parquet      : pyarrow 가 설치되어 있어야 합니다.
+    """
+    path = pathlib.Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    columns = [f.name for f in fields(DxtopSample)]
+    rows = [asdict(s) for s in samples]
+
+    if path.suffix == ".csv":
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(rows)
+    elif path.suffix == ".jsonl":
+        with open(path, "w", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row) + "\n")
+    elif path.suffix == ".parquet":
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("parquet 로 저장하려면 'pip install pyarrow' 가 필요합니다.")
+        pq.write_table(pa.table({c: [r[c] for r in rows] for c in columns}), path)
+    else:
+        raise ValueError(f"지원하지 않는 형식입니다: {path.suffix}")
+    return path
+
+
+class DxtopSampler:
+    """
+    dxtop 을 background thread 에서 실행하며 DxtopSample 을 계속 수집합니다.
+    사용법:
+        with DxtopSampler() as sampler:
+            ... (benchmark 실행)
+        sampler.samples
+    """
+
+    def __init__(self, command=("dxtop",)):
+        self.command = list(command)
+        self.parser = DxtopParser()
+        self.samples = []
+        self._proc = None
+        self._thread = None
+
+    @property
+    def versions(self):
+        return self.parser.versions
+
+    def start(self):
+        self._proc = subprocess.Popen(self.command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0)
+        self._thread = threading.Thread(target=self._read, daemon=True)
+        self._thread.start()
+        return self
+
+    def _read(self):
+        fd = self._proc.stdout.fileno()
+        while True:
+            data = os.read(fd, 65536)
+            if not data:
+                break
+            self.samples += self.parser.feed(data)
+        self.samples += self.parser.flush()
+
+    def since(self, timestamp, skip_frames=0):
+        """
+        timestamp 이후에 수집된 sample 들
+        - skip_frames: 앞쪽 frame 을 버릴 수. dxtop 의 Util 은 갱신 주기 동안의 평균이므로 timestamp 직후의 첫 frame 에는
+          timestamp 이전 (예: 이전 option 의 run_model) 의 부하가 섞여 있습니다.
+        """
+        samples = [s for s in self.samples if s.timestamp >= timestamp]
+        if not skip_frames:
+            return samples
+        return [s for frame in frames(samples)[skip_frames:] for s in frame.values()]
+
+    def wait_for(self, predicate, timeout):
+        """predicate(samples) 가 참이 되거나 timeout 이 지날 때까지 기다립니다."""
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if predicate(self.samples):
+                return True
+            time.sleep(0.1)
+        return predicate(self.samples)
+
+    def stop(self):
+        if self._proc and self._proc.poll() is None:
+            self._proc.terminate()
+            try:
+                self._proc.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+                self._proc.wait()
+        if self._thread:
+            self._thread.join(timeout=2)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
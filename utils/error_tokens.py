@@ -0,0 +1,110 @@
+import re
+from dataclasses import dataclass
+
+# 오류 문자열 심각도 (값이 클수록 심각)
+WARNING = 1
+ERROR = 2
+FATAL = 3
+
+# 모든 module 에 공통으로 적용되는 오류 문자열
+COMMON_TOKENS = {
+    "dxrt-exception": ERROR,
+    "Error:": ERROR,
+    "terminate called after throwing": FATAL,
+}
+
+# module 별 오류 문자열 (app / rt / com / st), 새 오류 문자열은 여기에만 추가합니다.
+MODULE_TOKENS = {
+    "app": {
+        "can't open camera": ERROR,
+        "File not found exception": ERROR,
+        "can't open/read file": ERROR,
+        "could not be opened": ERROR,
+    },
+    "rt": {},
+    "com": {},
+    "st": {
+        "can't open camera": ERROR,
+        "ERROR:": ERROR,
+        "File not found exception": ERROR,
+        "can't open/read file": ERROR,
+        "could not be opened": ERROR,
+    },
+}
+
+
+@dataclass
+class TokenHit:
+    """출력에서 발견된 오류 문자열"""
+    token: str
+    severity: int
+    offset: int  # 전체 stream 기준 위치
+
+
+def tokens(module, min_severity=ERROR):
+    """module 에 적용되는 {token: severity} 를 반환합니다."""
+    if module not in MODULE_TOKENS:
+        raise KeyError(f"Unknown module: '{module}'")
+    merged = {**COMMON_TOKENS, **MODULE_TOKENS[module]}
+    return {tok: sev for tok, sev in merged.items() if sev >= min_severity}
+
+
+class TokenMatcher:
+    """여러 오류 문자열을 하나의 정규식으로 compile 하여 한 번의 scan 으로 찾습니다."""
+
+    def __init__(self, token_map):
+        if not isinstance(token_map, dict):
+            token_map = {tok: ERROR for tok in token_map}
+        self.token_map = token_map
+        self.max_len = max((len(t) for t in token_map), default=0)
+        # 긴 token 을 먼저 두어 겹치는 token 중 더 구체적인 것이 선택되도록 합니다.
+        alternation = "|".join(re.escape(t) for t in sorted(token_map, key=len, reverse=True))
+        self._regex = re.compile(alternation) if token_map else None
+
+    def finditer(self, text, pos=0):
+        """text[pos:] 에서 발견된 모든 token 을 (token, start, end) 로 반환합니다."""
+        if self._regex is None:
+            return
+        for m in self._regex.finditer(text, pos):
+            yield m.group(0), m.start(), m.end()
+
+    def search(self, text):
+        """text 에서 처음 발견된 token 을 반환합니다. 없으면 None"""
+        if self._regex is None:
+            return None
+        m = self._regex.search(text)
+        return m.group(0) if m else None
+
+    def scanner(self):
+        return StreamScanner(self)
+
+
+class StreamScanner:
+    """
+    chunk 단위로 들어오는 출력을 scan 합니다.
+    - 이전 chunk 의 마지막 (가장 긴 token 길이 - 1) 글자를 이어 붙여 chunk 경계에 걸친 token 도 찾습니다.
+    - 이미 보고한 token 은 다시 보고하지 않습니다.
+    """
+
+    def __init__(self, matcher):
+        self.matcher = matcher
+        self._carry = ""
+        self._consumed = 0  # 지금까지 들어온 전체 글자 수
+
+    def feed(self, chunk):
+        text = self._carry + chunk
+        base = self._consumed - len(self._carry)
+        hits = [
+            TokenHit(tok, self.matcher.token_map[tok], base + start)
+            for tok, start, end in self.matcher.finditer(text)
+            if end > len(self._carry)  # carry 안에서 끝나는 token 은 이전 chunk 에서 이미 보고됨
+        ]
+        keep = max(self.matcher.max_len - 1, 0)
+        self._carry = text[-keep:] if keep else ""
+        self._consumed += len(chunk)
+        return hits
+
+
+def matcher(module, min_severity=ERROR):
+    """module 의 오류 문자열을 compile 한 TokenMatcher 를 반환합니다."""
+    return TokenMatcher(tokens(module, min_severity))
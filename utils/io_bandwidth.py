@@ -0,0 +1,105 @@
+import platform
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+from utils.procfs import PROC
+
+
+# PCIe 세대별 lane 하나의 한 방향 유효 대역폭 (MB/s, encoding overhead 제외)
+PCIE_LANE_MBPS = {1: 250.0, 2: 500.0, 3: 984.6, 4: 1969.2, 5: 3938.5}
+
+# dxrt-cli -s / dxtop 의 link 정보 (예: 'PCIe   : Gen3 X4 [02:00:00]', 'PCIe Gen3 x4')
+RE_PCIE_LINK = re.compile(r"PCIe\s*:?\s*Gen\s*(\d)\s*x\s*(\d+)", re.I)
+
+
+def pcie_link(text):
+    """출력에서 PCIe link 의 (세대, lane 수), 없으면 None"""
+    m = RE_PCIE_LINK.search(text)
+    return (int(m.group(1)), int(m.group(2))) if m else None
+
+
+def link_bandwidth_mbps(link):
+    """(세대, lane 수) link 의 이론 대역폭 (MB/s), 알 수 없으면 None"""
+    if not link or link[0] not in PCIE_LANE_MBPS:
+        return None
+    return PCIE_LANE_MBPS[link[0]] * link[1]
+
+
+def host_platform():
+    """결과를 host 별로 구분하기 위한 {host, arch, cpu}"""
+    cpu = ""
+    try:
+        for line in (PROC / "cpuinfo").read_text().splitlines():
+            key, _, value = line.partition(":")
+            # x86: 'model name', ARM: 'Hardware' / 'CPU part' 중 먼저 나오는 값
+            if key.strip() in ("model name", "Hardware", "Model"):
+                cpu = value.strip()
+                break
+    except OSError:
+        pass
+    return {"host": platform.node(), "arch": platform.machine(), "cpu": cpu}
+
+
+@dataclass
+class IoOverhead:
+    """
+    run_model 의 일반 실행과 --skip-io 실행을 비교한 host <-> NPU 전송 overhead
+    - inference 한 번의 전송 시간 = 1/FPS 차이 (처리량 기준, compute 와 겹쳐서 숨겨진 전송은 포함되지 않음)
+    - 유효 대역폭 = parse_model 의 NPU task input + output byte / 전송 시간
+    """
+    model: str
+    transfer_bytes: int
+    fps: Optional[float]
+    fps_skip_io: Optional[float]
+    latency_ms: Optional[float] = None
+    latency_skip_io_ms: Optional[float] = None
+    link: Optional[tuple] = None          # (세대, lane 수)
+
+    @property
+    def io_ms(self):
+        """inference 한 번에 추가되는 전송 시간 (ms), 전송이 모두 숨겨지면 0"""
+        if not self.fps or not self.fps_skip_io:
+            return None
+        return max(0.0, 1000 / self.fps - 1000 / self.fps_skip_io)
+
+    @property
+    def io_share(self):
+        """inference 한 번의 시간 중 전송이 차지하는 비율 (0~1)"""
+        return self.io_ms * self.fps / 1000 if self.io_ms is not None else None
+
+    @property
+    def bandwidth_mbps(self):
+        """유효 host <-> NPU 대역폭 (MB/s), 전송 시간이 0 이면 None"""
+        if not self.io_ms:
+            return None
+        return self.transfer_bytes / 1e6 / (self.io_ms / 1000)
+
+    @property
+    def link_utilization(self):
+        """PCIe link 이론 대역폭 대비 유효 대역폭"""
+        link_mbps = link_bandwidth_mbps(self.link)
+        if not link_mbps or self.bandwidth_mbps is None:
+            return None
+        return self.bandwidth_mbps / link_mbps
+
+    def to_row(self):
+        def r(value, digits=3):
+            return round(value, digits) if value is not None else None
+
+        latency_io = (self.latency_ms - self.latency_skip_io_ms
+                      if self.latency_ms is not None and self.latency_skip_io_ms is not None else None)
+        return {
+            "model": self.model,
+            "transfer_bytes": self.transfer_bytes,
+            "fps": self.fps,
+            "fps_skip_io": self.fps_skip_io,
+            "io_ms": r(self.io_ms),
+            "io_share": r(self.io_share),
+            "bandwidth_mbps": r(self.bandwidth_mbps, 1),
+            "latency_ms": self.latency_ms,
+            "latency_skip_io_ms": self.latency_skip_io_ms,
+            "latency_io_ms": r(latency_io),
+            "pcie_link": f"Gen{self.link[0]} x{self.link[1]}" if self.link else "",
+            "link_utilization": r(self.link_utilization),
+        }
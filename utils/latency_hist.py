@@ -0,0 +1,164 @@
+import array
+import base64
+import json
+import math
+import pathlib
+import zlib
+
+# report 에 사용하는 percentile
+PERCENTILES = (50, 90, 99, 99.9)
+
+# percentile p 를 보고하려면 p 보다 큰 sample 이 이만큼은 있어야 합니다. (적으면 p99.9 == max 가 됨)
+TAIL_SAMPLES = 10
+
+
+def min_count(p):
+    """percentile p 를 보고하기 위한 최소 sample 수 (p50: 20, p90: 100, p99: 1000, p99.9: 10000)"""
+    return math.ceil(TAIL_SAMPLES * 100 / (100 - p) - 1e-9)
+
+
+class LatencyHistogram:
+    """
+    HDR histogram 방식의 latency 분포 (고정 메모리, 병합 가능)
+    - 값은 µs 정수로 저장, 상대 오차는 10^-significant_digits 이내
+    - bucket b 는 [2^b * half, 2^(b+1) * half) 구간을 half 개의 같은 폭 sub-bucket 으로 나눕니다. (log-linear)
+    - 같은 설정의 histogram 끼리는 count 배열을 더해서 병합합니다. (process / session 간 병합)
+    """
+
+    def __init__(self, highest_us=60_000_000, significant_digits=2):
+        self.highest_us = highest_us
+        self.significant_digits = significant_digits
+        self.sub_bits = math.ceil(math.log2(2 * 10 ** significant_digits))
+        self.sub_count = 1 << self.sub_bits
+        self.half = self.sub_count // 2
+        self.counts = array.array("Q", bytes(8 * (self._index(highest_us) + 1)))
+        self.total = 0
+        self.sum_us = 0
+        self.min_us = None
+        self.max_us = None
+
+    # --- bucket index ---
+    def _index(self, value):
+        shift = max(0, value.bit_length() - self.sub_bits)
+        return shift * self.half + (value >> shift)
+
+    def _range(self, index):
+        """index 의 (최소값, 최대값) µs"""
+        shift = 0 if index < self.sub_count else index // self.half - 1
+        sub = index - shift * self.half
+        return sub << shift, ((sub + 1) << shift) - 1
+
+    # --- 기록 ---
+    def record_us(self, value, count=1):
+        value = min(max(int(value), 0), self.highest_us)
+        self.counts[self._index(value)] += count
+        self.total += count
+        self.sum_us += value * count
+        self.min_us = value if self.min_us is None else min(self.min_us, value)
+        self.max_us = value if self.max_us is None else max(self.max_us, value)
+
+    def record(self, value_ms, count=1):
+        self.record_us(round(value_ms * 1000), count)
+
+    def merge(self, other):
+        if (other.highest_us, other.significant_digits) != (self.highest_us, self.significant_digits):
+            raise ValueError("설정(highest_us, significant_digits)이 다른 histogram 은 병합할 수 없습니다.")
+        for i, count in enumerate(other.counts):
+            if count:
+                self.counts[i] += count
+        self.total += other.total
+        self.sum_us += other.sum_us
+        for attr, pick in (("min_us", min), ("max_us", max)):
+            values = [v for v in (getattr(self, attr), getattr(other, attr)) if v is not None]
+            setattr(self, attr, pick(values) if values else None)
+        return self
+
+    # --- 조회 ---
+    def percentile(self, p):
+        """p (0~100) percentile (ms), 같은 bucket 의 값들은 구간의 최대값으로 보고합니다. (보수적)"""
+        if not self.total:
+            return None
+        target = max(1, math.ceil(self.total * p / 100))
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self._range(i)[1], self.max_us) / 1000
+        return self.max_us / 1000
+
+    @property
+    def mean(self):
+        return self.sum_us / self.total / 1000 if self.total else None
+
+    def summary(self):
+        """
+        {count, mean_ms, min_ms, p50_ms, p90_ms, p99_ms, p99_9_ms, max_ms}
+        - sample 수가 min_count(p) 보다 적은 percentile 은 None
+        """
+        row = {
+            "count": self.total,
+            "mean_ms": round(self.mean, 3) if self.total else None,
+            "min_ms": self.min_us / 1000 if self.min_us is not None else None,
+        }
+        for p in PERCENTILES:
+            value = self.percentile(p) if self.total >= min_count(p) else None
+            row[f"p{str(p).replace('.', '_')}_ms"] = round(value, 3) if value is not None else None
+        row["max_ms"] = self.max_us / 1000 if self.max_us is not None else None
+        return row
+
+    # --- 저장 / 불러오기 ---
+    def to_json(self):
+        """count 배열은 zlib + base64 로 압축 (대부분 0 이므로 수백 byte)"""
+        return json.dumps({
+            "highest_us": self.highest_us,
+            "significant_digits": self.significant_digits,
+            "total": self.total,
+            "sum_us": self.sum_us,
+            "min_us": self.min_us,
+            "max_us": self.max_us,
+            "counts": base64.b64encode(zlib.compress(self.counts.tobytes())).decode(),
+        })
+
+    @classmethod
+    def from_json(cls, text):
+        data = json.loads(text)
+        hist = cls(data["highest_us"], data["significant_digits"])
+        counts = array.array("Q")
+        counts.frombytes(zlib.decompress(base64.b64decode(data["counts"])))
+        if len(counts) != len(hist.counts):
+            raise ValueError("count 배열의 크기가 설정과 다릅니다.")
+        hist.counts = counts
+        hist.total, hist.sum_us = data["total"], data["sum_us"]
+        hist.min_us, hist.max_us = data["min_us"], data["max_us"]
+        return hist
+
+    def save(self, path):
+        path = pathlib.Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.to_json(), encoding="utf-8")
+        return path
+
+    @classmethod
+    def load(cls, path):
+        return cls.from_json(pathlib.Path(path).read_text(encoding="utf-8"))
+
+
+def merge_files(paths):
+    """여러 histogram 파일을 병합합니다. 파일이 없으면 None"""
+    merged = None
+    for path in paths:
+        hist = LatencyHistogram.load(path)
+        merged = hist if merged is None else merged.merge(hist)
+    return merged
+
+
+def histogram_path(root, model, options, tag):
+    """<root>/latency/<model>__<options>__<tag>.hdr.json (tag: process/worker 를 구분하는 이름)"""
+    slug = "".join(c if c.isalnum() else "_" for c in options).strip("_") or "default"
+    return pathlib.Path(root) / "latency" / f"{model}__{slug}__{tag}.hdr.json"
+
+
+def fleet_files(results_root, model, options):
+    """모든 session 에 저장된 model/options 의 histogram 파일들 (results/*/latency/...)"""
+    pattern = histogram_path("*", model, options, "*")
+    return sorted(pathlib.Path(results_root).glob(str(pattern)))
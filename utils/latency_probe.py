@@ -0,0 +1,42 @@
+"""
+dx_engine (DX-RT python package) 로 inference 를 반복 실행하며 inference 별 latency 를 출력합니다.
+- dx_engine 이 설치된 venv 의 python 으로 실행합니다. (이 repo 의 다른 module 을 import 하지 않음)
+- runtime 이 측정한 latency (InferenceEngine.get_latency, µs) 를 사용하고, 없으면 run() 의 wall time 을 사용합니다.
+- 출력 마지막 줄: 'LATENCY_US: [..]' (JSON list)
+
+사용법:
+    <venv>/bin/python3 utils/latency_probe.py -m YoloV7.dxnn -l 1000 -w 20
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+from dx_engine import InferenceEngine
+
+
+def main():
+    parser = argparse.ArgumentParser(description="dx_engine per-inference latency probe")
+    parser.add_argument("-m", "--model", required=True)
+    parser.add_argument("-l", "--loops", type=int, default=1000)
+    parser.add_argument("-w", "--warmup", type=int, default=20, help="기록하지 않는 처음 inference 수")
+    args = parser.parse_args()
+
+    ie = InferenceEngine(args.model)
+    input_size = ie.get_input_size()
+    feed = [np.zeros(input_size, dtype=np.uint8)]
+    runtime_latency = getattr(ie, "get_latency", None)
+
+    latencies = []
+    for i in range(args.warmup + args.loops):
+        start = time.perf_counter()
+        ie.run(feed)
+        wall_us = (time.perf_counter() - start) * 1e6
+        if i >= args.warmup:
+            latencies.append(int(runtime_latency()) if runtime_latency else int(wall_us))
+
+    print(f"LATENCY_US: {json.dumps(latencies)}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import statistics
+from dataclasses import dataclass
+
+
+# metric 이름 -> (ProfileSample 속성, 단위 변환)
+METRICS = {
+    "rss_mb": ("rss", 1 / 2**20),
+    "fds": ("fds", 1),
+    "threads": ("threads", 1),
+}
+
+
+@dataclass
+class LeakResult:
+    """하나의 metric 에 대한 증가 추세 분석 결과"""
+    metric: str
+    slope_per_min: float
+    limit_per_min: float
+    r2: float
+    start: float          # 분석 구간 시작 / 끝 값
+    end: float
+    window_sec: float
+    leaked: bool
+
+    def __str__(self):
+        state = "LEAK" if self.leaked else "OK"
+        return (f"[{state}] {self.metric}: {self.slope_per_min:+.3f}/min (limit {self.limit_per_min}/min, "
+                f"r2={self.r2:.2f}), {self.start:.1f} -> {self.end:.1f} over {self.window_sec:.0f}s")
+
+
+def fit_trend(times, values):
+    """최소제곱 직선의 (기울기 /sec, 결정계수 r2), 값이 모두 같으면 r2 = 0"""
+    mean_t, mean_v = statistics.fmean(times), statistics.fmean(values)
+    stt = sum((t - mean_t) ** 2 for t in times)
+    if stt == 0:
+        return 0.0, 0.0
+    slope = sum((t - mean_t) * (v - mean_v) for t, v in zip(times, values)) / stt
+    svv = sum((v - mean_v) ** 2 for v in values)
+    if svv == 0:
+        return slope, 0.0
+    ss_res = sum((v - (mean_v + slope * (t - mean_t))) ** 2 for t, v in zip(times, values))
+    return slope, 1 - ss_res / svv
+
+
+def analyze(samples, limits, warmup_sec=20, min_window_sec=30, min_r2=0.5):
+    """
+    ProcessProfiler 의 sample 들에서 metric 별 증가 추세를 분석합니다.
+    - 하위 process 가 처음 나타난 시점부터 warmup_sec 이후의 sample 만 사용합니다. (model load, buffer 할당 제외)
+    - 기울기가 limits[metric] (/min) 보다 크고 r2 >= min_r2 (일시적인 튐이 아닌 꾸준한 증가) 이면 leak
+    - 분석 구간이 min_window_sec 보다 짧으면 빈 list 를 반환합니다.
+    """
+    running = [s for s in samples if s.processes > 0]
+    if not running:
+        return []
+    start = running[0].timestamp + warmup_sec
+    window = [s for s in running if s.timestamp >= start]
+    if len(window) < 3 or window[-1].timestamp - window[0].timestamp < min_window_sec:
+        return []
+
+    times = [s.timestamp for s in window]
+    results = []
+    for metric, limit in limits.items():
+        attr, scale = METRICS[metric]
+        values = [getattr(s, attr) * scale for s in window]
+        slope, r2 = fit_trend(times, values)
+        slope_per_min = slope * 60
+        results.append(LeakResult(
+            metric=metric,
+            slope_per_min=slope_per_min,
+            limit_per_min=limit,
+            r2=r2,
+            start=values[0],
+            end=values[-1],
+            window_sec=times[-1] - times[0],
+            leaked=slope_per_min > limit and r2 >= min_r2,
+        ))
+    return results
+
+
+class LeakWatch:
+    """
+    test 가 실행한 app 의 RSS/fd/thread 증가를 검사합니다. (proc_profiler sample 사용)
+    - process_monitor 로 실행한 command 의 process tree 만 분석합니다. (stream_server, dxtop_sampler 등 fixture 의 process 제외)
+    - soak_sec 가 지정되면 duration() 이 test 의 기본 실행 시간 대신 soak_sec 를 반환하고, soak 용 limit 을 사용합니다.
+    """
+
+    def __init__(self, profiler, cfg, soak_sec=0):
+        self.profiler = profiler
+        self.cfg = cfg
+        self.soak_sec = soak_sec
+
+    def duration(self, default):
+        return self.soak_sec or default
+
+    def check(self, run):
+        """run (process_monitor 의 MonitorResult) 의 LeakResult list (분석할 수 없으면 빈 list)"""
+        if self.profiler is None or run.pid is None:
+            return []
+        limits = self.cfg['soak_limits_per_min'] if self.soak_sec else self.cfg['limits_per_min']
+        return analyze(self.profiler.tree_samples(run.pid), limits, self.cfg['warmup_sec'],
+                       self.cfg['min_window_sec'], self.cfg['min_r2'])
+
+    def assert_no_leak(self, run):
+        """분석 결과를 출력하고, leak 이 있으면 AssertionError"""
+        checks = self.check(run)
+        for check in checks:
+            print(check)
+        leaks = [str(c) for c in checks if c.leaked]
+        if leaks:
+            raise AssertionError("memory/resource leak 감지:\n" + "\n".join(leaks))
@@ -0,0 +1,61 @@
+import collections
+import gzip
+import pathlib
+
+from utils.error_tokens import TokenMatcher
+
+
+class LogCapture:
+    """
+    장시간 실행되는 프로세스의 출력을 메모리 사용량 일정하게 수집합니다.
+    - 최근 출력만 tail_bytes 크기의 ring buffer 에 보관
+    - 전체 출력은 spill_path 에 gzip 으로 압축하여 저장 (지정한 경우)
+    - 출력(chunk)이 들어올 때마다 오류 문자열을 incremental 하게 검사 (chunk 경계에 걸친 token 포함)
+    """
+
+    def __init__(self, tokens=(), spill_path=None, tail_bytes=256 * 1024):
+        self.matcher = tokens if isinstance(tokens, TokenMatcher) else TokenMatcher(tokens)
+        self._scanners = {}
+        self.tail_bytes = tail_bytes
+        self.total_bytes = 0
+        self._tail = collections.deque()
+        self._tail_size = 0
+        self.spill_path = pathlib.Path(spill_path) if spill_path else None
+        self._spill = None
+        if self.spill_path:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            self._spill = gzip.open(self.spill_path, "wt", encoding="utf-8", compresslevel=6)
+
+    def write(self, text, stream="stdout"):
+        """
+        출력 chunk 를 기록하고, 발견된 오류 문자열(TokenHit) list 를 반환합니다.
+        - stdout/stderr 처럼 stream 이 여러 개면 stream 별로 chunk 경계를 이어서 검사합니다.
+        """
+        size = len(text)
+        self.total_bytes += size
+        if self._spill:
+            self._spill.write(text)
+
+        self._tail.append(text)
+        self._tail_size += size
+        while self._tail and self._tail_size - len(self._tail[0]) >= self.tail_bytes:
+            self._tail_size -= len(self._tail.popleft())
+
+        if stream not in self._scanners:
+            self._scanners[stream] = self.matcher.scanner()
+        return self._scanners[stream].feed(text)
+
+    def tail(self):
+        """ring buffer 에 남아있는 최근 출력 (최대 tail_bytes)"""
+        return "".join(self._tail)[-self.tail_bytes:]
+
+    def close(self):
+        if self._spill:
+            self._spill.close()
+            self._spill = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,114 @@
+import csv
+import html
+import json
+import pathlib
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+
+def _mb(value):
+    return round(value / 2**20, 2) if value is not None else None
+
+
+@dataclass
+class ZooEntry:
+    """model 하나, run_model mode 하나의 benchmark 결과"""
+    model: str
+    mode: str                                  # 'default' / 'single'
+    fps: Optional[float] = None
+    latency_ms: Optional[float] = None
+    npu_time_ms: Optional[float] = None
+    npu_memory_mb: Optional[float] = None      # parse_model 의 NPU task memory 합
+    host_transfer_mb: Optional[float] = None   # inference 한 번의 host <-> NPU 전송량
+    file_mb: Optional[float] = None
+
+    @classmethod
+    def from_results(cls, model, mode, run, graph=None, file_bytes=None):
+        """RunModelResult 와 parse_model 의 ModelGraph 로 만듭니다."""
+        return cls(
+            model=model,
+            mode=mode,
+            fps=run.fps,
+            latency_ms=run.latency_ms,
+            npu_time_ms=run.npu_time_ms,
+            npu_memory_mb=_mb(graph.npu_memory_bytes) if graph else None,
+            host_transfer_mb=_mb(graph.host_transfer_bytes) if graph else None,
+            file_mb=_mb(file_bytes),
+        )
+
+    @property
+    def fps_per_npu_mb(self):
+        """NPU memory 1MB 당 FPS (한 card 에 여러 model 을 올릴 때의 효율)"""
+        if not self.fps or not self.npu_memory_mb:
+            return None
+        return round(self.fps / self.npu_memory_mb, 2)
+
+    def to_row(self):
+        return {**asdict(self), "fps_per_npu_mb": self.fps_per_npu_mb}
+
+
+def leaderboard(entries):
+    """mode 별로 FPS 가 높은 순서로 정렬하고 순위를 붙인 row list"""
+    rows = []
+    for mode in sorted({e.mode for e in entries}):
+        ranked = sorted((e for e in entries if e.mode == mode), key=lambda e: -(e.fps or 0))
+        rows += [{"rank": i, **e.to_row()} for i, e in enumerate(ranked, 1)]
+    return rows
+
+
+def render_html(rows, title="Model Zoo Leaderboard"):
+    """leaderboard 를 외부 파일 없이 열 수 있는 html 문서로 만듭니다. (column 제목을 누르면 정렬)"""
+    columns = list(rows[0]) if rows else []
+    head = "".join(f"<th onclick=\"sortBy({i})\">{html.escape(c)}</th>" for i, c in enumerate(columns))
+    body = "\n".join(
+        "<tr>" + "".join(f"<td>{html.escape('' if row[c] is None else str(row[c]))}</td>" for c in columns) + "</tr>"
+        for row in rows
+    )
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{html.escape(title)}</title>
+<style>
+body {{ font-family: sans-serif; }}
+table {{ border-collapse: collapse; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 8px; text-align: right; }}
+th {{ background: #eee; cursor: pointer; }}
+td:nth-child(2), td:nth-child(3) {{ text-align: left; }}
+</style></head>
+<body>
+<h2>{html.escape(title)}</h2>
+<table id="zoo"><thead><tr>{head}</tr></thead><tbody>
+{body}
+</tbody></table>
+<script>
+function sortBy(col) {{
+  const tbody = document.querySelector("#zoo tbody");
+  const rows = Array.from(tbody.rows);
+  const key = r => {{ const v = r.cells[col].textContent; return v === "" || isNaN(v) ? v : Number(v); }};
+  const desc = tbody.dataset.col == col && tbody.dataset.desc != "true";
+  rows.sort((a, b) => (key(a) > key(b) ? 1 : key(a) < key(b) ? -1 : 0) * (desc ? -1 : 1));
+  tbody.dataset.col = col; tbody.dataset.desc = desc;
+  rows.forEach(r => tbody.appendChild(r));
+}}
+</script>
+</body></html>
+"""
+
+
+def write_leaderboard(entries, directory, name="model_zoo"):
+    """<directory>/<name>.json, .csv, .html 로 저장하고 경로 list 를 반환합니다."""
+    directory = pathlib.Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    rows = leaderboard(entries)
+
+    json_path = directory / f"{name}.json"
+    json_path.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+
+    csv_path = directory / f"{name}.csv"
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        if rows:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+
+    html_path = directory / f"{name}.html"
+    html_path.write_text(render_html(rows), encoding="utf-8")
+    return [json_path, csv_path, html_path]
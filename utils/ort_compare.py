@@ -0,0 +1,78 @@
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+
+def cpu_sets(core_counts, available=None):
+    """
+    core 수별로 taskset 에 넘길 CPU 목록 ({core 수: '0,1,..'})
+    - 현재 process 가 사용할 수 있는 CPU 중 번호가 낮은 것부터 사용, 0 은 전체
+    - 사용 가능한 CPU 보다 많은 core 수는 제외합니다.
+    """
+    available = sorted(available if available is not None else os.sched_getaffinity(0))
+    sets = {}
+    for count in core_counts:
+        count = count or len(available)
+        if count <= len(available):
+            sets[count] = ",".join(str(c) for c in available[:count])
+    return sets
+
+
+@dataclass
+class CpuRun:
+    """run_model 실행 한 번의 처리량과 host CPU 사용량"""
+    model: str
+    mode: str                     # 'npu' (기본 경로) / 'ort' (--use-ort)
+    cores: int                    # taskset 으로 허용한 CPU 수
+    fps: Optional[float]
+    latency_ms: Optional[float]
+    wall_sec: float
+    cpu_sec: float                # run_model 의 user + sys CPU 시간
+
+    @property
+    def cpu_cores_used(self):
+        """평균적으로 사용한 CPU 수 (1.0 = core 1 개)"""
+        return self.cpu_sec / self.wall_sec if self.wall_sec > 0 else None
+
+    @property
+    def cpu_ms_per_inference(self):
+        """inference 한 번에 사용한 host CPU 시간 (ms)"""
+        if not self.fps or self.wall_sec <= 0:
+            return None
+        return self.cpu_sec * 1000 / (self.fps * self.wall_sec)
+
+    def to_row(self):
+        def r(value, digits=3):
+            return round(value, digits) if value is not None else None
+
+        return {
+            "model": self.model,
+            "mode": self.mode,
+            "cores": self.cores,
+            "fps": self.fps,
+            "latency_ms": self.latency_ms,
+            "cpu_cores_used": r(self.cpu_cores_used),
+            "cpu_util": r(self.cpu_cores_used / self.cores if self.cpu_cores_used is not None else None),
+            "cpu_ms_per_inference": r(self.cpu_ms_per_inference),
+            "wall_sec": r(self.wall_sec),
+        }
+
+
+def cores_needed(runs, saturation=0.95):
+    """
+    (model, mode) 별로 최고 FPS 의 saturation 배 이상을 내는 최소 core 수 (host CPU 가 병목이 되지 않는 core 수)
+    - 반환: {(model, mode): core 수}, FPS 가 없으면 None
+    """
+    groups = {}
+    for run in runs:
+        groups.setdefault((run.model, run.mode), []).append(run)
+
+    needed = {}
+    for key, group in groups.items():
+        group = sorted((r for r in group if r.fps), key=lambda r: r.cores)
+        if not group:
+            needed[key] = None
+            continue
+        target = max(r.fps for r in group) * saturation
+        needed[key] = next(r.cores for r in group if r.fps >= target)
+    return needed
@@ -0,0 +1,210 @@
+import re
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+# dtype 별 element 크기 (byte)
+DTYPE_SIZES = {
+    "INT8": 1, "UINT8": 1, "INT16": 2, "UINT16": 2, "FLOAT16": 2, "BFLOAT16": 2,
+    "INT32": 4, "UINT32": 4, "FLOAT": 4, "INT64": 8, "UINT64": 8, "DOUBLE": 8,
+}
+
+RE_FORMAT_VERSION = re.compile(r"\.dxnn Format version\s*:\s*(v\S+)")
+RE_COMPILER_VERSION = re.compile(r"Compiler version\s*:\s*(v\S+)")
+# [ npu_0] -> cpu_0 -> []
+RE_EDGE = re.compile(r"^\[([^\]]*)\]\s*->\s*(\S+)\s*->\s*\[([^\]]*)\]$")
+# Task[0] npu_0, NPU, NPU memory usage 241,984,000 bytes (input 1,228,800, output 8,568,000)
+# Task[1] cpu_0, CPU, input 8,568,000 bytes, output 8,568,000 bytes
+RE_TASK = re.compile(r"^Task\[(\d+)\]\s*([^,\s]+)\s*,\s*(\w+)\s*,?\s*(.*)$")
+RE_NPU_MEMORY = re.compile(r"NPU memory usage\s*([\d,]+)\s*bytes")
+RE_INPUT_BYTES = re.compile(r"input\s*([\d,]+)")
+RE_OUTPUT_BYTES = re.compile(r"output\s*([\d,]+)")
+# -  images, UINT8, [1, 640, 640, 3 ]  [layout: PRE_IM2COL]
+RE_TENSOR = re.compile(r"^-\s*([^,]+?)\s*,\s*(\w+)\s*,\s*\[([^\]]*)\]\s*(?:\[([^\]]*)\])?$")
+RE_NAME = re.compile(r"^-\s*(\S+)$")
+
+
+def _int(text):
+    return int(text.replace(",", ""))
+
+
+def _names(text):
+    """'npu_0, cpu_1' -> ['npu_0', 'cpu_1']"""
+    return [v.strip() for v in text.split(",") if v.strip()]
+
+
+@dataclass
+class Tensor:
+    name: str
+    dtype: str
+    shape: list
+    layout: Optional[str] = None
+    transpose: Optional[str] = None
+
+    @property
+    def nbytes(self):
+        """dtype 과 shape 으로 계산한 크기, dtype 을 모르면 None"""
+        size = DTYPE_SIZES.get(self.dtype.upper())
+        if size is None:
+            return None
+        for dim in self.shape:
+            size *= dim
+        return size
+
+
+@dataclass
+class Task:
+    index: int
+    name: str
+    device: str                                     # NPU / CPU
+    inputs: list = field(default_factory=list)      # Tensor
+    outputs: list = field(default_factory=list)
+    predecessors: list = field(default_factory=list)
+    successors: list = field(default_factory=list)
+    npu_memory_bytes: Optional[int] = None
+    input_bytes: Optional[int] = None
+    output_bytes: Optional[int] = None
+
+
+@dataclass
+class ModelGraph:
+    """parse_model 출력의 model 정보와 task graph"""
+    format_version: Optional[str] = None
+    compiler_version: Optional[str] = None
+    inputs: list = field(default_factory=list)      # model 입력 tensor 이름
+    outputs: list = field(default_factory=list)
+    tasks: list = field(default_factory=list)       # Task (Task[n] 순서)
+
+    def task(self, name):
+        return next((t for t in self.tasks if t.name == name), None)
+
+    @property
+    def edges(self):
+        """(from task, to task) 목록"""
+        return sorted({(t.name, s) for t in self.tasks for s in t.successors}
+                      | {(p, t.name) for t in self.tasks for p in t.predecessors})
+
+    @property
+    def npu_memory_bytes(self):
+        """모든 NPU task 의 NPU memory 사용량 합 (한 card 에 몇 개의 model 을 올릴 수 있는지 결정)"""
+        return sum(t.npu_memory_bytes or 0 for t in self.tasks if t.device == "NPU")
+
+    @property
+    def host_transfer_bytes(self):
+        """inference 한 번에 host <-> NPU 사이에 전송되는 byte (NPU task 의 input + output)"""
+        return sum((t.input_bytes or 0) + (t.output_bytes or 0) for t in self.tasks if t.device == "NPU")
+
+    def to_row(self):
+        return {
+            "format_version": self.format_version,
+            "compiler_version": self.compiler_version,
+            "tasks": " ".join(t.name for t in self.tasks),
+            "npu_tasks": sum(t.device == "NPU" for t in self.tasks),
+            "npu_memory_bytes": self.npu_memory_bytes,
+            "host_transfer_bytes": self.host_transfer_bytes,
+        }
+
+
+def _parse_tensor(line):
+    m = RE_TENSOR.match(line)
+    if not m:
+        return None
+    attrs = {}
+    for item in _names(m.group(4) or ""):
+        key, _, value = item.partition(":")
+        attrs[key.strip()] = value.strip()
+    shape = [int(v) for v in m.group(3).replace(" ", "").split(",") if v]
+    return Tensor(m.group(1), m.group(2), shape, attrs.get("layout"), attrs.get("transpose"))
+
+
+def parse_model_graph(output):
+    """
+    parse_model 출력을 ModelGraph 로 변환합니다.
+    - 'Model Input/Output Tensors:' 아래 '- name' 목록, 'Tasks:' 아래 edge 라인과 Task[n] 블록을 읽습니다.
+    """
+    graph = ModelGraph()
+    m = RE_FORMAT_VERSION.search(output)
+    graph.format_version = m.group(1) if m else None
+    m = RE_COMPILER_VERSION.search(output)
+    graph.compiler_version = m.group(1) if m else None
+
+    edges = {}          # task 이름 -> (predecessors, successors)
+    section = None      # 'model_inputs' / 'model_outputs' / 'inputs' / 'outputs'
+    task = None
+    for raw in output.splitlines():
+        line = raw.strip()
+        if not line:
+            continue
+        if line.startswith("Model Input Tensors"):
+            section = "model_inputs"
+        elif line.startswith("Model Output Tensors"):
+            section = "model_outputs"
+        elif line.startswith("Tasks:"):
+            section, task = None, None
+        elif m := RE_EDGE.match(line):
+            edges[m.group(2)] = (_names(m.group(1)), _names(m.group(3)))
+            section = None
+        elif m := RE_TASK.match(line):
+            task = Task(int(m.group(1)), m.group(2), m.group(3).upper())
+            rest = m.group(4)
+            if n := RE_NPU_MEMORY.search(rest):
+                task.npu_memory_bytes = _int(n.group(1))
+            if n := RE_INPUT_BYTES.search(rest):
+                task.input_bytes = _int(n.group(1))
+            if n := RE_OUTPUT_BYTES.search(rest):
+                task.output_bytes = _int(n.group(1))
+            graph.tasks.append(task)
+            section = None
+        elif task is not None and line in ("Inputs", "Outputs"):
+            section = line.lower()
+        elif line.startswith("-") and section in ("model_inputs", "model_outputs"):
+            if m := RE_NAME.match(line):
+                getattr(graph, section.split("_")[1]).append(m.group(1))
+        elif line.startswith("-") and section in ("inputs", "outputs"):
+            tensor = _parse_tensor(line)
+            if tensor is not None:
+                getattr(task, section).append(tensor)
+
+    for t in graph.tasks:
+        t.predecessors, t.successors = edges.get(t.name, ([], []))
+    graph.tasks.sort(key=lambda t: t.index)
+    return graph
+
+
+def diff_graph(expected, actual):
+    """
+    두 ModelGraph 를 구조적으로 비교하여 차이 목록(str)을 반환합니다. (같으면 빈 list)
+    - expected 에 값이 없는 항목 (예: baseline 에 버전 라인이 없음) 은 비교하지 않습니다.
+    """
+    diffs = []
+
+    def _check(name, want, got):
+        if want not in (None, []) and want != got:
+            diffs.append(f"{name}: expected={want}, actual={got}")
+
+    _check("format version", expected.format_version, actual.format_version)
+    _check("compiler version", expected.compiler_version, actual.compiler_version)
+    _check("model inputs", expected.inputs, actual.inputs)
+    _check("model outputs", expected.outputs, actual.outputs)
+    _check("tasks", [t.name for t in expected.tasks], [t.name for t in actual.tasks])
+    _check("edges", expected.edges, actual.edges)
+
+    for want in expected.tasks:
+        got = actual.task(want.name)
+        if got is None:
+            continue
+        for attr in ("device", "npu_memory_bytes", "input_bytes", "output_bytes"):
+            _check(f"{want.name}.{attr}", getattr(want, attr), getattr(got, attr))
+        for kind in ("inputs", "outputs"):
+            got_tensors = {t.name: t for t in getattr(got, kind)}
+            for tensor in getattr(want, kind):
+                other = got_tensors.get(tensor.name)
+                if other is None:
+                    diffs.append(f"{want.name}.{kind}: '{tensor.name}' 없음")
+                    continue
+                for attr in ("dtype", "shape", "layout", "transpose"):
+                    _check(f"{want.name}.{kind}.{tensor.name}.{attr}", getattr(tensor, attr), getattr(other, attr))
+            extra = set(got_tensors) - {t.name for t in getattr(want, kind)}
+            for name in sorted(extra):
+                diffs.append(f"{want.name}.{kind}: 예상하지 않은 '{name}'")
+    return diffs
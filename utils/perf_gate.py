@@ -0,0 +1,101 @@
+import re
+import pathlib
+import statistics
+from dataclasses import dataclass
+from datetime import datetime
+
+import yaml
+
+
+# metric 이름 -> 값이 클수록 좋은지 여부
+METRICS = {
+    "fps": True,
+    "latency_ms": False,
+    "npu_time_ms": False,
+}
+
+
+@dataclass
+class GateResult:
+    """하나의 metric 에 대한 baseline 비교 결과"""
+    metric: str
+    current: float
+    baseline: float
+    limit: float
+    regressed: bool
+
+    def __str__(self):
+        state = "REGRESSION" if self.regressed else "OK"
+        return (f"[{state}] {self.metric}: current={self.current:.3f}, "
+                f"baseline={self.baseline:.3f}, limit={self.limit:.3f}")
+
+
+def baseline_path(baseline_dir, model, options):
+    """model/option 조합별 baseline 파일 경로 (예: YoloV7__v_t_3.yaml)"""
+    slug = re.sub(r"[^0-9A-Za-z]+", "_", options).strip("_") or "default"
+    return pathlib.Path(baseline_dir) / f"{model}__{slug}.yaml"
+
+
+def summarize(samples):
+    """측정값 list 를 baseline 형식(mean/stdev/samples)으로 요약합니다."""
+    return {
+        "mean": round(statistics.fmean(samples), 3),
+        "stdev": round(statistics.stdev(samples), 3) if len(samples) > 1 else 0.0,
+        "samples": len(samples),
+    }
+
+
+def load_baseline(baseline_dir, model, options):
+    """baseline 파일을 읽어 반환합니다. 파일이 없으면 None 을 반환합니다."""
+    path = baseline_path(baseline_dir, model, options)
+    if not path.is_file():
+        return None
+    return yaml.safe_load(path.read_text(encoding="utf-8"))
+
+
+def save_baseline(baseline_dir, model, options, results, extra=None):
+    """RunModelResult list 로부터 baseline 파일을 생성(덮어쓰기)합니다."""
+    data = {
+        "model": model,
+        "options": options,
+        "updated": datetime.now().isoformat(timespec="seconds"),
+    }
+    data.update(extra or {})
+    for metric in METRICS:
+        samples = [getattr(r, metric) for r in results if getattr(r, metric) is not None]
+        if samples:
+            data[metric] = summarize(samples)
+
+    path = baseline_path(baseline_dir, model, options)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+    return path
+
+
+def check_metric(metric, samples, stats, tolerance, sigma):
+    """
+    측정값(samples)의 median 을 baseline 과 비교합니다.
+    - 허용 편차 = max(baseline mean * tolerance, baseline stdev * sigma)
+    - 한두 번 튀는 값에 흔들리지 않도록 평균이 아닌 median 을 사용합니다.
+    """
+    current = statistics.median(samples)
+    mean = stats["mean"]
+    margin = max(mean * tolerance, stats.get("stdev", 0.0) * sigma)
+
+    if METRICS[metric]:
+        limit = mean - margin
+        regressed = current < limit
+    else:
+        limit = mean + margin
+        regressed = current > limit
+    return GateResult(metric, current, mean, limit, regressed)
+
+
+def check_regression(results, baseline, tolerance=0.05, sigma=3.0):
+    """baseline 에 있는 모든 metric 에 대해 GateResult list 를 반환합니다."""
+    checks = []
+    for metric in METRICS:
+        samples = [getattr(r, metric) for r in results if getattr(r, metric) is not None]
+        if metric in baseline and samples:
+            checks.append(check_metric(metric, samples, baseline[metric], tolerance, sigma))
+    return checks
@@ -0,0 +1,264 @@
+import csv
+import os
+import pathlib
+import threading
+import time
+from dataclasses import dataclass, asdict
+
+from utils.procfs import PROC, PAGE_SIZE, process_tree
+
+CLK_TCK = os.sysconf("SC_CLK_TCK")
+
+
+@dataclass
+class ProcStat:
+    """/proc/<pid> 에서 읽은 process 하나의 값 (counter 는 process 시작 이후 누적)"""
+    pid: int
+    name: str
+    rss: int = 0
+    pss: int = 0
+    cpu_ticks: int = 0
+    threads: int = 0
+    fds: int = 0
+    voluntary_ctxt: int = 0
+    nonvoluntary_ctxt: int = 0
+    read_bytes: int = 0       # storage 에서 읽은 byte (/proc/<pid>/io)
+    write_bytes: int = 0
+
+
+def read_proc(pid):
+    """pid 의 ProcStat, process 가 종료되었거나 읽을 수 없으면 None"""
+    base = PROC / str(pid)
+    try:
+        stat = (base / "stat").read_text()
+        status = (base / "status").read_text()
+    except (FileNotFoundError, ProcessLookupError, PermissionError):
+        return None
+
+    # comm 에 공백/괄호가 있을 수 있으므로 마지막 ')' 뒤부터 파싱 (fields[0] 은 state)
+    fields = stat[stat.rindex(")") + 2:].split()
+    result = ProcStat(pid, stat[stat.index("(") + 1:stat.rindex(")")])
+    result.cpu_ticks = int(fields[11]) + int(fields[12])   # utime + stime
+    result.threads = int(fields[17])
+    result.rss = int(fields[21]) * PAGE_SIZE
+    for line in status.splitlines():
+        key, _, value = line.partition(":")
+        if key == "voluntary_ctxt_switches":
+            result.voluntary_ctxt = int(value)
+        elif key == "nonvoluntary_ctxt_switches":
+            result.nonvoluntary_ctxt = int(value)
+
+    # 아래 값들은 권한이 없거나 (다른 user 의 process) 그 사이 종료되면 0 으로 둡니다.
+    try:
+        for line in (base / "smaps_rollup").read_text().splitlines():
+            if line.startswith("Pss:"):
+                result.pss = int(line.split()[1]) * 1024
+                break
+    except OSError:
+        pass
+    try:
+        result.fds = len(os.listdir(base / "fd"))
+    except OSError:
+        pass
+    try:
+        for line in (base / "io").read_text().splitlines():
+            key, _, value = line.partition(":")
+            if key == "read_bytes":
+                result.read_bytes = int(value)
+            elif key == "write_bytes":
+                result.write_bytes = int(value)
+    except OSError:
+        pass
+    return result
+
+
+@dataclass
+class ProfileSample:
+    """sampling 한 시점의 전체 하위 process 합계"""
+    timestamp: float
+    processes: int
+    rss: int
+    pss: int
+    cpu_percent: float
+    threads: int
+    fds: int
+    ctxt_switches: int
+    read_bytes: int
+    write_bytes: int
+
+
+@dataclass
+class ProcessSummary:
+    """process 하나의 실행 동안의 요약"""
+    pid: int
+    name: str
+    first_seen: float
+    last_seen: float
+    peak_rss: int = 0
+    peak_pss: int = 0
+    cpu_sec: float = 0.0
+    peak_cpu_percent: float = 0.0
+    peak_threads: int = 0
+    peak_fds: int = 0
+    voluntary_ctxt: int = 0
+    nonvoluntary_ctxt: int = 0
+    read_bytes: int = 0
+    write_bytes: int = 0
+
+    @property
+    def mean_cpu_percent(self):
+        duration = self.last_seen - self.first_seen
+        return self.cpu_sec / duration * 100 if duration > 0 else 0.0
+
+    def to_row(self):
+        row = asdict(self)
+        row["duration_sec"] = round(self.last_seen - self.first_seen, 3)
+        row["mean_cpu_percent"] = round(self.mean_cpu_percent, 1)
+        row["peak_cpu_percent"] = round(self.peak_cpu_percent, 1)
+        row["cpu_sec"] = round(self.cpu_sec, 3)
+        del row["first_seen"], row["last_seen"]
+        return row
+
+
+def _aggregate(now, stats, percents):
+    """ProcStat list 의 합계 ProfileSample"""
+    return ProfileSample(
+        timestamp=now,
+        processes=len(stats),
+        rss=sum(s.rss for s in stats),
+        pss=sum(s.pss for s in stats),
+        cpu_percent=round(sum(percents[s.pid] for s in stats), 1),
+        threads=sum(s.threads for s in stats),
+        fds=sum(s.fds for s in stats),
+        ctxt_switches=sum(s.voluntary_ctxt + s.nonvoluntary_ctxt for s in stats),
+        read_bytes=sum(s.read_bytes for s in stats),
+        write_bytes=sum(s.write_bytes for s in stats),
+    )
+
+
+class ProcessProfiler:
+    """
+    root process 의 모든 하위 process 를 background thread 에서 주기적으로 sampling 합니다.
+    - test 가 어떤 방법(subprocess.run, Popen, asyncio)으로 실행했는지와 관계없이 pytest process 의 자식을 모두 측정합니다.
+    - RSS, PSS, CPU%, thread 수, 열린 fd 수, context switch, I/O byte
+    - CPU% 는 sampling 간격 동안 사용한 CPU 시간 / 간격 (100% = core 1 개), 처음 본 sample 에서는 0
+    - watch(pid) 로 등록한 process 는 그 process tree 만의 합계를 따로 기록합니다. (tree_samples)
+    """
+
+    def __init__(self, root_pid=None, interval=0.5):
+        self.root_pid = root_pid or os.getpid()
+        self.interval = interval
+        self.samples = []         # ProfileSample
+        self.processes = {}       # {pid: ProcessSummary}
+        self.trees = {}           # {watch 한 root pid: [ProfileSample]}
+        self._trees_lock = threading.Lock()  # watch() 는 다른 thread (process_monitor 의 on_start) 에서 호출됨
+        self._last = {}           # {pid: (시간, cpu_ticks)}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def sample(self, now=None):
+        """한 번 sampling 하여 ProfileSample 을 추가하고 반환합니다."""
+        now = time.monotonic() if now is None else now
+        pids = process_tree(self.root_pid) - {self.root_pid}
+        stats = [s for s in (read_proc(pid) for pid in pids) if s is not None]
+
+        percents = {}
+        last = {}
+        for s in stats:
+            prev = self._last.get(s.pid)
+            last[s.pid] = (now, s.cpu_ticks)
+            # 처음 본 process 는 이전 값이 없으므로 CPU% 를 계산하지 않습니다. (시작 이후 누적 시간이 한 간격에 몰리지 않도록)
+            if prev is None or now <= prev[0]:
+                percents[s.pid] = 0.0
+            else:
+                percents[s.pid] = (s.cpu_ticks - prev[1]) / CLK_TCK / (now - prev[0]) * 100
+            self._update(s, now, percents[s.pid])
+        self._last = last
+
+        with self._trees_lock:
+            trees = list(self.trees.items())
+        for root, series in trees:
+            tree = process_tree(root)
+            series.append(_aggregate(now, [s for s in stats if s.pid in tree], percents))
+        sample = _aggregate(now, stats, percents)
+        self.samples.append(sample)
+        return sample
+
+    def watch(self, pid):
+        """pid 의 process tree 만의 합계도 기록합니다. (fixture 의 helper process 를 제외하고 분석할 때)"""
+        with self._trees_lock:
+            self.trees.setdefault(pid, [])
+
+    def tree_samples(self, pid):
+        """watch(pid) 이후 pid 의 process tree 합계 sample list"""
+        with self._trees_lock:
+            return list(self.trees.get(pid, []))
+
+    def _update(self, s, now, percent):
+        summary = self.processes.get(s.pid)
+        if summary is None:
+            summary = self.processes[s.pid] = ProcessSummary(s.pid, s.name, now, now)
+        summary.name = s.name  # exec 이후 이름이 바뀔 수 있음
+        summary.last_seen = now
+        summary.peak_rss = max(summary.peak_rss, s.rss)
+        summary.peak_pss = max(summary.peak_pss, s.pss)
+        summary.cpu_sec = s.cpu_ticks / CLK_TCK
+        summary.peak_cpu_percent = max(summary.peak_cpu_percent, percent)
+        summary.peak_threads = max(summary.peak_threads, s.threads)
+        summary.peak_fds = max(summary.peak_fds, s.fds)
+        summary.voluntary_ctxt = s.voluntary_ctxt
+        summary.nonvoluntary_ctxt = s.nonvoluntary_ctxt
+        summary.read_bytes = s.read_bytes
+        summary.write_bytes = s.write_bytes
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.sample()
+            self._stop.wait(self.interval)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @property
+    def active(self):
+        """하위 process 가 한 번이라도 측정되었는지"""
+        return bool(self.processes)
+
+    def summary_rows(self):
+        return [p.to_row() for p in sorted(self.processes.values(), key=lambda p: p.first_seen)]
+
+    def summary_text(self):
+        """report 에 첨부할 process 별 요약 표"""
+        lines = [f"{'pid':>7} {'name':<16} {'sec':>7} {'peakRSS MB':>10} {'peakPSS MB':>10} "
+                 f"{'CPU% avg':>8} {'CPU% max':>8} {'thr':>5} {'fds':>5} {'ctxsw':>9} {'read MB':>8} {'write MB':>8}"]
+        for p in sorted(self.processes.values(), key=lambda p: p.first_seen):
+            lines.append(
+                f"{p.pid:>7} {p.name[:16]:<16} {p.last_seen - p.first_seen:>7.1f} {p.peak_rss / 2**20:>10.1f} "
+                f"{p.peak_pss / 2**20:>10.1f} {p.mean_cpu_percent:>8.1f} {p.peak_cpu_percent:>8.1f} "
+                f"{p.peak_threads:>5} {p.peak_fds:>5} {p.voluntary_ctxt + p.nonvoluntary_ctxt:>9} "
+                f"{p.read_bytes / 2**20:>8.1f} {p.write_bytes / 2**20:>8.1f}")
+        return "\n".join(lines)
+
+    def write_series(self, path):
+        """시간별 합계를 csv 로 저장합니다. (timestamp 는 첫 sample 기준 초)"""
+        path = pathlib.Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        start = self.samples[0].timestamp if self.samples else 0
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(ProfileSample.__dataclass_fields__))
+            writer.writeheader()
+            for s in self.samples:
+                writer.writerow({**asdict(s), "timestamp": round(s.timestamp - start, 3)})
+        return path
@@ -0,0 +1,179 @@
+import asyncio
+import codecs
+import re
+import signal
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from utils import error_tokens
+from utils.log_capture import LogCapture
+
+
+# 첫 번째 inference 결과(frame)가 나왔다고 판단하는 출력 (예: '[DXAPP] [INFO] fps : 30.1')
+FIRST_FRAME_PATTERN = re.compile(r"fps\s*:\s*[\d.]+", re.I)
+
+CHUNK = 65536
+# hit_line 을 만들기 위해 stream 별로 이어 붙여두는 이전 chunk 의 미완성 line 최대 길이
+LINE_CARRY = 4096
+
+
+@dataclass
+class MonitorResult:
+    """감시한 프로세스의 실행 결과"""
+    command: list
+    pid: Optional[int] = None
+    returncode: Optional[int] = None
+    early_exit: bool = False          # 지정된 시간 전에 스스로 종료됨
+    hit_token: Optional[str] = None   # 감지된 오류 문자열
+    hit_line: str = ""
+    stop_timed_out: bool = False      # 종료 신호에 반응하지 않아 강제 종료함
+    elapsed: float = 0.0
+    time_to_first_output: Optional[float] = None
+    time_to_first_frame: Optional[float] = None
+    log: Optional[LogCapture] = None
+
+    @property
+    def output(self):
+        """stdout + stderr 의 최근 출력 (전체 출력은 log.spill_path 참고)"""
+        return self.log.tail() if self.log else ""
+
+    @property
+    def failure(self):
+        """실패 사유 문자열, 문제가 없으면 None"""
+        if self.hit_token:
+            return f"실행 중 오류 발생: '{self.hit_token}'\n{self.hit_line}"
+        if self.early_exit:
+            return f"프로세스가 지정된 시간 이내에 비정상 종료되었습니다. rc={self.returncode}"
+        if self.stop_timed_out:
+            return "프로세스가 종료 신호에 반응하지 않아 강제 종료했습니다."
+        return None
+
+
+class _Watcher:
+    """stdout/stderr 를 chunk 단위로 받아서 오류 문자열과 첫 frame 출력을 감시합니다."""
+
+    def __init__(self, result, start, first_frame):
+        self.result = result
+        self.start = start
+        self.first_frame = first_frame
+        self.error = asyncio.Event()
+        self.frame = asyncio.Event()
+        self._frame_carry = ""
+        self._line_carry = {}   # {stream: 이전 chunk 의 마지막 미완성 line}
+        self._consumed = {}     # {stream: 지금까지 받은 문자 수}
+
+    def on_output(self, name, text):
+        now = time.monotonic() - self.start
+        result = self.result
+        hits = result.log.write(text, stream=name)
+
+        if result.time_to_first_output is None:
+            result.time_to_first_output = now
+        if result.time_to_first_frame is None and self.first_frame:
+            # chunk 경계에 걸친 FPS 출력도 찾을 수 있도록 이전 chunk 의 끝부분을 이어서 검사
+            if self.first_frame.search(self._frame_carry + text):
+                result.time_to_first_frame = now
+                self.frame.set()
+            self._frame_carry = text[-64:]
+
+        # chunk 경계에 걸친 token / line 도 찾을 수 있도록 이전 chunk 의 미완성 line 을 이어서 사용
+        carry = self._line_carry.get(name, "")
+        consumed = self._consumed.get(name, 0)
+        joined = carry + text
+        self._consumed[name] = consumed + len(text)
+        self._line_carry[name] = joined[joined.rfind("\n") + 1:][-LINE_CARRY:]
+
+        if hits and result.hit_token is None:
+            result.hit_token = hits[0].token
+            # hit.offset 은 stream 전체 기준 위치, joined 는 (consumed - len(carry)) 위치부터 시작
+            result.hit_line = _line_at(joined, hits[0].offset - (consumed - len(carry)))
+            self.error.set()
+
+    async def pump(self, stream, name):
+        """stream 을 chunk 단위로 읽어 on_output 을 호출합니다."""
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        while True:
+            data = await stream.read(CHUNK)
+            if not data:
+                break
+            text = decoder.decode(data)
+            if text:
+                self.on_output(name, text)
+        text = decoder.decode(b"", final=True)
+        if text:
+            self.on_output(name, text)
+
+
+def _line_at(text, pos):
+    """text 에서 pos 위치가 포함된 line 을 반환합니다."""
+    pos = max(pos, 0)
+    start = text.rfind("\n", 0, pos) + 1
+    end = text.find("\n", pos)
+    return text[start:end if end >= 0 else len(text)].rstrip()
+
+
+async def _supervise(command, cwd, duration, log, first_frame, stop_signal, stop_timeout, env, stop_on_first_frame,
+                     on_start):
+    result = MonitorResult(command=list(command), log=log)
+    start = time.monotonic()
+    proc = await asyncio.create_subprocess_exec(
+        *command, cwd=cwd, env=env,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    result.pid = proc.pid
+    if on_start:
+        on_start(proc.pid)
+    watcher = _Watcher(result, start, first_frame)
+    readers = [
+        asyncio.create_task(watcher.pump(proc.stdout, "stdout")),
+        asyncio.create_task(watcher.pump(proc.stderr, "stderr")),
+    ]
+    exited = asyncio.create_task(proc.wait())
+    error = asyncio.create_task(watcher.error.wait())
+    waits = {exited, error}
+    if stop_on_first_frame:
+        waits.add(asyncio.create_task(watcher.frame.wait()))
+
+    # 1. 지정된 시간 / 오류 문자열 감지 / 프로세스 종료 (/ 첫 frame) 중 먼저 일어나는 것을 기다림
+    done, _ = await asyncio.wait(waits, timeout=duration, return_when=asyncio.FIRST_COMPLETED)
+    for task in waits - {exited}:
+        task.cancel()
+    result.early_exit = exited in done and result.hit_token is None
+
+    # 2. 아직 실행 중이면 종료 신호(SIGINT) 전송, 반응이 없으면 강제 종료
+    if proc.returncode is None:
+        proc.send_signal(stop_signal)
+        try:
+            await asyncio.wait_for(asyncio.shield(exited), stop_timeout)
+        except asyncio.TimeoutError:
+            result.stop_timed_out = True
+            proc.kill()
+            await exited
+
+    # 3. 남은 출력 읽기 (자식 프로세스가 pipe 를 잡고 있을 수 있으므로 시간 제한)
+    _, still_reading = await asyncio.wait(readers, timeout=stop_timeout)
+    for task in still_reading:
+        task.cancel()
+
+    result.returncode = proc.returncode
+    result.elapsed = time.monotonic() - start
+    return result
+
+
+def supervise(command, *, cwd=None, duration=10, module="app", first_frame=FIRST_FRAME_PATTERN,
+              stop_signal=signal.SIGINT, stop_timeout=10, env=None, log_path=None, tail_bytes=256 * 1024,
+              stop_on_first_frame=False, on_start=None):
+    """
+    command 를 실행하고 stdout/stderr 를 실시간으로 감시합니다.
+    - 오류 문자열(module 별 error_tokens)이 출력되거나 프로세스가 먼저 종료되면 duration 을 기다리지 않고 바로 반환합니다.
+    - duration 동안 문제가 없으면 stop_signal 을 보내 종료시킵니다.
+    - 첫 출력 / 첫 frame(FPS) 출력까지 걸린 시간을 함께 기록합니다.
+    - stop_on_first_frame 이면 첫 frame 출력 직후 종료시킵니다. (startup 측정)
+    - 출력은 최근 tail_bytes 만 메모리에 두고, log_path 를 지정하면 전체를 gzip 으로 저장합니다.
+    - on_start 는 process 시작 직후 pid 로 호출됩니다. (예: ProcessProfiler.watch)
+    """
+    with LogCapture(error_tokens.matcher(module), spill_path=log_path, tail_bytes=tail_bytes) as log:
+        return asyncio.run(_supervise(command, cwd, duration, log, first_frame,
+                                      stop_signal, stop_timeout, env, stop_on_first_frame, on_start))
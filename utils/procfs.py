@@ -0,0 +1,138 @@
+import os
+import pathlib
+import signal
+import subprocess
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+
+
+PROC = pathlib.Path("/proc")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+def _ppid(pid):
+    """/proc/<pid>/stat 에서 parent pid 를 읽습니다. (process 가 이미 종료되었으면 None)"""
+    try:
+        stat = (PROC / str(pid) / "stat").read_text()
+    except (FileNotFoundError, ProcessLookupError, PermissionError):
+        return None
+    # comm 에 공백/괄호가 있을 수 있으므로 마지막 ')' 뒤부터 파싱
+    return int(stat[stat.rindex(")") + 2:].split()[1])
+
+
+def process_tree(pid):
+    """pid 와 모든 하위 process 의 pid 집합"""
+    children = {}
+    for entry in PROC.iterdir():
+        if entry.name.isdigit():
+            ppid = _ppid(entry.name)
+            if ppid is not None:
+                children.setdefault(ppid, []).append(int(entry.name))
+
+    tree, stack = set(), [pid]
+    while stack:
+        p = stack.pop()
+        if p not in tree:
+            tree.add(p)
+            stack += children.get(p, [])
+    return tree
+
+
+def rss_bytes(pid):
+    """process 의 현재 RSS (bytes), 종료된 process 는 0"""
+    try:
+        return int((PROC / str(pid) / "statm").read_text().split()[1]) * PAGE_SIZE
+    except (FileNotFoundError, ProcessLookupError, PermissionError, IndexError):
+        return 0
+
+
+def tree_rss_bytes(pid):
+    """pid 와 모든 하위 process 의 RSS 합 (bytes)"""
+    return sum(rss_bytes(p) for p in process_tree(pid))
+
+
+class TreeRssSampler:
+    """background thread 에서 process tree 의 RSS 합을 주기적으로 sampling 하여 peak 를 기록합니다."""
+
+    def __init__(self, pid, interval=0.1):
+        self.pid = pid
+        self.interval = interval
+        self.peak = 0
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, tree_rss_bytes(self.pid))
+            self.samples += 1
+            self._stop.wait(self.interval)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        return self.peak
+
+
+@dataclass
+class MeasuredRun:
+    """run_measured() 결과"""
+    command: list
+    returncode: int
+    output: str
+    wall_sec: float
+    user_sec: float        # process 와 wait 한 하위 process 들의 user CPU 시간
+    sys_sec: float
+    peak_rss: int          # process tree 전체 RSS 합의 최대값 (/proc sampling, bytes)
+    max_rss_single: int    # 가장 큰 단일 process 의 max RSS (getrusage, bytes)
+    timed_out: bool = False
+
+
+def run_measured(command, *, cwd=None, env=None, timeout=None, interval=0.1):
+    """
+    command 를 실행하고 wall/user/sys 시간과 peak RSS 를 측정합니다.
+    - stdout/stderr 는 임시 파일로 받아서 pipe buffer 로 인해 process 가 멈추지 않도록 합니다.
+    - timeout 이 지나면 process group 전체를 종료합니다.
+    """
+    with tempfile.TemporaryFile() as out:
+        start = time.monotonic()
+        proc = subprocess.Popen(command, cwd=cwd, env=env, stdout=out, stderr=subprocess.STDOUT,
+                                start_new_session=True)
+        sampler = TreeRssSampler(proc.pid, interval).start()
+
+        timed_out = False
+        deadline = None if timeout is None else start + timeout
+        while True:
+            pid, status, usage = os.wait4(proc.pid, os.WNOHANG)
+            if pid:
+                break
+            if deadline is not None and time.monotonic() > deadline:
+                timed_out = True
+                os.killpg(proc.pid, signal.SIGKILL)
+                _, status, usage = os.wait4(proc.pid, 0)
+                break
+            time.sleep(min(interval, 0.05))
+        wall = time.monotonic() - start
+        peak = sampler.stop()
+        proc.returncode = os.waitstatus_to_exitcode(status)
+
+        out.seek(0)
+        output = out.read().decode(errors="replace")
+
+    return MeasuredRun(
+        command=list(command),
+        returncode=proc.returncode,
+        output=output,
+        wall_sec=wall,
+        user_sec=usage.ru_utime,
+        sys_sec=usage.ru_stime,
+        peak_rss=max(peak, usage.ru_maxrss * 1024),
+        max_rss_single=usage.ru_maxrss * 1024,  # Linux: KiB
+        timed_out=timed_out,
+    )
@@ -0,0 +1,73 @@
+import fcntl
+import os
+import pathlib
+import tempfile
+
+
+# NPU core 번호 (M1: 3 cores)
+NPU_CORES = (0, 1, 2)
+
+LOCK_DIR = pathlib.Path(tempfile.gettempdir()) / "tc-dx-sdk-locks"
+
+
+def resource_names(camera=False, port=None, output=None, npu_cores=None, reads=None):
+    """
+    resources marker 의 tag 들을 (lock 이름, exclusive 여부) list 로 변환합니다.
+    - camera    : /dev/video0 를 독점 사용
+    - port      : 독점 사용하는 TCP port (예: 5000)
+    - output    : 독점적으로 쓰는 출력 파일 이름 (str 또는 list, 예: "result.jpg")
+    - npu_cores : 독점 사용하는 NPU core 집합 (per-core utilization, FPS 기준 검증 등)
+                  지정하지 않으면 모든 core 를 다른 테스트와 공유(shared)로 사용합니다.
+    - reads     : 다른 테스트가 output 으로 쓰는 자원을 읽기만 하는 경우 (shared)
+    """
+    names = {}
+    if camera:
+        names["camera"] = True
+    if port:
+        names[f"port-{port}"] = True
+    if isinstance(output, str):
+        output = [output]
+    for name in output or []:
+        names[f"file-{name}"] = True
+    for name in reads or []:
+        names.setdefault(f"file-{name}", False)
+
+    exclusive_cores = set(npu_cores or [])
+    for core in NPU_CORES:
+        names[f"npu-{core}"] = core in exclusive_cores
+
+    # 항상 같은 순서로 lock 을 잡아야 deadlock 이 생기지 않습니다.
+    return sorted(names.items())
+
+
+class ResourceLock:
+    """
+    여러 pytest 프로세스(xdist worker) 사이에서 자원을 나눠 쓰기 위한 file lock
+    - exclusive 자원은 LOCK_EX, shared 자원은 LOCK_SH 로 잡습니다.
+    - 프로세스가 죽으면 커널이 lock 을 풀어주므로 stale lock 이 남지 않습니다.
+    """
+
+    def __init__(self, resources, lock_dir=LOCK_DIR):
+        self.resources = resources
+        self.lock_dir = pathlib.Path(lock_dir)
+        self._fds = []
+
+    def acquire(self):
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+        for name, exclusive in self.resources:
+            fd = os.open(self.lock_dir / f"{name}.lock", os.O_RDWR | os.O_CREAT, 0o666)
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            self._fds.append(fd)
+
+    def release(self):
+        while self._fds:
+            fd = self._fds.pop()
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
@@ -0,0 +1,73 @@
+import csv
+import fcntl
+import os
+import pathlib
+from datetime import datetime
+
+
+def session_id():
+    """
+    현재 pytest session 의 ID 를 반환합니다.
+    - xdist worker 들도 같은 결과 폴더를 쓰도록 환경변수(TC_SESSION_ID)로 공유합니다.
+    """
+    return os.environ.setdefault("TC_SESSION_ID", datetime.now().strftime("%Y%m%d-%H%M%S"))
+
+
+class ResultStore:
+    """
+    session 별 측정 결과를 table(csv) 단위로 저장하는 저장소
+    - 저장 위치: <root>/<session_id>/<table>.csv
+    - table 의 column 은 처음 저장된 row 의 key 순서이고, 이후 row 에 새 key 가 있으면 뒤에 추가됩니다. (기존 row 는 빈 값)
+    """
+
+    def __init__(self, root="results", session=None):
+        self.root = pathlib.Path(root)
+        self.session = session or session_id()
+        self.path = self.root / self.session
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def table_path(self, table):
+        return self.path / f"{table}.csv"
+
+    def append(self, table, row):
+        """
+        table 에 row(dict 또는 to_row() 를 가진 객체) 하나를 추가합니다.
+        - 여러 프로세스(xdist)가 동시에 써도 깨지지 않도록 파일 lock 을 사용합니다.
+        - header 에 없는 key 가 있으면 header 를 넓혀서 파일을 다시 씁니다.
+        """
+        if hasattr(row, "to_row"):
+            row = row.to_row()
+
+        with open(self.table_path(table), "a+", newline="", encoding="utf-8") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                reader = csv.reader(f)
+                header = next(reader, None)
+                if header is None:
+                    header = list(row.keys())
+                    csv.writer(f).writerow(header)
+                elif added := [key for key in row if key not in header]:
+                    rows = [r + [""] * (len(header) + len(added) - len(r)) for r in reader]
+                    header += added
+                    f.seek(0)
+                    f.truncate()
+                    writer = csv.writer(f)
+                    writer.writerow(header)
+                    writer.writerows(rows)
+                csv.DictWriter(f, fieldnames=header).writerow(row)
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def read(self, table):
+        """table 의 모든 row 를 column 별 list 로 반환합니다. (예: {'fps': ['10.0', ...]})"""
+        path = self.table_path(table)
+        if not path.exists():
+            return {}
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            columns = {name: [] for name in reader.fieldnames or []}
+            for row in reader:
+                for name in columns:
+                    columns[name].append(row[name])
+        return columns
@@ -1,39 +1,270 @@
-# server.py
-from flask import Flask, Response
+"""
+MJPEG (multipart/x-mixed-replace) stream server
+- 각 stream 은 frame 을 한 번만 읽고(또는 생성하고) 한 번만 JPEG encoding 하여 모든 client 에게 같은 bytes 를 보냅니다.
+- 여러 stream 을 서로 다른 path 로 제공합니다. (기본: /video_feed)
+- source: camera:<index>, file:<path>, synthetic:<width>x<height>[@fps], auto (/dev/video0 가 있으면 camera, 없으면 synthetic)
+
+사용법:
+    python3 -m utils.rtsp_server                                   # /video_feed (auto), port 5000
+    python3 -m utils.rtsp_server --stream /video_feed=file:boat.mp4 --stream /ch1=synthetic:1280x720@30
+"""
+import argparse
+import asyncio
+import json
+import os
+import pathlib
+import signal
+import socket
+import time
+
 import cv2
+import yaml
+
+from utils.synthetic_video import VideoSpec, render_frame
+
+BOUNDARY = b"frame"
+STREAM_HEADER = (b"HTTP/1.0 200 OK\r\n"
+                 b"Cache-Control: no-cache\r\n"
+                 b"Content-Type: multipart/x-mixed-replace; boundary=" + BOUNDARY + b"\r\n\r\n")
+
+
+class CaptureSource:
+    """cv2.VideoCapture (camera / video 파일) source, 파일은 끝나면 처음부터 다시 재생합니다."""
+
+    def __init__(self, target, loop=True):
+        self.target = target
+        self.loop = loop
+        self.capture = cv2.VideoCapture(target)
+        if not self.capture.isOpened():
+            raise RuntimeError(f"video source 를 열 수 없습니다: {target}")
+        self.fps = self.capture.get(cv2.CAP_PROP_FPS) or None
+
+    def read(self):
+        ok, frame = self.capture.read()
+        if not ok and self.loop and isinstance(self.target, str):
+            self.capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, frame = self.capture.read()
+        return frame if ok else None
+
+    def close(self):
+        self.capture.release()
+
+
+class SyntheticSource:
+    """utils.synthetic_video.render_frame 으로 frame 을 생성하는 source (camera 가 없는 환경용)"""
+
+    def __init__(self, width, height, fps=30, seed=0):
+        self.spec = VideoSpec(width, height, fps=fps, seed=seed)
+        self.fps = fps
+        self.index = 0
+
+    def read(self):
+        frame = render_frame(self.spec, self.index)
+        self.index += 1
+        return frame
+
+    def close(self):
+        pass
+
+
+def resolve_source(text):
+    """source 문자열의 (종류, 인자), 'auto' 는 /dev/video0 유무에 따라 camera 또는 synthetic 으로 정합니다."""
+    kind, _, arg = text.partition(":")
+    if kind == "auto":
+        kind, arg = ("camera", "0") if os.path.exists("/dev/video0") else ("synthetic", "1280x720@30")
+    return kind, arg
+
+
+def uses_camera(text):
+    """source 가 실제 camera 를 사용하는지 (camera 자원 lock 이 필요한지)"""
+    return resolve_source(text)[0] == "camera"
+
+
+def uses_local_camera(section, config_path="configs/cfg_app.yaml"):
+    """cfg_app.yaml 의 section 이 local stream server 로 camera 를 송출하는지 (camera lock 이 필요한지)"""
+    cfg = yaml.safe_load(pathlib.Path(config_path).read_text(encoding="utf-8"))[section]
+    return cfg.get('enable_local_rtsp_server') == 'true' and uses_camera(cfg.get('local_stream_source', 'auto'))
+
+
+def open_source(text, seed=0):
+    """'camera:0', 'file:<path>', 'synthetic:1280x720@30', 'auto' 를 source 객체로 변환합니다."""
+    kind, arg = resolve_source(text)
+    if kind == "camera":
+        return CaptureSource(int(arg or 0), loop=False)
+    if kind == "file":
+        return CaptureSource(arg)
+    if kind == "synthetic":
+        size, _, fps = arg.partition("@")
+        width, height = (int(v) for v in size.lower().split("x"))
+        return SyntheticSource(width, height, fps=int(fps or 30), seed=seed)
+    raise ValueError(f"알 수 없는 source 형식입니다: {text}")
 
-app = Flask(__name__)
-
-# USB 웹캠을 초기화합니다. 보통 0번이 기본 웹캠입니다.
-# 여러 개의 카메라가 있다면 1, 2 등으로 바꿀 수 있습니다.
-video_capture = cv2.VideoCapture(0) # /dev/video0 by defult
-
-def generate_frames():
-    """비디오 프레임을 지속적으로 캡처하고 JPEG 형식으로 인코딩하여 반환합니다."""
-    while True:
-        # 카메라에서 프레임 읽기
-        success, frame = video_capture.read()
-        if not success:
-            break
-        else:
-            # 프레임을 JPEG 이미지로 인코딩
-            ret, buffer = cv2.imencode('.jpg', frame)
-            if not ret:
+
+class Stream:
+    """
+    source 하나를 읽어 JPEG multipart chunk 를 만들고 subscriber 들에게 broadcast
+    - 최신 frame 만 유지하므로 느린 client 는 frame 을 건너뛰고, 다른 client 나 capture 를 느리게 만들지 않습니다.
+    """
+
+    def __init__(self, path, source, fps=None, quality=80):
+        self.path = path
+        self.source = source
+        self.interval = 1 / (fps or source.fps or 30)
+        self.quality = quality
+        self.chunk = None        # 마지막 frame 의 multipart chunk (모든 client 가 같은 bytes 를 사용)
+        self.seq = 0
+        self.clients = 0
+        self.encoded = 0
+        self.sent = 0
+        self.finished = False    # source 가 끝나면 True (client 연결 종료)
+        self._cond = asyncio.Condition()
+
+    async def produce(self):
+        """frame 읽기/encoding 은 thread 에서 실행하여 event loop 를 막지 않습니다."""
+        params = [cv2.IMWRITE_JPEG_QUALITY, self.quality]
+        next_time = time.monotonic()
+        while True:
+            frame = await asyncio.to_thread(self.source.read)
+            if frame is None:
+                async with self._cond:
+                    self.finished = True
+                    self._cond.notify_all()
+                return
+            ok, jpeg = await asyncio.to_thread(cv2.imencode, ".jpg", frame, params)
+            if not ok:
                 continue
-            
-            frame_bytes = buffer.tobytes()
-            
-            # 스트리밍을 위한 HTTP multipart 형식으로 프레임 반환
-            # b'--frame\r\n'는 각 프레임의 경계를 나타냅니다.
-            yield (b'--frame\r\n'
-                   b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
-
-@app.route('/video_feed')
-def video_feed():
-    """비디오 스트리밍 경로. generate_frames 함수를 통해 프레임을 전송합니다."""
-    return Response(generate_frames(),
-                    mimetype='multipart/x-mixed-replace; boundary=frame')
-
-if __name__ == '__main__':
-    # host='0.0.0.0'는 서버가 로컬 네트워크의 모든 IP 주소에서 접속을 허용하도록 합니다.
-    app.run(host='0.0.0.0', port=5000)
+            data = jpeg.tobytes()
+            chunk = (b"--" + BOUNDARY + b"\r\nContent-Type: image/jpeg\r\nContent-Length: "
+                     + str(len(data)).encode() + b"\r\n\r\n" + data + b"\r\n")
+            async with self._cond:
+                self.chunk = chunk
+                self.seq += 1
+                self.encoded += 1
+                self._cond.notify_all()
+
+            # file / synthetic source 는 fps 에 맞춰 속도 조절 (camera 는 read 가 frame 주기만큼 block)
+            next_time += self.interval
+            delay = next_time - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                next_time = time.monotonic()
+
+    async def serve(self, writer):
+        """client 한 명에게 새 frame 이 나올 때마다 chunk 를 보냅니다."""
+        self.clients += 1
+        last = 0
+        try:
+            writer.write(STREAM_HEADER)
+            while True:
+                async with self._cond:
+                    await self._cond.wait_for(lambda: self.seq != last or self.finished)
+                    if self.finished:
+                        return
+                    chunk, last = self.chunk, self.seq
+                writer.write(chunk)
+                await writer.drain()
+                self.sent += 1
+        finally:
+            self.clients -= 1
+
+    def stats(self):
+        return {"clients": self.clients, "encoded": self.encoded, "sent": self.sent}
+
+
+class StreamServer:
+    """path 별 Stream 을 제공하는 HTTP server, /stats 에서 stream 별 client/encoding/전송 수를 json 으로 반환"""
+
+    def __init__(self, streams, host="0.0.0.0", port=5000):
+        self.streams = {s.path: s for s in streams}
+        self.host = host
+        self.port = port
+        self._handlers = set()
+
+    async def handle(self, reader, writer):
+        task = asyncio.current_task()
+        self._handlers.add(task)
+        try:
+            request = await reader.readline()
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass  # header 는 사용하지 않음
+            parts = request.decode("latin-1").split()
+            path = parts[1].split("?", 1)[0] if len(parts) > 1 else ""
+
+            if path in self.streams:
+                await self.streams[path].serve(writer)
+            elif path == "/stats":
+                body = json.dumps({p: s.stats() for p, s in self.streams.items()}).encode()
+                writer.write(b"HTTP/1.0 200 OK\r\nContent-Type: application/json\r\n\r\n" + body)
+            else:
+                writer.write(b"HTTP/1.0 404 Not Found\r\n\r\n")
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass  # client 연결 종료
+        finally:
+            writer.close()
+            self._handlers.discard(task)
+
+    async def start(self):
+        """stream producer 들과 server 를 시작합니다. (port 0 이면 할당된 port 로 갱신)"""
+        self._producers = [asyncio.create_task(s.produce()) for s in self.streams.values()]
+        self._server = await asyncio.start_server(self.handle, self.host, self.port, reuse_address=True)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        self._server.close()
+        for task in self._producers:
+            task.cancel()
+        await asyncio.gather(*self._producers, return_exceptions=True)
+        # 연결된 client 들을 정상 종료
+        for stream in self.streams.values():
+            async with stream._cond:
+                stream.finished = True
+                stream._cond.notify_all()
+        if self._handlers:
+            await asyncio.wait(set(self._handlers), timeout=5)
+        for stream in self.streams.values():
+            stream.source.close()
+
+    async def run(self):
+        """SIGINT/SIGTERM 을 받을 때까지 실행합니다."""
+        await self.start()
+        stop = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            asyncio.get_running_loop().add_signal_handler(sig, stop.set)
+        print(f"stream server: http://{self.host}:{self.port} {list(self.streams)}", flush=True)
+        await stop.wait()
+        await self.close()
+
+
+def wait_until_ready(host="127.0.0.1", port=5000, timeout=10):
+    """server 가 연결을 받을 때까지 기다립니다. 준비되면 True"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return True
+        except OSError:
+            time.sleep(0.1)
+    return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="MJPEG stream server (encode once, broadcast to all clients)")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--stream", action="append", metavar="PATH=SOURCE",
+                        help="예: /video_feed=camera:0, /ch1=file:boat.mp4, /ch2=synthetic:1280x720@30 (반복 가능)")
+    parser.add_argument("--fps", type=float, help="file/synthetic source 의 송출 fps (기본: source fps)")
+    parser.add_argument("--quality", type=int, default=80, help="JPEG quality")
+    args = parser.parse_args(argv)
+
+    streams = []
+    for i, item in enumerate(args.stream or ["/video_feed=auto"]):
+        path, _, source = item.partition("=")
+        streams.append(Stream(path, open_source(source, seed=i), fps=args.fps, quality=args.quality))
+    asyncio.run(StreamServer(streams, args.host, args.port).run())
+
+
+if __name__ == "__main__":
+    main()
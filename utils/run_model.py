@@ -0,0 +1,58 @@
+import re
+import pathlib
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Optional
+
+
+# run_model 출력에서 성능 지표를 찾기 위한 정규식
+RE_MODEL_FILE = re.compile(r"modelFile:\s*(\S+)")
+RE_MODE = re.compile(r"Run model target mode\s*:\s*(.+)")
+RE_FPS = re.compile(r"FPS\s*:\s*([\d.]+)")
+# 기본 출력은 'NPU Processing Time : x ms', -v 출력은 'NPU Processing Time Average : x ms'
+RE_NPU_TIME = re.compile(r"NPU Processing Time(?: Average)?\s*:\s*([\d.]+)\s*ms")
+RE_LATENCY = re.compile(r"Latency Average\s*:\s*([\d.]+)\s*ms")
+
+
+@dataclass
+class RunModelResult:
+    """run_model 한 번 실행의 성능 측정 결과"""
+    model: str
+    options: str
+    mode: Optional[str] = None
+    fps: Optional[float] = None
+    latency_ms: Optional[float] = None
+    npu_time_ms: Optional[float] = None
+    timestamp: str = ""
+
+    def to_row(self):
+        """ResultStore 에 저장하기 위한 dict 형태로 변환합니다."""
+        return asdict(self)
+
+
+def _search_float(pattern, text):
+    m = pattern.search(text)
+    return float(m.group(1)) if m else None
+
+
+def parse_run_model_output(output, options="", model=None):
+    """
+    run_model 의 stdout 을 파싱하여 RunModelResult 로 반환합니다.
+    - model 을 지정하지 않으면 출력의 'modelFile:' 값에서 모델 이름을 가져옵니다.
+    - 출력에 없는 지표는 None 으로 남겨둡니다.
+    """
+    if model is None:
+        m = RE_MODEL_FILE.search(output)
+        model = pathlib.Path(m.group(1)).stem if m else ""
+
+    m_mode = RE_MODE.search(output)
+
+    return RunModelResult(
+        model=model,
+        options=options,
+        mode=m_mode.group(1).strip() if m_mode else None,
+        fps=_search_float(RE_FPS, output),
+        latency_ms=_search_float(RE_LATENCY, output),
+        npu_time_ms=_search_float(RE_NPU_TIME, output),
+        timestamp=datetime.now().isoformat(timespec="seconds"),
+    )
@@ -0,0 +1,119 @@
+import json
+import os
+import pathlib
+import re
+import shlex
+import statistics
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+# 첫 결과 출력 (FPS, classification/detection 결과, 결과 파일 저장)
+RESULT_PATTERN = re.compile(r"fps\s*:\s*[\d.]+|Top1 Result|conf, classID|save file|FPS\s*:", re.I)
+
+CACHE_MODES = ("warm", "cold")
+
+
+def model_files(command, cwd=None):
+    """
+    command 가 읽는 .dxnn 파일 목록
+    - 인자로 직접 지정된 .dxnn 과, 인자로 지정된 .json config 안의 .dxnn 경로를 찾습니다.
+    - 상대 경로는 cwd 기준, 존재하는 파일만 반환합니다.
+    """
+    base = pathlib.Path(cwd or ".")
+    found = []
+
+    def add(value):
+        path = base / value
+        if path.is_file() and path not in found:
+            found.append(path)
+
+    def walk(node):
+        if isinstance(node, dict):
+            node = list(node.values())
+        if isinstance(node, list):
+            for item in node:
+                walk(item)
+        elif isinstance(node, str) and node.endswith(".dxnn"):
+            add(node)
+
+    for arg in shlex.split(command):
+        if arg.endswith(".dxnn"):
+            add(arg)
+        elif arg.endswith(".json") and (base / arg).is_file():
+            try:
+                walk(json.loads((base / arg).read_text(encoding="utf-8")))
+            except ValueError:
+                pass
+    return found
+
+
+def drop_page_cache(paths):
+    """
+    파일들을 page cache 에서 내립니다. (posix_fadvise DONTNEED, root 권한 불필요)
+    - 다른 process 가 mmap 하고 있거나 dirty 인 page 는 남을 수 있습니다.
+    """
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
+def warm_page_cache(paths, chunk=1 << 20):
+    """파일 전체를 읽어서 page cache 에 올립니다."""
+    for path in paths:
+        with open(path, "rb", buffering=0) as f:
+            while f.read(chunk):
+                pass
+
+
+@dataclass
+class StartupTrial:
+    """실행 한 번의 startup 시간 (process 생성부터 초)"""
+    first_output: Optional[float]
+    first_result: Optional[float]
+    failure: str = ""
+
+
+@dataclass
+class StartupResult:
+    """command 하나의 cache 상태별 startup 측정 결과 (median)"""
+    name: str
+    command: str
+    cache: str
+    model_bytes: int
+    trials: list = field(default_factory=list)   # StartupTrial
+
+    @staticmethod
+    def _median(values):
+        values = [v for v in values if v is not None]
+        return round(statistics.median(values), 3) if values else None
+
+    @property
+    def first_output(self):
+        return self._median(t.first_output for t in self.trials)
+
+    @property
+    def first_result(self):
+        return self._median(t.first_result for t in self.trials)
+
+    @property
+    def failures(self):
+        return [t.failure for t in self.trials if t.failure]
+
+    def to_row(self):
+        results = [t.first_result for t in self.trials if t.first_result is not None]
+        return {
+            "name": self.name,
+            "cache": self.cache,
+            "trials": len(self.trials),
+            "first_output_sec": self.first_output,
+            "first_result_sec": self.first_result,
+            "first_result_min_sec": round(min(results), 3) if results else None,
+            "first_result_max_sec": round(max(results), 3) if results else None,
+            "model_mb": round(self.model_bytes / 2**20, 1),
+            "failures": len(self.failures),
+            "command": self.command,
+        }
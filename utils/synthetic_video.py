@@ -0,0 +1,182 @@
+import hashlib
+import json
+import os
+import pathlib
+import shutil
+import subprocess
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+import cv2
+import numpy as np
+
+
+# 생성 방식(render_frame)이 바뀌면 올려서 기존 cache 를 무효화합니다.
+GENERATOR_VERSION = 1
+
+RESOLUTIONS = {
+    "720p": (1280, 720),
+    "1080p": (1920, 1080),
+    "4k": (3840, 2160),
+}
+
+# codec 이름 -> (OpenCV fourcc, ffmpeg encoder, 확장자)
+CODECS = {
+    "h264": ("avc1", "libx264", ".mp4"),
+    "h265": ("hev1", "libx265", ".mp4"),
+    "mpeg4": ("mp4v", "mpeg4", ".mp4"),
+    "mjpeg": ("MJPG", "mjpeg", ".avi"),
+}
+
+
+@dataclass(frozen=True)
+class VideoSpec:
+    """생성할 video 의 parameter (같은 parameter 는 같은 cache 파일을 사용)"""
+    width: int
+    height: int
+    fps: int = 30
+    duration_sec: float = 10
+    codec: str = "h264"
+    bitrate_kbps: Optional[int] = None
+    seed: int = 0
+
+    @classmethod
+    def from_resolution(cls, resolution, **kwargs):
+        """'1080p' 처럼 RESOLUTIONS 의 이름으로 만듭니다."""
+        width, height = RESOLUTIONS[resolution]
+        return cls(width, height, **kwargs)
+
+    @property
+    def frames(self):
+        return max(1, round(self.fps * self.duration_sec))
+
+    def key(self, encoder):
+        """parameter, encoder ('ffmpeg' / 'opencv'), 생성기 버전, OpenCV 버전의 SHA-256 (cache 파일 이름)"""
+        parts = {**asdict(self), "encoder": encoder, "generator": GENERATOR_VERSION, "opencv": cv2.__version__}
+        return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+    def file_name(self, encoder):
+        _, _, ext = CODECS[self.codec]
+        rate = f"_{self.bitrate_kbps}k" if self.bitrate_kbps else ""
+        return (f"synthetic_{self.width}x{self.height}_{self.fps}fps_{self.codec}{rate}_{encoder}_"
+                f"{self.key(encoder)[:12]}{ext}")
+
+
+def render_frame(spec, index):
+    """
+    index 번째 frame 을 생성합니다. (같은 spec/index 는 항상 같은 frame)
+    - gradient 배경 위에 seed 로 정한 도형들이 일정한 속도로 움직여서 decoder 가 실제 motion 을 처리하도록 합니다.
+    """
+    w, h = spec.width, spec.height
+    x = np.linspace(0, 255, w, dtype=np.float32)
+    y = np.linspace(0, 255, h, dtype=np.float32)[:, None]
+    frame = np.empty((h, w, 3), np.uint8)
+    frame[..., 0] = (x + index * 2) % 256
+    frame[..., 1] = (y + index) % 256
+    frame[..., 2] = 128
+
+    rng = np.random.RandomState(spec.seed)
+    scale = min(w, h)
+    for _ in range(12):
+        cx, cy = rng.randint(0, w), rng.randint(0, h)
+        vx, vy = rng.randint(-8, 9), rng.randint(-8, 9)
+        size = int(scale * rng.uniform(0.05, 0.2))
+        color = tuple(int(c) for c in rng.randint(0, 256, 3))
+        px, py = (cx + vx * index) % w, (cy + vy * index) % h
+        if rng.randint(2):
+            cv2.rectangle(frame, (px, py), (px + size, py + size // 2), color, -1)
+        else:
+            cv2.circle(frame, (px, py), size // 2, color, -1)
+
+    cv2.putText(frame, f"{index:06d}", (scale // 40, scale // 10), cv2.FONT_HERSHEY_SIMPLEX,
+                scale / 400, (255, 255, 255), max(1, scale // 200))
+    return frame
+
+
+def _write_ffmpeg(spec, path, ffmpeg):
+    """ffmpeg 로 raw frame 을 encoding 합니다. (bitrate 지정 가능)"""
+    _, encoder, _ = CODECS[spec.codec]
+    command = [ffmpeg, "-v", "error", "-y", "-f", "rawvideo", "-pix_fmt", "bgr24",
+               "-s", f"{spec.width}x{spec.height}", "-r", str(spec.fps), "-i", "-",
+               "-c:v", encoder]
+    if spec.codec != "mjpeg":
+        command += ["-pix_fmt", "yuv420p"]
+    if spec.bitrate_kbps:
+        command += ["-b:v", f"{spec.bitrate_kbps}k"]
+    with subprocess.Popen(command + [str(path)], stdin=subprocess.PIPE, stderr=subprocess.PIPE) as proc:
+        try:
+            for i in range(spec.frames):
+                proc.stdin.write(render_frame(spec, i).tobytes())
+            proc.stdin.close()
+        except BrokenPipeError:
+            # ffmpeg 가 먼저 종료 (예: encoder 가 build 되지 않음), 원인은 아래 stderr / returncode 로 보고
+            pass
+        err = proc.stderr.read().decode(errors="replace")
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg encoding 실패 (rc={proc.returncode}): {err}")
+
+
+def _write_opencv(spec, path):
+    """OpenCV VideoWriter 로 encoding 합니다. (bitrate 는 지정할 수 없음)"""
+    fourcc, _, _ = CODECS[spec.codec]
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*fourcc), spec.fps, (spec.width, spec.height))
+    if not writer.isOpened():
+        raise RuntimeError(f"OpenCV 로 '{spec.codec}' ({fourcc}) encoding 을 할 수 없습니다. ffmpeg 를 설치해주세요.")
+    try:
+        for i in range(spec.frames):
+            writer.write(render_frame(spec, i))
+    finally:
+        writer.release()
+
+
+class VideoCache:
+    """
+    VideoSpec 별로 생성한 video 를 저장하는 cache
+    - 저장 : <root>/<file_name> + <root>/<file_name>.json (spec, encoder, 실제 bitrate)
+    - ffmpeg 가 있으면 ffmpeg 로 (bitrate 적용), 없으면 OpenCV VideoWriter 로 encoding 합니다.
+    - encoder 에 따라 결과가 다르므로 encoder 도 cache key 에 포함합니다.
+    """
+
+    def __init__(self, root, ffmpeg=None):
+        self.root = pathlib.Path(root).expanduser()
+        self.ffmpeg = ffmpeg if ffmpeg is not None else shutil.which("ffmpeg")
+
+    @property
+    def encoder(self):
+        return "ffmpeg" if self.ffmpeg else "opencv"
+
+    def path(self, spec):
+        return self.root / spec.file_name(self.encoder)
+
+    def meta(self, spec):
+        """저장된 video 의 meta 정보, 없으면 None"""
+        meta_path = self.root / f"{spec.file_name(self.encoder)}.json"
+        if not meta_path.exists():
+            return None
+        return json.loads(meta_path.read_text(encoding="utf-8"))
+
+    def get(self, spec):
+        """spec 의 video 경로를 반환합니다. cache 에 없으면 생성합니다."""
+        path = self.path(spec)
+        if path.exists() and self.meta(spec) is not None:
+            return path
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{os.getpid()}.{path.name}")
+        try:
+            if self.ffmpeg:
+                _write_ffmpeg(spec, tmp, self.ffmpeg)
+            else:
+                _write_opencv(spec, tmp)
+            size = tmp.stat().st_size
+            meta = {
+                **asdict(spec),
+                "encoder": self.encoder,
+                "bytes": size,
+                "actual_bitrate_kbps": round(size * 8 / 1000 / spec.duration_sec),
+            }
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+        (self.root / f"{spec.file_name(self.encoder)}.json").write_text(json.dumps(meta, indent=1), encoding="utf-8")
+        return path
@@ -0,0 +1,261 @@
+import abc
+import csv
+import os
+import pathlib
+import re
+import select
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field, fields, asdict
+
+
+@dataclass
+class NpuReading:
+    """NPU core 하나의 voltage / clock / temperature 측정값"""
+    timestamp: float
+    device: int
+    npu: int
+    voltage_mv: int
+    clock_mhz: int
+    temp_c: int
+
+
+@dataclass
+class MonitorBlock:
+    """'dxrt-cli -m' 출력에서 '===' 로 구분되는 한 주기의 출력"""
+    readings: list = field(default_factory=list)
+    dvfs: bool = False
+
+
+class TelemetryBackend(abc.ABC):
+    """
+    device telemetry backend 의 공통 interface
+    - read(): 현재 NPU 별 측정값(NpuReading) list 를 반환
+    - poll(): 지정한 주기(hz)로 read() 를 반복
+    - start() / stop(): benchmark 와 같이 background thread 에서 poll 하여 readings 에 모음
+    """
+
+    readings = ()
+    _thread = None
+
+    @abc.abstractmethod
+    def read(self):
+        """현재 NPU 별 NpuReading list"""
+
+    def poll(self, hz, duration):
+        """duration 초 동안 hz 주기로 read() 한 결과를 모두 반환합니다."""
+        period = 1.0 / hz
+        readings = []
+        deadline = time.monotonic() + duration
+        next_time = time.monotonic()
+        while next_time < deadline:
+            readings += self.read()
+            next_time += period
+            time.sleep(max(next_time - time.monotonic(), 0))
+        return readings
+
+    def start(self, hz):
+        """background thread 에서 hz 주기로 read() 한 결과를 readings 에 계속 추가합니다."""
+        self.readings = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(1.0 / hz,), daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self, period):
+        next_time = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                self.readings += self.read()
+            except (TimeoutError, EOFError, OSError, ValueError):
+                break
+            next_time += period
+            self._stop.wait(max(next_time - time.monotonic(), 0))
+
+    def stop(self):
+        if self._thread:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def since(self, timestamp):
+        """timestamp (time.time) 이후에 background 로 읽은 NpuReading 들"""
+        return [r for r in self.readings if r.timestamp >= timestamp]
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+        self.close()
+
+
+def write_readings(readings, path):
+    """NpuReading 들을 csv time series 로 저장합니다."""
+    path = pathlib.Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=[c.name for c in fields(NpuReading)])
+        writer.writeheader()
+        writer.writerows(asdict(r) for r in readings)
+    return path
+
+
+class MonitorParser:
+    """
+    'dxrt-cli -m' 의 byte 출력을 incremental 하게 파싱합니다.
+    - pipe 에서 읽은 byte 를 하나의 bytearray 에 이어 붙이고, decode / line split 없이
+      정규식을 buffer 위에서 직접(pos/endpos) 실행합니다.
+    - 첫 line 은 header (DXRT 버전)로 따로 보관합니다.
+    """
+
+    SEPARATOR = b"==="
+    RE_ITEM = re.compile(
+        rb"Device\s*(\d+)|NPU (\d+): voltage (\d+) mV, clock (\d+) MHz, temperature (\d+)'C"
+    )
+
+    def __init__(self):
+        self.header = None
+        self._buf = bytearray()
+        self._scan = 0  # SEPARATOR 를 찾기 시작할 위치
+
+    def feed(self, data, timestamp=None):
+        """byte chunk 를 입력받아 완성된 MonitorBlock list 를 반환합니다."""
+        timestamp = time.time() if timestamp is None else timestamp
+        buf = self._buf
+        buf += data
+
+        if self.header is None:
+            end = buf.find(b"\n")
+            if end < 0:
+                return []
+            self.header = buf[:end].decode(errors="replace").strip()
+            del buf[:end + 1]
+
+        blocks = []
+        start = 0
+        while True:
+            sep = buf.find(self.SEPARATOR, max(self._scan, start))
+            if sep < 0:
+                # 다음 chunk 와 이어질 수 있는 끝부분만 다시 검사
+                self._scan = max(len(buf) - len(self.SEPARATOR) + 1, start)
+                break
+            line_end = buf.find(b"\n", sep)
+            if line_end < 0:
+                # separator line('=====...')이 아직 끝나지 않음, 다음 chunk 에서 이어서 처리
+                self._scan = sep
+                break
+            blocks.append(self._parse(buf, start, sep, timestamp))
+            start = line_end + 1
+        del buf[:start]
+        self._scan -= start
+        return blocks
+
+    def _parse(self, buf, start, end, timestamp):
+        block = MonitorBlock(dvfs=buf.find(b"dvfs", start, end) >= 0)
+        device = 0
+        for m in self.RE_ITEM.finditer(buf, start, end):
+            if m.group(1) is not None:
+                device = int(m.group(1))
+                continue
+            npu, voltage, clock, temp = map(int, m.group(2, 3, 4, 5))
+            block.readings.append(NpuReading(timestamp, device, npu, voltage, clock, temp))
+        return block
+
+
+class DxrtCliBackend(TelemetryBackend):
+    """
+    'dxrt-cli -m <interval>' 를 한 번만 실행해 두고, 주기적으로 출력되는 block 을 파싱합니다.
+    - dxrt-cli 의 출력 주기(interval 초)보다 빠르게 sampling 할 수 없습니다.
+    """
+
+    def __init__(self, executable="dxrt-cli", interval=1, flag="-m"):
+        self.parser = MonitorParser()
+        self._blocks = []
+        self._chunk = bytearray(65536)
+        self._proc = subprocess.Popen([executable, flag, str(interval)],
+                                      stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=0)
+
+    @property
+    def header(self):
+        return self.parser.header
+
+    def read_block(self, timeout=10):
+        """다음 MonitorBlock 을 반환합니다. timeout 초 안에 나오지 않으면 TimeoutError"""
+        fd = self._proc.stdout.fileno()
+        deadline = time.monotonic() + timeout
+        while not self._blocks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                raise TimeoutError(f"dxrt-cli 출력이 {timeout}초 동안 없습니다.")
+            n = os.readv(fd, [self._chunk])
+            if n == 0:
+                raise EOFError(f"dxrt-cli 가 종료되었습니다. rc={self._proc.wait()}")
+            self._blocks += self.parser.feed(memoryview(self._chunk)[:n])
+        return self._blocks.pop(0)
+
+    def read(self):
+        return self.read_block().readings
+
+    def close(self):
+        if self._proc.poll() is None:
+            self._proc.terminate()
+            try:
+                self._proc.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+                self._proc.wait()
+        self._proc.stdout.close()
+
+
+class FileBackend(TelemetryBackend):
+    """
+    sysfs/procfs 처럼 값 하나가 파일 하나인 디렉토리에서 측정값을 읽습니다. (process 실행 없음)
+    디렉토리 구조:
+        <root>/<device>/npu<n>/voltage      (mV)
+        <root>/<device>/npu<n>/clock        (MHz)
+        <root>/<device>/npu<n>/temperature  ('C)
+    - 파일은 처음에 한 번만 열어두고 pread 로 다시 읽으므로 100 Hz 이상 sampling 할 수 있습니다.
+    """
+
+    METRICS = ("voltage", "clock", "temperature")
+
+    def __init__(self, root):
+        self.root = pathlib.Path(root)
+        self._fds = []  # (device, npu, [fd, fd, fd])
+        for npu_dir in sorted(self.root.glob("*/npu*")):
+            device, npu = npu_dir.parent.name, npu_dir.name[3:]
+            if not (device.isdigit() and npu.isdigit()):
+                continue
+            fds = [os.open(npu_dir / name, os.O_RDONLY) for name in self.METRICS]
+            self._fds.append((int(device), int(npu), fds))
+        if not self._fds:
+            raise FileNotFoundError(f"telemetry 파일을 찾을 수 없습니다: {self.root}/<device>/npu<n>")
+
+    def read(self):
+        now = time.time()
+        return [
+            NpuReading(now, device, npu, *(int(os.pread(fd, 32, 0)) for fd in fds))
+            for device, npu, fds in self._fds
+        ]
+
+    def close(self):
+        for _, _, fds in self._fds:
+            for fd in fds:
+                os.close(fd)
+        self._fds = []
+
+
+def open_backend(cfg, executable="dxrt-cli"):
+    """
+    cfg_rt.yaml 의 telemetry 설정으로 backend 를 생성합니다.
+    - backend: dxrt-cli | file
+    - root: file backend 가 읽을 디렉토리
+    """
+    if cfg.get("backend", "dxrt-cli") == "file":
+        return FileBackend(cfg["root"])
+    return DxrtCliBackend(executable, interval=cfg.get("interval", 1))
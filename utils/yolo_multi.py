@@ -0,0 +1,116 @@
+import json
+import pathlib
+import re
+import statistics
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+# utils/yolo_multi_*_demo.json 과 같은 display 설정
+DEFAULT_DISPLAY = {
+    "display_label": "output",
+    "capture_period": 30,
+    "output_width": 1920,
+    "output_height": 1080,
+    "show_fps": True,
+}
+
+# show_fps 출력 (예: '[CH 3] fps : 19.8', 'channel 3 fps: 19.8', 'Total FPS : 612.4')
+# 주의: 실제 yolo_multi 출력으로 확인하지 않은 추정 형식입니다. 실제 출력을 tests/utils/data 에 기록하면 그에 맞춰 수정해주세요.
+RE_CHANNEL_FPS = re.compile(r"\b(?:ch|channel)\s*\[?\s*(\d+)\s*\]?\s*[,:]?\s*fps\s*[:=]\s*([\d.]+)", re.I)
+RE_TOTAL_FPS = re.compile(r"\b(?:total|overall|aggregate)\s*fps\s*[:=]\s*([\d.]+)", re.I)
+
+
+def video_sources(channels, videos, fixed=(), source_fps=20):
+    """
+    yolo_multi 의 video_sources 목록을 만듭니다.
+    - fixed 의 source (예: ['/dev/video0', 'camera'], ['http://...', 'rtsp']) 가 앞 channel 을 차지하고
+      나머지는 videos 를 순서대로 반복하여 'offline' source 로 채웁니다.
+    """
+    fixed = [list(s) for s in fixed][:channels]
+    if len(fixed) < channels and not videos:
+        raise ValueError("channel 을 채울 video 가 없습니다.")
+    offline = [[videos[i % len(videos)], "offline", source_fps] for i in range(channels - len(fixed))]
+    return fixed + offline
+
+
+def make_config(channels, *, videos, model_path, model_name, fixed=(), source_fps=20, display=None):
+    """channels 개 channel 의 yolo_multi JSON config (dict) 를 만듭니다."""
+    return {
+        "usage": "multi",
+        "model_path": model_path,
+        "model_name": model_name,
+        "video_sources": video_sources(channels, videos, fixed, source_fps),
+        "display_config": {**DEFAULT_DISPLAY, **(display or {})},
+    }
+
+
+def write_config(config, path):
+    path = pathlib.Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(config, indent=4), encoding="utf-8")
+    return path
+
+
+@dataclass
+class MultiFps:
+    """yolo_multi 실행 한 번의 FPS (channel 별 값은 출력된 값들의 median)"""
+    channels: int
+    per_channel: dict = field(default_factory=dict)   # {channel: fps}
+    total: Optional[float] = None                      # 출력된 전체 FPS, 없으면 channel 합
+
+    @property
+    def mean_channel_fps(self):
+        return statistics.fmean(self.per_channel.values()) if self.per_channel else None
+
+    @property
+    def min_channel_fps(self):
+        return min(self.per_channel.values()) if self.per_channel else None
+
+    def to_row(self):
+        return {
+            "channels": self.channels,
+            "total_fps": round(self.total, 2) if self.total is not None else None,
+            "mean_channel_fps": round(self.mean_channel_fps, 2) if self.per_channel else None,
+            "min_channel_fps": round(self.min_channel_fps, 2) if self.per_channel else None,
+            "reported_channels": len(self.per_channel),
+        }
+
+
+def parse_multi_fps(output, channels, skip=1):
+    """
+    show_fps 출력에서 channel 별 / 전체 FPS 를 읽습니다.
+    - 처음 skip 개의 값은 warm-up 으로 보고 버립니다. (값이 그것뿐이면 사용)
+    """
+    samples = {}
+    for ch, fps in RE_CHANNEL_FPS.findall(output):
+        samples.setdefault(int(ch), []).append(float(fps))
+    per_channel = {ch: statistics.median(v[skip:] or v) for ch, v in sorted(samples.items())}
+
+    totals = [float(v) for v in RE_TOTAL_FPS.findall(output)]
+    if totals:
+        total = statistics.median(totals[skip:] or totals)
+    else:
+        total = sum(per_channel.values()) if per_channel else None
+    return MultiFps(channels, per_channel, total)
+
+
+def find_knee(results, source_fps, tolerance=0.05):
+    """
+    channel 수를 늘려가며 측정한 MultiFps list 에서 channel 별 FPS 가 source fps 를 따라가지 못하기 시작하는 지점을 찾습니다.
+    - 반환: (source fps 를 유지한 최대 channel 수, 처음으로 떨어진 channel 수), 없으면 None
+    - 가장 느린 channel 이 기준: min_channel_fps < source_fps * (1 - tolerance)
+    """
+    limit = source_fps * (1 - tolerance)
+    sustained, knee = None, None
+    for result in sorted(results, key=lambda r: r.channels):
+        fps = result.min_channel_fps
+        if fps is None and result.total is not None:
+            fps = result.total / result.channels
+        if fps is None:
+            continue
+        if fps < limit:
+            knee = result.channels
+            break
+        sustained = result.channels
+    return sustained, knee